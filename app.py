@@ -14,7 +14,7 @@ Then open browser at http://127.0.0.1:7860
 """
 
 import gradio as gr
-from pipeline import translate_singlish
+from pipeline import translate_singlish, warmup
 from evaluation.module3 import post_process
 
 
@@ -303,6 +303,13 @@ if __name__ == "__main__":
         print("\n⚠️ Warning: Some required files are missing!")
         print("Make sure you have built the FST: cd transliteration && python build_fst.py")
     
+    # Load the transliteration engine now so the first request is not slow
+    try:
+        warmup()
+        print("✅ Transliteration engine loaded")
+    except Exception as e:
+        print(f"⚠️ Warning: Could not preload transliteration engine: {e}")
+    
     print("\n" + "=" * 60)
     print("🌐 Starting Gradio server...")
     print("=" * 60)
@@ -0,0 +1,64 @@
+"""
+Benchmark: Per-Sentence vs Batch Transliteration
+
+Builds a synthetic bulk job by sampling sentences from data/corpus.json and
+times a plain transliterate() loop against a single transliterate_batch()
+call. The token cache is cleared before each run so neither side benefits
+from the other's warm cache.
+
+Usage:
+    python benchmarks/bench_batch.py
+    python benchmarks/bench_batch.py --sentences 100000 --no-spell-check
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'transliteration'))
+
+from module1 import transliterate, transliterate_batch, clear_cache, DEFAULT_ENGINE, ENGINES
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark batch transliteration')
+    parser.add_argument('--sentences', type=int, default=10000,
+                        help='Number of sentences in the synthetic job (default: 10000)')
+    parser.add_argument('--engine', choices=ENGINES, default=DEFAULT_ENGINE)
+    parser.add_argument('--no-spell-check', action='store_true',
+                        help='Disable fuzzy spell correction')
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, 'data', 'corpus.json'), 'r', encoding='utf-8') as f:
+        corpus = [item['sinlish'] for item in json.load(f)]
+
+    rng = random.Random(0)
+    sentences = [rng.choice(corpus) for _ in range(args.sentences)]
+    spell_check = not args.no_spell_check
+
+    clear_cache()
+    start = time.perf_counter()
+    expected = [transliterate(s, spell_check=spell_check, engine=args.engine) for s in sentences]
+    loop_time = time.perf_counter() - start
+
+    clear_cache()
+    start = time.perf_counter()
+    actual = transliterate_batch(sentences, spell_check=spell_check, engine=args.engine)
+    batch_time = time.perf_counter() - start
+
+    assert actual == expected, "Batch output differs from per-sentence output"
+
+    print(f"Engine: {args.engine}, sentences: {len(sentences)}, spell check: {spell_check}")
+    print(f"{'Mode':<14} {'Total (s)':>10} {'Sentences/s':>14}")
+    print("-" * 40)
+    print(f"{'per-sentence':<14} {loop_time:>10.3f} {len(sentences) / loop_time:>14.0f}")
+    print(f"{'batch':<14} {batch_time:>10.3f} {len(sentences) / batch_time:>14.0f}")
+    print(f"\nSpeedup: {loop_time / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
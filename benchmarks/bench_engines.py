@@ -0,0 +1,60 @@
+"""
+Micro-benchmark: FST vs Trie Transliteration Engines
+
+Times module1.transliterate() with each available engine over the sentences
+in data/corpus.json. Spell checking and the token cache are disabled so only
+the engine (plus the shared pre/postprocessing) is measured; with the cache
+every pass after the first would only time cache hits.
+
+Usage:
+    python benchmarks/bench_engines.py
+    python benchmarks/bench_engines.py --repeat 50
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'transliteration'))
+
+import module1
+from module1 import transliterate, configure_cache, DEFAULT_CACHE_SIZE
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the FST and trie engines')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='Number of passes over the corpus (default: 20)')
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, 'data', 'corpus.json'), 'r', encoding='utf-8') as f:
+        sentences = [item['sinlish'] for item in json.load(f)]
+
+    engines = ["fst", "trie"] if module1.PYNINI_AVAILABLE else ["trie"]
+    if not module1.PYNINI_AVAILABLE:
+        print("pynini not installed: only the trie engine is benchmarked\n")
+
+    print(f"{'Engine':<8} {'Total (s)':>10} {'Per sentence (µs)':>20}")
+    print("-" * 40)
+
+    configure_cache(0)
+    try:
+        for engine in engines:
+            # Warm up (builds the trie / touches the FST once)
+            transliterate(sentences[0], spell_check=False, engine=engine)
+
+            def run():
+                for sentence in sentences:
+                    transliterate(sentence, spell_check=False, engine=engine)
+
+            total = min(timeit.repeat(run, number=args.repeat, repeat=3))
+            per_sentence = total / (args.repeat * len(sentences)) * 1e6
+            print(f"{engine:<8} {total:>10.4f} {per_sentence:>20.1f}")
+    finally:
+        configure_cache(DEFAULT_CACHE_SIZE)
+
+if __name__ == "__main__":
+    main()
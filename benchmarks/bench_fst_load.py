@@ -0,0 +1,108 @@
+"""
+Benchmark: Vector vs Const FST Load Time and Per-Worker Memory
+
+Compares transliterate.fst (mutable VectorFst) against transliterate.const.fst
+(arc-sorted ConstFst, written by `python build_fst.py --const`):
+
+1. Load time: best of several reads of each file.
+2. Memory per worker: the parent loads the FST, forks worker processes that
+   each transliterate the corpus, and every worker reports its RSS, PSS and
+   private dirty memory from /proc/self/smaps_rollup (Linux only). Memory that
+   stays shared with the parent shows up in RSS but not in private dirty.
+
+Usage:
+    python benchmarks/bench_fst_load.py
+    python benchmarks/bench_fst_load.py --workers 16
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'transliteration'))
+
+import pynini
+import pywrapfst
+from build_fst import FST_PATH, CONST_FST_PATH
+from preprocess import preprocess
+
+# Set in the parent before forking so workers inherit it
+_fst = None
+_sentences = []
+
+
+def read_vector():
+    return pynini.Fst.read(FST_PATH)
+
+
+def read_const():
+    return pywrapfst.Fst.read(CONST_FST_PATH)
+
+
+def memory_kb():
+    """Return RSS, PSS and private dirty memory (kB) of this process."""
+    fields = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ('Rss:', 'Pss:', 'Private_Dirty:'):
+                fields[parts[0].rstrip(':')] = int(parts[1])
+    return fields
+
+
+def worker(_):
+    for sentence in _sentences:
+        lattice = pywrapfst.compose(pynini.accep(sentence), _fst)
+        pynini.shortestpath(pynini.Fst.from_pywrapfst(lattice)).string()
+    return memory_kb()
+
+
+def main():
+    global _fst, _sentences
+
+    parser = argparse.ArgumentParser(description='Benchmark vector vs const FST loading')
+    parser.add_argument('--workers', type=int, default=8,
+                        help='Number of forked workers (default: 8)')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='Number of timed reads per variant (default: 20)')
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, 'data', 'corpus.json'), 'r', encoding='utf-8') as f:
+        _sentences = [preprocess(item['sinlish'])[0] for item in json.load(f)]
+
+    variants = [("vector", FST_PATH, read_vector), ("const", CONST_FST_PATH, read_const)]
+    context = multiprocessing.get_context('fork')
+
+    print(f"{'Variant':<8} {'Size (kB)':>10} {'Load (ms)':>10} "
+          f"{'RSS (kB)':>10} {'PSS (kB)':>10} {'Private (kB)':>13}")
+    print("-" * 66)
+
+    for name, path, read in variants:
+        if not os.path.exists(path):
+            print(f"{name:<8} not found ({os.path.basename(path)}); "
+                  f"run 'python build_fst.py --const'")
+            continue
+
+        load_times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            read()
+            load_times.append(time.perf_counter() - start)
+
+        _fst = read()
+        with context.Pool(args.workers) as pool:
+            stats = pool.map(worker, range(args.workers))
+
+        def mean(key):
+            return sum(s[key] for s in stats) / len(stats)
+
+        print(f"{name:<8} {os.path.getsize(path) / 1024:>10.0f} {min(load_times) * 1000:>10.2f} "
+              f"{mean('Rss'):>10.0f} {mean('Pss'):>10.0f} {mean('Private_Dirty'):>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark: FuzzyMatcher Candidate Indexes at Growing Vocabulary Sizes
+
+Builds synthetic Singlish-like vocabularies (random syllable sequences, plus
+the real singlish_rules.json words) of several sizes, and times
+FuzzyMatcher.find_correction() on misspelled vocabulary words with each
+candidate index, and the "length" scan once more with the NumPy scorer
+("numpy" row, if NumPy is installed). Every row is checked against the
+pure-Python "length" scan for identical corrections. With --memory the matcher is built a second time
+under tracemalloc to report the memory held by the index.
+
+Usage:
+    python benchmarks/bench_fuzzy_index.py
+    python benchmarks/bench_fuzzy_index.py --sizes 300 10000 100000 --queries 50
+    python benchmarks/bench_fuzzy_index.py --index length symspell --memory
+    python benchmarks/bench_fuzzy_index.py --index length qgram --qgram-size 3
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'transliteration'))
+
+from fuzzy_matcher import FuzzyMatcher, INDEX_TYPES, load_vocabulary
+from fuzzy_vector import NUMPY_AVAILABLE
+
+# The automaton index needs pynini
+AVAILABLE_INDEXES = [index for index in INDEX_TYPES
+                     if index != "automaton" or importlib.util.find_spec("pynini")]
+
+CONSONANTS = "kgcjtdnpbmyrlwshv"
+VOWELS = ["a", "aa", "e", "i", "o", "u"]
+
+
+def make_vocabulary(size, rng):
+    """Real rule words topped up with random 2-4 syllable words."""
+    vocabulary = list(dict.fromkeys(load_vocabulary()))[:size]
+    seen = set(vocabulary)
+    while len(vocabulary) < size:
+        word = ''.join(rng.choice(CONSONANTS) + rng.choice(VOWELS)
+                       for _ in range(rng.randint(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            vocabulary.append(word)
+    return vocabulary
+
+
+def misspell(word, rng):
+    """Apply one random deletion, insertion or substitution."""
+    pos = rng.randrange(len(word))
+    op = rng.randrange(3)
+    if op == 0 and len(word) > 3:
+        return word[:pos] + word[pos + 1:]
+    if op == 1:
+        return word[:pos] + rng.choice(CONSONANTS) + word[pos:]
+    return word[:pos] + rng.choice(CONSONANTS + "aeiou") + word[pos + 1:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark FuzzyMatcher candidate indexes')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[300, 10000, 100000],
+                        help='Vocabulary sizes (default: 300 10000 100000)')
+    parser.add_argument('--queries', type=int, default=20,
+                        help='Misspelled tokens per size (default: 20)')
+    parser.add_argument('--index', nargs='+', choices=INDEX_TYPES, default=AVAILABLE_INDEXES,
+                        help='Indexes to compare (default: all available)')
+    parser.add_argument('--min-similarity', type=float, default=0.65)
+    parser.add_argument('--max-index-distance', type=int, default=None,
+                        help='Largest edit distance the symspell index is built for '
+                             '(default: FuzzyMatcher\'s, SYMSPELL_MAX_DISTANCE). Wider '
+                             'searches fall back to the length scan, see the Fallback column')
+    parser.add_argument('--qgram-size', type=int, default=2,
+                        help='Gram length of the qgram index (default: 2)')
+    parser.add_argument('--memory', action='store_true',
+                        help='Also measure matcher memory with tracemalloc')
+    args = parser.parse_args()
+
+    print(f"{'Vocab':>8} {'Index':<9} {'Build (s)':>10} {'Memory (MB)':>12} "
+          f"{'Per token (ms)':>15} {'Same result':>12} {'Pruned':>7} {'Fallback':>9}")
+    print("-" * 90)
+
+    for size in args.sizes:
+        rng = random.Random(size)
+        vocabulary = make_vocabulary(size, rng)
+        queries = [misspell(rng.choice(vocabulary), rng) for _ in range(args.queries)]
+
+        configurations = [(index, False) for index in args.index]
+        if NUMPY_AVAILABLE and "length" in args.index:
+            configurations.insert(args.index.index("length") + 1, ("length", True))
+
+        reference = None
+        for index, vectorized in configurations:
+            start = time.perf_counter()
+            matcher = FuzzyMatcher(min_similarity=args.min_similarity, index=index,
+                                   vocabulary=vocabulary,
+                                   max_index_distance=args.max_index_distance,
+                                   vectorized=vectorized, qgram_size=args.qgram_size)
+            build_time = time.perf_counter() - start
+
+            memory = "-"
+            if args.memory:
+                tracemalloc.start()
+                FuzzyMatcher(min_similarity=args.min_similarity, index=index,
+                             vocabulary=vocabulary,
+                             max_index_distance=args.max_index_distance,
+                             vectorized=vectorized, qgram_size=args.qgram_size)
+                memory = f"{tracemalloc.get_traced_memory()[1] / 2**20:.1f}"
+                tracemalloc.stop()
+
+            start = time.perf_counter()
+            results = [matcher.find_correction(query) for query in queries]
+            per_token = (time.perf_counter() - start) / len(queries) * 1000
+
+            if reference is None:
+                reference = results
+            same = "yes" if results == reference else "NO"
+            # Share of length-window candidates the index never verified
+            stats = matcher.index_stats()
+            pruned = f"{stats['pruned_rate']:.0%}" if 'pruned_rate' in stats else "-"
+            # Share of searches a bounded index handed to the length scan
+            fallback = f"{stats['fallback_rate']:.0%}" if 'fallback_rate' in stats else "-"
+
+            name = "numpy" if vectorized else index
+            print(f"{size:>8} {name:<9} {build_time:>10.2f} {memory:>12} "
+                  f"{per_token:>15.3f} {same:>12} {pruned:>7} {fallback:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark: Edit Distance Kernels
+
+Times the distance functions in fuzzy_matcher on misspelled vocabulary words
+scored against the whole singlish_rules.json vocabulary:
+
+  * distance  - levenshtein_distance() vs bit_parallel_distance() (exact),
+                and bounded_levenshtein_distance() vs bit_parallel_distance()
+                with the bound implied by --min-similarity for each pair
+  * closest   - the original similarity_score() loop vs find_closest_match()
+                over FuzzyMatcher's ±2 length window, with and without the
+                matcher's precomputed pattern masks
+
+Every row is checked against the full DP for the same answers.
+
+Usage:
+    python benchmarks/bench_levenshtein.py
+    python benchmarks/bench_levenshtein.py --queries 500 --min-similarity 0.8
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'transliteration'))
+
+from fuzzy_matcher import (FuzzyMatcher, levenshtein_distance, bounded_levenshtein_distance,
+                           bit_parallel_distance, pattern_masks, similarity_score,
+                           max_edit_distance, find_closest_match)
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def misspell(word, rng):
+    """Apply one random deletion, insertion or substitution."""
+    pos = rng.randrange(len(word))
+    op = rng.randrange(3)
+    if op == 0 and len(word) > 3:
+        return word[:pos] + word[pos + 1:]
+    if op == 1:
+        return word[:pos] + rng.choice(LETTERS) + word[pos:]
+    return word[:pos] + rng.choice(LETTERS) + word[pos + 1:]
+
+
+def unbounded_closest_match(word, candidates, min_similarity):
+    """find_closest_match() as it was before the bounded distance."""
+    scored_matches = []
+    for candidate in candidates:
+        score = similarity_score(word, candidate)
+        if score >= min_similarity:
+            scored_matches.append((candidate, score))
+    scored_matches.sort(key=lambda x: x[1], reverse=True)
+    return scored_matches[:1]
+
+
+def window(matcher, word):
+    """Candidates FuzzyMatcher's length scan would score for word."""
+    candidates = []
+    for length in range(max(1, len(word) - 2), len(word) + 3):
+        candidates.extend(matcher.word_by_length.get(length, []))
+    return candidates or matcher.vocabulary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark edit distance kernels')
+    parser.add_argument('--queries', type=int, default=200,
+                        help='Misspelled tokens to score (default: 200)')
+    parser.add_argument('--min-similarity', type=float, default=0.65)
+    args = parser.parse_args()
+
+    matcher = FuzzyMatcher(min_similarity=args.min_similarity)
+    vocabulary = [word for word in dict.fromkeys(matcher.vocabulary) if len(word) >= 3]
+    rng = random.Random(0)
+    queries = [misspell(rng.choice(vocabulary), rng) for _ in range(args.queries)]
+
+    print(f"Vocabulary: {len(vocabulary)} words, {len(queries)} queries, "
+          f"min_similarity={args.min_similarity}")
+    print()
+    print(f"{'Section':<10} {'Version':<22} {'Time (s)':>10} {'Per query (ms)':>15} {'Speedup':>8}")
+    print("-" * 69)
+
+    def report(section, version, elapsed, baseline=None):
+        speedup = f"{baseline / elapsed:>7.1f}x" if baseline else ""
+        print(f"{section:<10} {version:<22} {elapsed:>10.3f} "
+              f"{elapsed / len(queries) * 1000:>15.3f} {speedup:>8}")
+
+    # Distance against every vocabulary word
+    pairs = [(q, w, max_edit_distance(max(len(q), len(w)), args.min_similarity))
+             for q in queries for w in vocabulary]
+    masks = {word: pattern_masks(word) for word in vocabulary}
+
+    start = time.perf_counter()
+    full = [levenshtein_distance(q, w) for q, w, _ in pairs]
+    full_time = time.perf_counter() - start
+    report("distance", "full DP", full_time)
+
+    start = time.perf_counter()
+    results = [bit_parallel_distance(q, w, masks[w]) for q, w, _ in pairs]
+    report("distance", "bit-parallel", time.perf_counter() - start, full_time)
+    agree = results == full
+
+    bounded_full = [d if d <= k else k + 1 for d, (_, _, k) in zip(full, pairs)]
+
+    start = time.perf_counter()
+    results = [bounded_levenshtein_distance(q, w, k) for q, w, k in pairs]
+    report("distance", "bounded DP", time.perf_counter() - start, full_time)
+    agree = agree and results == bounded_full
+
+    start = time.perf_counter()
+    results = [bit_parallel_distance(q, w, masks[w], k) for q, w, k in pairs]
+    report("distance", "bounded bit-parallel", time.perf_counter() - start, full_time)
+    agree = agree and results == bounded_full
+
+    # Closest match over the length window, as FuzzyMatcher uses it
+    windows = [window(matcher, q) for q in queries]
+
+    start = time.perf_counter()
+    before = [unbounded_closest_match(q, c, args.min_similarity) for q, c in zip(queries, windows)]
+    before_time = time.perf_counter() - start
+    report("closest", "full DP", before_time)
+
+    start = time.perf_counter()
+    after = [find_closest_match(q, c, args.min_similarity) for q, c in zip(queries, windows)]
+    report("closest", "bounded DP", time.perf_counter() - start, before_time)
+    same = after == before
+
+    start = time.perf_counter()
+    after = [find_closest_match(q, c, args.min_similarity, masks=matcher._masks)
+             for q, c in zip(queries, windows)]
+    report("closest", "bounded bit-parallel", time.perf_counter() - start, before_time)
+    same = same and after == before
+
+    print()
+    print(f"Same distances: {'yes' if agree else 'NO'}")
+    print(f"Same matches:   {'yes' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
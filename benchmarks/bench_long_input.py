@@ -0,0 +1,96 @@
+"""
+Benchmark: Per-Word FST Application on Long Inputs
+
+Times module1.transliterate() on pasted paragraphs from 10 to 100k
+characters against composing a single acceptor for the whole preprocessed
+string with the FST, which transliterate() did when the token cache was
+disabled. The token cache is disabled here so every word goes through the
+FST.
+
+The lattice columns give the number of states of the composed FST: the
+whole-string lattice grows with the input, while the per-word lattices are
+bounded by the longest word. The ns/char column stays flat when the per-word
+cost is linear. Both are checked for the same output. Spell checking is off,
+so only pre/postprocessing and the FST are measured.
+
+Usage:
+    python benchmarks/bench_long_input.py
+    python benchmarks/bench_long_input.py --sizes 1000 100000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'transliteration'))
+
+import module1
+from module1 import transliterate, configure_cache, DEFAULT_CACHE_SIZE
+from preprocess import preprocess, postprocess
+
+
+def whole_string_transliterate(text):
+    """transliterate() before per-word application, without the token cache."""
+    preprocessed_text, metadata = preprocess(text)
+    return postprocess(module1._apply_fst(preprocessed_text), metadata)
+
+
+def lattice_states(fst, text):
+    """Number of states in the composition of text's acceptor with the FST."""
+    import pynini
+    return (pynini.accep(text) @ fst).num_states() if text else 0
+
+
+def timed(function, *args, **kwargs):
+    """Return (result, elapsed seconds)."""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark per-word FST application')
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[10, 100, 1_000, 10_000, 100_000],
+                        help='Input sizes in characters (default: 10 100 1k 10k 100k)')
+    args = parser.parse_args()
+
+    if not module1.PYNINI_AVAILABLE:
+        print("pynini not installed: the FST engine cannot be benchmarked")
+        return
+
+    import pynini
+    fst = pynini.Fst.read(module1.fst_path)
+
+    with open(os.path.join(ROOT, 'data', 'corpus.json'), 'r', encoding='utf-8') as f:
+        paragraph = ' '.join(item['sinlish'] for item in json.load(f))
+
+    configure_cache(0)
+    module1.warmup(engine="fst", spell_check=False)
+
+    print(f"{'Chars':>7} {'Whole (ms)':>11} {'Per word (ms)':>14} {'ns/char':>8} "
+          f"{'Whole lattice':>14} {'Word lattice':>13} {'Same':>5}")
+    print("-" * 78)
+
+    try:
+        for size in args.sizes:
+            text = (paragraph * (size // len(paragraph) + 1))[:size]
+            preprocessed_text, _ = preprocess(text)
+
+            expected, before = timed(whole_string_transliterate, text)
+            actual, after = timed(transliterate, text, spell_check=False, engine="fst")
+            whole = lattice_states(fst, preprocessed_text)
+            word = max(lattice_states(fst, token) for token in set(preprocessed_text.split()))
+
+            same = "yes" if actual == expected else "NO"
+            print(f"{size:>7} {before * 1000:>11.1f} {after * 1000:>14.1f} "
+                  f"{after / size * 1e9:>8.0f} {whole:>14} {word:>13} {same:>5}")
+    finally:
+        configure_cache(DEFAULT_CACHE_SIZE)
+
+
+if __name__ == "__main__":
+    main()
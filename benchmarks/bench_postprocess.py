@@ -0,0 +1,107 @@
+"""
+Benchmark: Linear-Time Postprocessing
+
+Times postprocess() on documents from 1k to 1M characters against the
+list.insert() restore it replaced, whose cost grows with text length times
+the number of restored numbers and punctuation marks. Documents are chat
+messages built from the corpus (see bench_preprocess.py); the text passed
+to postprocess() is the preprocessed text cut to --ratio of its length, as
+transliterated Sinhala is shorter than the Singlish input, so positions past
+the end are covered too.
+
+The ns/char column stays flat for a linear restore. The list.insert()
+version is only run up to --insert-max characters; both are checked for the
+same output.
+
+Usage:
+    python benchmarks/bench_postprocess.py
+    python benchmarks/bench_postprocess.py --sizes 1000 10000 --insert-max 10000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'transliteration'))
+
+from preprocess import preprocess, postprocess
+from bench_preprocess import make_message
+
+
+def insert_restore(text, position_map, one_element):
+    """restore_numbers()/restore_punctuation() before the linear merge."""
+    result = list(text)
+    for pos, item in reversed(position_map):
+        if pos <= len(result):
+            if one_element:
+                result.insert(pos, item)
+            else:
+                for char in reversed(item):
+                    result.insert(pos, char)
+        elif one_element:
+            result.append(item)
+        else:
+            result.extend(item)
+    return ''.join(result)
+
+
+def insert_postprocess(text, metadata):
+    """postprocess() before the linear merge."""
+    text = insert_restore(text, metadata['number_map'], one_element=False)
+    return insert_restore(text, metadata['punctuation_map'], one_element=True)
+
+
+def timed(function, *args):
+    """Return (result, elapsed seconds)."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark linear-time postprocessing')
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1_000, 10_000, 100_000, 1_000_000],
+                        help='Document sizes in characters (default: 1k 10k 100k 1M)')
+    parser.add_argument('--insert-max', type=int, default=100_000,
+                        help='Largest size to run the list.insert() version on (default: 100000)')
+    parser.add_argument('--ratio', type=float, default=0.8,
+                        help='Transliterated length / preprocessed length (default: 0.8)')
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, 'data', 'corpus.json'), 'r', encoding='utf-8') as f:
+        sentences = [item['sinlish'] for item in json.load(f)]
+    rng = random.Random(0)
+
+    print(f"{'Chars':>9} {'Restored':>9} {'Insert (ms)':>12} {'Merge (ms)':>11} "
+          f"{'ns/char':>8} {'Speedup':>8} {'Same':>5}")
+    print("-" * 68)
+
+    for size in args.sizes:
+        parts, length = [], 0
+        while length < size:
+            part = make_message(rng.choice(sentences), rng)
+            parts.append(part)
+            length += len(part) + 1
+        text, metadata = preprocess(" ".join(parts)[:size])
+        text = text[:int(len(text) * args.ratio)]
+        restored = len(metadata['number_map']) + len(metadata['punctuation_map'])
+
+        actual, after = timed(postprocess, text, metadata)
+        if size <= args.insert_max:
+            expected, before = timed(insert_postprocess, text, metadata)
+            before_ms = f"{before * 1000:>12.1f}"
+            speedup = f"{before / after:>7.1f}x"
+            same = "yes" if actual == expected else "NO"
+        else:
+            before_ms, speedup, same = f"{'-':>12}", f"{'-':>8}", "-"
+        print(f"{size:>9} {restored:>9} {before_ms} {after * 1000:>11.2f} "
+              f"{after / size * 1e9:>8.1f} {speedup} {same:>5}")
+
+
+if __name__ == "__main__":
+    main()
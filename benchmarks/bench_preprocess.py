@@ -0,0 +1,129 @@
+"""
+Benchmark: Single-Pass Preprocessing
+
+Times preprocess() against the step-by-step pipeline it replaced
+(unidecode, validate_input, normalize_text, separate_punctuation,
+handle_numbers, each walking the whole text) on two workloads:
+
+  * chat  - short messages: corpus sentences with random capitals, extra
+            spaces, punctuation and numbers
+  * doc   - documents of about --doc-size bytes built from the same messages
+
+Each workload runs as plain ASCII, which skips unidecode, and as mixed
+Unicode with some vowels accented. Both versions are checked for identical
+text and metadata.
+
+Usage:
+    python benchmarks/bench_preprocess.py
+    python benchmarks/bench_preprocess.py --messages 50000 --doc-size 4000000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'transliteration'))
+
+from preprocess import (preprocess, unicode_to_ascii, validate_input, normalize_text,
+                        separate_punctuation, handle_numbers)
+
+PUNCTUATION = ".,!?'-"
+ACCENTED = {'a': 'áàâ', 'e': 'éè', 'i': 'íï', 'o': 'óô', 'u': 'úü'}
+
+
+def step_preprocess(text):
+    """preprocess() as it was before the single-pass scanner."""
+    warnings = []
+    original_text = text
+    ascii_text = unicode_to_ascii(text)
+    ascii_converted = (ascii_text != text)
+    if ascii_converted:
+        warnings.append("Unicode characters detected and converted to ASCII")
+    text = ascii_text
+    is_valid, error_msg = validate_input(text)
+    if not is_valid:
+        warnings.append(f"Validation warning: {error_msg}")
+    text = normalize_text(text)
+    text, punctuation_map = separate_punctuation(text)
+    text, number_map = handle_numbers(text)
+    return text, {
+        'punctuation_map': punctuation_map,
+        'number_map': number_map,
+        'original_text': original_text,
+        'ascii_converted': ascii_converted,
+        'warnings': warnings
+    }
+
+
+def make_message(sentence, rng):
+    """Dress a corpus sentence up as a chat message."""
+    words = []
+    for word in sentence.split():
+        if rng.random() < 0.2:
+            word = word.capitalize()
+        if rng.random() < 0.1:
+            word = str(rng.randrange(1000))
+        if rng.random() < 0.15:
+            word += rng.choice(PUNCTUATION)
+        words.append(word)
+    return rng.choice(["", " "]) + rng.choice([" ", "  "]).join(words) + rng.choice(["", "!", "?", " "])
+
+
+def accent(text, rng):
+    """Accent about one vowel in ten, as text pasted from other sources may be."""
+    return ''.join(rng.choice(ACCENTED[c]) if c in ACCENTED and rng.random() < 0.1 else c
+                   for c in text)
+
+
+def run(texts, function):
+    """Return (results, elapsed seconds) for function over texts."""
+    start = time.perf_counter()
+    results = [function(text) for text in texts]
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark single-pass preprocessing')
+    parser.add_argument('--messages', type=int, default=20000,
+                        help='Chat messages to preprocess (default: 20000)')
+    parser.add_argument('--doc-size', type=int, default=1_000_000,
+                        help='Document size in bytes (default: 1000000)')
+    parser.add_argument('--docs', type=int, default=3,
+                        help='Documents to preprocess (default: 3)')
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, 'data', 'corpus.json'), 'r', encoding='utf-8') as f:
+        sentences = [item['sinlish'] for item in json.load(f)]
+
+    rng = random.Random(0)
+    messages = [make_message(rng.choice(sentences), rng) for _ in range(args.messages)]
+
+    docs = []
+    for _ in range(args.docs):
+        parts, size = [], 0
+        while size < args.doc_size:
+            part = make_message(rng.choice(sentences), rng)
+            parts.append(part)
+            size += len(part) + 1
+        docs.append("\n".join(parts)[:args.doc_size])
+
+    print(f"{'Workload':<10} {'Input':<8} {'Texts':>7} {'Steps (ms)':>12} {'Scan (ms)':>11} "
+          f"{'us/text':>9} {'Speedup':>8} {'Same':>5}")
+    print("-" * 77)
+
+    for name, ascii_texts in [("chat", messages), ("doc", docs)]:
+        unicode_texts = [accent(text, rng) for text in ascii_texts]
+        for kind, texts in [("ascii", ascii_texts), ("unicode", unicode_texts)]:
+            expected, before = run(texts, step_preprocess)
+            actual, after = run(texts, preprocess)
+            same = "yes" if actual == expected else "NO"
+            print(f"{name:<10} {kind:<8} {len(texts):>7} {before * 1000:>12.1f} {after * 1000:>11.1f} "
+                  f"{after / len(texts) * 1e6:>9.1f} {before / after:>7.1f}x {same:>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: Memory of Slotted Result Records
+
+Measures, with tracemalloc, the bytes held per sentence by the results of a
+bulk job: preprocess() metadata and pipeline.batch_translate() results
+(including Module 2's parse result). Each is compared against the plain
+dicts the functions returned before (built here with to_dict(), which gives
+the same structure and shares the same lists and feature dicts).
+
+Usage:
+    python benchmarks/bench_records.py
+    python benchmarks/bench_records.py --sentences 100000
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import sys
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'transliteration'))
+
+from preprocess import preprocess
+from pipeline import batch_translate
+
+
+def retained_bytes(build):
+    """Return (result, bytes still allocated by build() once it returns)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def as_dicts(records):
+    """The same results as the plain dicts returned before."""
+    return [record.to_dict() for record in records]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark memory of result records')
+    parser.add_argument('--sentences', type=int, default=20000,
+                        help='Sentences to process (default: 20000)')
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, 'data', 'corpus.json'), 'r', encoding='utf-8') as f:
+        corpus = [item['sinlish'] for item in json.load(f)]
+    sentences = [corpus[i % len(corpus)] for i in range(args.sentences)]
+
+    # Load the engine, lexicon and matcher outside the measurement; Module 2
+    # warnings about unknown tokens are not of interest here
+    with contextlib.redirect_stdout(io.StringIO()):
+        batch_translate(corpus)
+
+    print(f"{'Results':<22} {'Dicts (B/sent)':>15} {'Records (B/sent)':>17} {'Saved':>7}")
+    print("-" * 64)
+
+    def report(name, build):
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, record_bytes = retained_bytes(build)
+            _, dict_bytes = retained_bytes(lambda: as_dicts(build()))
+        before = dict_bytes / len(sentences)
+        after = record_bytes / len(sentences)
+        print(f"{name:<22} {before:>15.0f} {after:>17.0f} {1 - after / before:>6.0%}")
+
+    report("preprocess metadata", lambda: [preprocess(s)[1] for s in sentences])
+    report("pipeline results", lambda: batch_translate(sentences))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: Spell Check Fast Paths on the Corpus
+
+Runs FuzzyMatcher.correct_text() over data/corpus.json and reports how many
+tokens were short-circuited (too short, vocabulary words, or cached as
+correctly spelled / without a match) instead of being scored. It is timed
+against scoring every token with find_correction(), as correct_text() did
+before the fast paths, and both are checked for identical output.
+
+Usage:
+    python benchmarks/bench_spell_check.py
+    python benchmarks/bench_spell_check.py --repeat 20
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'transliteration'))
+
+from fuzzy_matcher import FuzzyMatcher
+
+
+def score_every_token(matcher, text):
+    """correct_text() without the fast paths."""
+    words = []
+    for word in text.split():
+        result = matcher.find_correction(word)
+        words.append(result[0] if result else word)
+    return ' '.join(words)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark spell check fast paths')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Passes over the corpus (default: 1)')
+    parser.add_argument('--min-similarity', type=float, default=0.65)
+    args = parser.parse_args()
+
+    with open(os.path.join(ROOT, 'data', 'corpus.json'), 'r', encoding='utf-8') as f:
+        texts = [item['sinlish'] for item in json.load(f)] * args.repeat
+
+    matcher = FuzzyMatcher(min_similarity=args.min_similarity)
+
+    start = time.perf_counter()
+    expected = [score_every_token(matcher, text) for text in texts]
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [matcher.correct_text(text)[0] for text in texts]
+    after = time.perf_counter() - start
+
+    stats = matcher.cache_stats()
+    tokens = stats['tokens']
+    print(f"Corpus: {len(texts)} sentences, {tokens} tokens")
+    print()
+    for key, label in [('short', 'Shorter than min_word_length'),
+                       ('exact_hits', 'Vocabulary words'),
+                       ('correct_hits', 'Cached as correctly spelled'),
+                       ('no_match_hits', 'Cached as having no match'),
+                       ('scored', 'Scored')]:
+        print(f"  {label:<30} {stats[key]:>7}  ({stats[key] / tokens:.1%})")
+    print()
+    print(f"Short-circuited: {stats['short_circuit_rate']:.1%} of tokens")
+    print(f"Score every token: {before * 1000:.1f} ms")
+    print(f"correct_text:      {after * 1000:.1f} ms ({before / after:.1f}x)")
+    print(f"Same output: {'yes' if actual == expected else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: Heap Top-k vs Collect-and-Sort in find_closest_match
+
+Times find_closest_match() with max_results 1 and 5 against the previous
+approach (score every candidate up to the min_similarity bound, collect all
+passing ones and sort). The heap version raises its cutoff as better
+candidates are found, which shrinks the distance bound for the rest.
+
+Candidates are the whole vocabulary, so the effect grows with size. Queries
+are misspelled vocabulary words, and both versions are checked for the
+same results.
+
+Usage:
+    python benchmarks/bench_topk.py
+    python benchmarks/bench_topk.py --sizes 300 10000 --k 1 5 10
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'transliteration'))
+
+from fuzzy_matcher import (bounded_levenshtein_distance, max_edit_distance,
+                           find_closest_match)
+from bench_fuzzy_index import make_vocabulary, misspell
+
+
+def sort_closest_match(word, candidates, min_similarity, max_results):
+    """find_closest_match() before the heap: collect every match, then sort."""
+    word_lower = word.lower()
+    scored_matches = []
+    for candidate in candidates:
+        max_len = max(len(word), len(candidate))
+        bound = max_edit_distance(max_len, min_similarity)
+        distance = bounded_levenshtein_distance(word_lower, candidate.lower(), bound)
+        if distance <= bound:
+            scored_matches.append((candidate, 1 - (distance / max_len)))
+    scored_matches.sort(key=lambda x: x[1], reverse=True)
+    return scored_matches[:max_results]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark top-k selection in find_closest_match')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[300, 10000],
+                        help='Vocabulary sizes (default: 300 10000)')
+    parser.add_argument('--k', type=int, nargs='+', default=[1, 5],
+                        help='max_results values (default: 1 5)')
+    parser.add_argument('--queries', type=int, default=50,
+                        help='Misspelled tokens per size (default: 50)')
+    parser.add_argument('--min-similarity', type=float, default=0.5)
+    args = parser.parse_args()
+
+    print(f"{'Vocab':>8} {'k':>3} {'Sort (ms)':>10} {'Heap (ms)':>10} {'Speedup':>8} {'Same':>5}")
+    print("-" * 49)
+
+    for size in args.sizes:
+        rng = random.Random(size)
+        vocabulary = make_vocabulary(size, rng)
+        queries = [misspell(rng.choice(vocabulary), rng) for _ in range(args.queries)]
+
+        for k in args.k:
+            start = time.perf_counter()
+            expected = [sort_closest_match(q, vocabulary, args.min_similarity, k) for q in queries]
+            sort_time = (time.perf_counter() - start) / len(queries) * 1000
+
+            start = time.perf_counter()
+            actual = [find_closest_match(q, vocabulary, args.min_similarity, k) for q in queries]
+            heap_time = (time.perf_counter() - start) / len(queries) * 1000
+
+            same = "yes" if actual == expected else "NO"
+            print(f"{size:>8} {k:>3} {sort_time:>10.3f} {heap_time:>10.3f} "
+                  f"{sort_time / heap_time:>7.1f}x {same:>5}")
+
+
+if __name__ == "__main__":
+    main()
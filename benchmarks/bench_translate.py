@@ -0,0 +1,144 @@
+"""
+Benchmark: Compiled Lexicon in Module 2
+
+Times module2.translate() on the Sinhala sentences of data/corpus.json and
+on a synthetic set of 1M sentences against the previous lookup, which read
+the raw json.load() dict and copied every field except role into a new dict
+for each word found. The compiled lexicon does one dict lookup per token and
+shares each entry's pre-stripped features between results.
+
+Synthetic sentences are subject, optional object, optional negation and
+verb drawn from the lexicon, so every token is found. Both versions are
+checked for the same to_dict() output.
+
+Usage:
+    python benchmarks/bench_translate.py
+    python benchmarks/bench_translate.py --sentences 100000 --repeat 50
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'translation'))
+
+from module2 import translate, ParseResult, LEXICON_FILE
+
+
+def copying_translate(sinhala_text, raw_lexicon):
+    """translate() before the compiled lexicon: copy the fields of each hit."""
+    if not sinhala_text or not raw_lexicon:
+        return ParseResult("", {}, {}, {}, False)
+
+    subject_info, object_info, verb_info = {}, {}, {}
+    is_negated = False
+    modifiers = []
+    for token in sinhala_text.split():
+        word_data = raw_lexicon.get(token)
+        if word_data is not None:
+            role = word_data.get('role')
+            pos = word_data.get('pos')
+            if role == 'SUBJ':
+                subject_info = {k: v for k, v in word_data.items() if k != 'role'}
+            elif role == 'OBJ':
+                object_info = {k: v for k, v in word_data.items() if k != 'role'}
+            elif pos == 'VERB':
+                verb_info = {k: v for k, v in word_data.items() if k != 'role'}
+            elif role == 'NEGATION':
+                is_negated = True
+            elif role == 'MODIFIER':
+                modifiers.append({k: v for k, v in word_data.items() if k != 'role'})
+        else:
+            print(f"Module 2 WARNING: Token '{token}' not found in lexicon. This will affect output.")
+
+    ordered_parts = []
+    if subject_info:
+        ordered_parts.append(subject_info['en'])
+    if verb_info:
+        ordered_parts.append(verb_info['en'])
+    if object_info:
+        ordered_parts.append(object_info['en'])
+    words = tuple(word for part in ordered_parts for word in part.split())
+    return ParseResult(" ".join(ordered_parts), subject_info, object_info,
+                       verb_info, is_negated, words)
+
+
+def make_sentences(raw_lexicon, count, rng):
+    """Random SOV sentences built from lexicon words."""
+    by_role = {}
+    for word, record in raw_lexicon.items():
+        role = 'VERB' if record.get('pos') == 'VERB' else record.get('role')
+        by_role.setdefault(role, []).append(word)
+
+    sentences = []
+    for _ in range(count):
+        parts = [rng.choice(by_role['SUBJ'])]
+        if by_role.get('OBJ') and rng.random() < 0.8:
+            parts.append(rng.choice(by_role['OBJ']))
+        if by_role.get('NEGATION') and rng.random() < 0.1:
+            parts.append(rng.choice(by_role['NEGATION']))
+        parts.append(rng.choice(by_role['VERB']))
+        sentences.append(' '.join(parts))
+    return sentences
+
+
+def timed(function, texts):
+    """
+    Return (results, elapsed seconds); lexicon-miss warnings are discarded.
+
+    The garbage collector is paused, as in timeit: otherwise its passes over
+    the growing result list dominate the 1M-sentence run.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            results = [function(text) for text in texts]
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the compiled Module 2 lexicon')
+    parser.add_argument('--sentences', type=int, default=1_000_000,
+                        help='Synthetic sentences (default: 1000000)')
+    parser.add_argument('--repeat', type=int, default=200,
+                        help='Passes over the corpus (default: 200)')
+    args = parser.parse_args()
+
+    with open(LEXICON_FILE, 'r', encoding='utf-8') as f:
+        raw_lexicon = json.load(f)
+    with open(os.path.join(ROOT, 'data', 'corpus.json'), 'r', encoding='utf-8') as f:
+        corpus = [item['sinhala'] for item in json.load(f) if item.get('sinhala')]
+
+    datasets = [
+        (f"corpus x{args.repeat}", corpus * args.repeat),
+        ("synthetic", make_sentences(raw_lexicon, args.sentences, random.Random(0))),
+    ]
+
+    print(f"{'Set':<12} {'Sentences':>10} {'Copying (s)':>12} {'Compiled (s)':>13} "
+          f"{'ns/sentence':>12} {'Speedup':>8} {'Same':>5}")
+    print("-" * 78)
+
+    for name, texts in datasets:
+        expected, before = timed(lambda text: copying_translate(text, raw_lexicon), texts)
+        actual, after = timed(translate, texts)
+        same = all(a.to_dict() == e.to_dict() for a, e in zip(actual, expected))
+        del expected, actual
+
+        print(f"{name:<12} {len(texts):>10} {before:>12.2f} {after:>13.2f} "
+              f"{after / len(texts) * 1e9:>12.0f} {before / after:>7.2f}x "
+              f"{'yes' if same else 'NO':>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: Multiprocess Batch Translation Scaling
+
+Times pipeline.batch_translate() on a synthetic job with 1, 2, 4 and 8
+worker processes. Sentences are sampled from data/corpus.json and about a
+third of the words get a dropped letter, so the fuzzy matcher sees a
+realistic mix of known words and typos.
+
+Usage:
+    python benchmarks/bench_workers.py
+    python benchmarks/bench_workers.py --sentences 100000 --workers 1 4 16 32
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from pipeline import batch_translate, warmup, DEFAULT_ENGINE, ENGINES
+
+
+def make_job(size, seed=0):
+    """Sample corpus sentences and inject single-letter deletions."""
+    with open(os.path.join(ROOT, 'data', 'corpus.json'), 'r', encoding='utf-8') as f:
+        corpus = [item['sinlish'] for item in json.load(f)]
+
+    rng = random.Random(seed)
+    job = []
+    for _ in range(size):
+        words = rng.choice(corpus).split()
+        for i, word in enumerate(words):
+            if len(word) > 4 and rng.random() < 0.3:
+                cut = rng.randrange(len(word))
+                words[i] = word[:cut] + word[cut + 1:]
+        job.append(' '.join(words))
+    return job
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark multiprocess batch translation')
+    parser.add_argument('--sentences', type=int, default=20000,
+                        help='Number of sentences in the synthetic job (default: 20000)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Worker counts to measure (default: 1 2 4 8)')
+    parser.add_argument('--engine', choices=ENGINES, default=DEFAULT_ENGINE)
+    args = parser.parse_args()
+
+    job = make_job(args.sentences)
+    warmup(args.engine)
+
+    print(f"Engine: {args.engine}, sentences: {len(job)}, CPUs: {os.cpu_count()}")
+    print(f"{'Workers':>7} {'Total (s)':>10} {'Sentences/s':>13} {'Speedup':>8}")
+    print("-" * 42)
+
+    baseline = None
+    for workers in args.workers:
+        # Module 2 prints a warning per unknown token; keep the table readable
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            batch_translate(job, engine=args.engine, workers=workers)
+            elapsed = time.perf_counter() - start
+
+        baseline = baseline or elapsed
+        print(f"{workers:>7} {elapsed:>10.2f} {len(job) / elapsed:>13.0f} "
+              f"{baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -196,8 +196,8 @@ def post_process(translation_dict: Dict[str, Any]) -> str:
     if not raw_translation:
         return ""
     
-    # Split into words
-    words = raw_translation.split()
+    # Split into words (Module 2's ParseResult has them already split)
+    words = list(getattr(translation_dict, 'words', None) or raw_translation.split())
     
     if not words:
         return ""
@@ -10,6 +10,7 @@ This script provides a complete pipeline that:
 
 Usage:
     python pipeline.py "mama gedara yanawa"
+    python pipeline.py --input messages.txt --output results.jsonl
     
 Or import as module:
     from pipeline import translate_singlish
@@ -19,15 +20,22 @@ Or import as module:
 import sys
 import os
 import json
-from typing import Dict, Any
+import time
+import contextlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
 
 # Add module directories to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'transliteration'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'translation'))
 
 try:
-    from module1 import transliterate
-    from module2 import translate
+    from module1 import (transliterate_spans, transliterate_batch_spans, warmup,
+                         flush_corrections, ENGINES, DEFAULT_ENGINE)
+    from module2 import translate_spans, ParseResult
+    from records import Record, TokenSpan
 except ImportError as e:
     print(f"Error: Failed to import modules. Make sure FST is built.")
     print(f"Run: cd transliteration && python build_fst.py")
@@ -35,7 +43,34 @@ except ImportError as e:
     sys.exit(1)
 
 
-def translate_singlish(singlish_text: str, verbose: bool = False, spell_check: bool = True) -> Dict[str, Any]:
+class PipelineResult(Record):
+    """
+    Result of translating one sentence, readable as the dict it replaces.
+    
+    Use to_dict() for JSON output; parse is Module 2's ParseResult (or {}
+    if translation failed before Module 2 ran). spans holds Module 1's
+    TokenSpan records, with offsets into input, each token's Sinhala form
+    and the lexicon entry the parse used from it, for aligning output with
+    input; it is not part of the dict view.
+    """
+    
+    _fields = ('input', 'sinhala', 'english', 'parse', 'success', 'error')
+    __slots__ = _fields + ('spans',)
+    
+    def __init__(self, input: str, sinhala: str = "", english: str = "",
+                 parse: Optional[ParseResult] = None, success: bool = False,
+                 error: Optional[str] = None, spans: Optional[List[TokenSpan]] = None):
+        self.input = input
+        self.sinhala = sinhala
+        self.english = english
+        self.parse = {} if parse is None else parse
+        self.success = success
+        self.error = error
+        self.spans = spans
+
+
+def translate_singlish(singlish_text: str, verbose: bool = False, spell_check: bool = True,
+                       engine: str = DEFAULT_ENGINE) -> PipelineResult:
     """
     Complete pipeline: Singlish → Sinhala → English
     
@@ -43,9 +78,10 @@ def translate_singlish(singlish_text: str, verbose: bool = False, spell_check: b
         singlish_text: Input text in romanized Singlish
         verbose: If True, print intermediate steps
         spell_check: If True, attempt to correct spelling mistakes (default: True)
+        engine: Module 1 transliteration engine, "fst" or "trie"
         
     Returns:
-        Dictionary containing:
+        PipelineResult (readable as a dictionary, see to_dict()) containing:
         - input: Original Singlish text
         - sinhala: Transliterated Sinhala text
         - english: Translated English text
@@ -54,69 +90,271 @@ def translate_singlish(singlish_text: str, verbose: bool = False, spell_check: b
         - error: Error message if failed
         - spell_corrections: List of spelling corrections made (if any)
     """
-    result = {
-        "input": singlish_text,
-        "sinhala": "",
-        "english": "",
-        "parse": {},
-        "success": False,
-        "error": None
-    }
+    result = _new_result(singlish_text)
     
     try:
         # Step 1: Transliterate Singlish to Sinhala (Module 1)
         if verbose:
             print(f"[Module 1] Transliterating: {singlish_text}")
         
-        sinhala_text = transliterate(singlish_text, verbose=verbose)
-        result["sinhala"] = sinhala_text
+        sinhala_text, spans = transliterate_spans(singlish_text, verbose=verbose, engine=engine)
         
         if verbose:
             print(f"[Module 1] Result: {sinhala_text}")
         
-        # Step 2: Translate Sinhala to English (Module 2)
-        if verbose:
-            print(f"[Module 2] Parsing: {sinhala_text}")
-        
-        parse_result = translate(sinhala_text)
-        result["parse"] = parse_result
-        result["english"] = parse_result.get("raw_translation", "")
-        
-        if verbose:
-            print(f"[Module 2] Result: {result['english']}")
-        
-        result["success"] = True
+        # Step 2: Translate the Sinhala text to English (Module 2)
+        _translate_sinhala(result, sinhala_text, spans, verbose=verbose)
         
     except Exception as e:
-        result["error"] = str(e)
-        result["success"] = False
+        result.error = str(e)
+        result.success = False
         if verbose:
             print(f"[ERROR] Pipeline failed: {e}")
     
     return result
 
 
-def batch_translate(singlish_sentences: list, verbose: bool = False) -> list:
+def _new_result(singlish_text: str) -> PipelineResult:
+    """Create an empty pipeline result for the given input."""
+    return PipelineResult(singlish_text)
+
+
+def _translate_sinhala(result: PipelineResult, sinhala_text: str, spans: List[TokenSpan],
+                       verbose: bool = False):
+    """Run Module 2 on Module 1's output, annotate its spans and fill in the pipeline result."""
+    result.sinhala = sinhala_text
+    result.spans = spans
+    
+    if verbose:
+        print(f"[Module 2] Parsing: {sinhala_text}")
+    
+    parse_result = translate_spans(sinhala_text, spans)
+    result.parse = parse_result
+    result.english = parse_result.raw_translation
+    
+    if verbose:
+        print(f"[Module 2] Result: {result.english}")
+    
+    result.success = True
+
+
+def batch_translate(singlish_sentences: list, verbose: bool = False,
+                    engine: str = DEFAULT_ENGINE, workers: int = 1,
+                    chunk_size: Optional[int] = None) -> list:
     """
     Translate multiple Singlish sentences.
     
+    Module 1 runs once over the whole batch (see transliterate_batch_spans), so
+    repeated sentences and tokens are only transliterated once. With
+    workers > 1 the batch is split into chunks that are translated in a
+    pool of worker processes; results keep the input order.
+    
     Args:
         singlish_sentences: List of Singlish text strings
-        verbose: If True, print progress
+        verbose: If True, print progress (always runs in this process)
+        engine: Module 1 transliteration engine, "fst" or "trie"
+        workers: Number of worker processes (default: 1, no pool)
+        chunk_size: Sentences per worker task (default: spread the batch
+                    over about four tasks per worker)
         
     Returns:
-        List of result dictionaries
+        List of PipelineResult records
     """
-    results = []
-    for i, sentence in enumerate(singlish_sentences, 1):
-        if verbose:
+    if workers > 1 and not verbose:
+        if chunk_size is None:
+            chunk_size = max(1, -(-len(singlish_sentences) // (workers * 4)))
+        chunks = (singlish_sentences[i:i + chunk_size]
+                  for i in range(0, len(singlish_sentences), chunk_size))
+        return [result for chunk_results in parallel_translate(chunks, workers, engine)
+                for result in chunk_results]
+    
+    if verbose:
+        results = []
+        for i, sentence in enumerate(singlish_sentences, 1):
             print(f"\n--- Translating sentence {i}/{len(singlish_sentences)} ---")
-        result = translate_singlish(sentence, verbose=verbose)
+            results.append(translate_singlish(sentence, verbose=verbose, engine=engine))
+        return results
+    
+    # A sentence Module 1 cannot handle gets its own error; the rest of the
+    # batch is translated as usual
+    failures = {}
+    try:
+        transliterations = transliterate_batch_spans(singlish_sentences, engine=engine,
+                                                     errors=failures)
+    except Exception as e:
+        # The engine could not be loaded, so no sentence can be translated
+        return [PipelineResult(sentence, error=str(e)) for sentence in singlish_sentences]
+    
+    results = []
+    for sentence, (sinhala_text, spans) in zip(singlish_sentences, transliterations):
+        result = _new_result(sentence)
+        if sentence in failures:
+            result.error = str(failures[sentence])
+        else:
+            try:
+                _translate_sinhala(result, sinhala_text, spans)
+            except Exception as e:
+                result.error = str(e)
         results.append(result)
     return results
 
 
-def print_result(result: Dict[str, Any], show_parse: bool = False):
+def _translate_chunk(chunk: List[str], engine: str) -> List[PipelineResult]:
+    """Worker task: translate one chunk of sentences."""
+    results = batch_translate(chunk, engine=engine)
+    # Workers exit without running atexit, so store new corrections now
+    flush_corrections()
+    return results
+
+
+def parallel_translate(chunks: Iterable[List[str]], workers: int,
+                       engine: str = DEFAULT_ENGINE) -> Iterator[List[PipelineResult]]:
+    """
+    Translate chunks of sentences in a pool of pre-warmed worker processes.
+    
+    The engine and fuzzy matcher are loaded in this process first (so forked
+    workers inherit them) and by each worker's initializer (for platforms
+    that spawn). At most two chunks per worker are in flight, so chunks can
+    come from an unbounded generator.
+    
+    Args:
+        chunks: Iterable of lists of Singlish sentences
+        workers: Number of worker processes
+        engine: Module 1 transliteration engine, "fst" or "trie"
+        
+    Yields:
+        List of PipelineResult records for each chunk, in input order
+    """
+    warmup(engine)
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=warmup,
+                             initargs=(engine,)) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_translate_chunk, chunk, engine))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# Number of sentences translated together in streaming mode
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def read_inputs(stream: Iterable[str], field: Optional[str] = None) -> Iterator[str]:
+    """
+    Lazily read Singlish sentences from a text stream.
+    
+    Args:
+        stream: File-like object yielding lines
+        field: If given, each line is a JSON object and the sentence is read
+               from this field (blank lines are skipped); otherwise every line
+               is one sentence
+        
+    Yields:
+        Singlish sentences, in input order
+        
+    Raises:
+        ValueError: If a JSONL line is not valid JSON or lacks the field
+    """
+    for line_number, line in enumerate(stream, 1):
+        line = line.rstrip('\r\n')
+        if field is None:
+            yield line
+            continue
+        
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)[field]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"Line {line_number}: could not read field '{field}': {e}")
+
+
+def _chunks(sentences: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """Lazily group an iterable of sentences into lists of chunk_size."""
+    iterator = iter(sentences)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def stream_translate(sentences: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     engine: str = DEFAULT_ENGINE, workers: int = 1) -> Iterator[PipelineResult]:
+    """
+    Translate an arbitrarily long stream of sentences in bounded memory.
+    
+    Sentences are pulled chunk_size at a time and translated with
+    batch_translate, so at most one chunk (or two per worker) is held in
+    memory.
+    
+    Args:
+        sentences: Iterable of Singlish sentences (e.g. from read_inputs)
+        chunk_size: Number of sentences per batch
+        engine: Module 1 transliteration engine, "fst" or "trie"
+        workers: Number of worker processes (default: 1, no pool)
+        
+    Yields:
+        PipelineResult records, in input order
+    """
+    if workers > 1:
+        for chunk_results in parallel_translate(_chunks(sentences, chunk_size), workers, engine):
+            yield from chunk_results
+        return
+    
+    for chunk in _chunks(sentences, chunk_size):
+        yield from batch_translate(chunk, engine=engine)
+
+
+def run_stream(input_path: str, output_path: str, field: Optional[str] = None,
+               chunk_size: int = DEFAULT_CHUNK_SIZE, engine: str = DEFAULT_ENGINE,
+               workers: int = 1) -> int:
+    """
+    Translate a file (or stdin) line by line and write JSONL results.
+    
+    Args:
+        input_path: Input file path, or '-' for stdin
+        output_path: Output file path, or '-' for stdout
+        field: JSON field holding the sentence if the input is JSONL
+        chunk_size: Number of sentences per batch
+        engine: Module 1 transliteration engine, "fst" or "trie"
+        workers: Number of worker processes (default: 1, no pool)
+        
+    Returns:
+        Number of sentences processed
+    """
+    with contextlib.ExitStack() as stack:
+        if input_path == '-':
+            input_stream = sys.stdin
+        else:
+            input_stream = stack.enter_context(open(input_path, 'r', encoding='utf-8'))
+        if output_path == '-':
+            output_stream = sys.stdout
+        else:
+            output_stream = stack.enter_context(open(output_path, 'w', encoding='utf-8'))
+        
+        # Keep stdout clean for JSONL: module warnings go to stderr
+        stack.enter_context(contextlib.redirect_stdout(sys.stderr))
+        
+        count = 0
+        start = time.perf_counter()
+        results = stream_translate(read_inputs(input_stream, field), chunk_size, engine, workers)
+        for result in results:
+            output_stream.write(json.dumps(result.to_dict(), ensure_ascii=False) + '\n')
+            count += 1
+        output_stream.flush()
+        elapsed = time.perf_counter() - start
+    
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"Processed {count} sentences in {elapsed:.2f}s ({rate:.0f} sentences/s)",
+          file=sys.stderr)
+    return count
+
+
+def print_result(result: PipelineResult, show_parse: bool = False):
     """Pretty print a translation result."""
     print("\n" + "="*60)
     print(f"Input (Singlish):  {result['input']}")
@@ -137,7 +375,7 @@ def print_result(result: Dict[str, Any], show_parse: bool = False):
     print("="*60)
 
 
-def run_test_corpus(verbose: bool = False):
+def run_test_corpus(verbose: bool = False, engine: str = DEFAULT_ENGINE, workers: int = 1):
     """Run pipeline on the full corpus for validation."""
     corpus_path = os.path.join(os.path.dirname(__file__), 'data', 'corpus.json')
     
@@ -155,13 +393,14 @@ def run_test_corpus(verbose: bool = False):
     success_count = 0
     fail_count = 0
     
-    for item in corpus:
+    results = batch_translate([item['sinlish'] for item in corpus], engine=engine,
+                              workers=workers)
+    
+    for item, result in zip(corpus, results):
         singlish = item['sinlish']
         expected_sinhala = item['sinhala']
         expected_english = item['english_reference']
         
-        result = translate_singlish(singlish, verbose=False)
-        
         sinhala_match = result['sinhala'] == expected_sinhala
         # For English, we just check if translation succeeded (Module 3 will handle fluency)
         
@@ -201,6 +440,10 @@ Examples:
   python pipeline.py "eyala potha kiyawanawa" --verbose
   python pipeline.py --test
   python pipeline.py --interactive
+  python pipeline.py "mama gedara yanawa" --engine trie
+  python pipeline.py --input messages.txt --output results.jsonl
+  cat messages.jsonl | python pipeline.py --input - --field text
+  python pipeline.py --input messages.txt --output results.jsonl --workers 8
         """
     )
     
@@ -213,12 +456,30 @@ Examples:
                        help='Run pipeline on full corpus')
     parser.add_argument('-i', '--interactive', action='store_true',
                        help='Interactive mode (type to translate)')
+    parser.add_argument('-e', '--engine', choices=ENGINES, default=DEFAULT_ENGINE,
+                       help=f'Transliteration engine (default: {DEFAULT_ENGINE})')
+    parser.add_argument('--input', metavar='FILE',
+                       help="Stream sentences from FILE ('-' for stdin), one per line")
+    parser.add_argument('--output', metavar='FILE', default='-',
+                       help="Write JSONL results to FILE ('-' for stdout, the default)")
+    parser.add_argument('--field', metavar='NAME',
+                       help='Treat --input as JSONL and read sentences from this field')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                       help=f'Sentences per batch in streaming mode (default: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                       help='Worker processes for --test and --input (default: 1)')
     
     args = parser.parse_args()
     
+    # Streaming mode
+    if args.input:
+        run_stream(args.input, args.output, field=args.field,
+                   chunk_size=args.chunk_size, engine=args.engine, workers=args.workers)
+        return
+    
     # Test mode
     if args.test:
-        run_test_corpus(verbose=args.verbose)
+        run_test_corpus(verbose=args.verbose, engine=args.engine, workers=args.workers)
         return
     
     # Interactive mode
@@ -237,7 +498,8 @@ Examples:
                 if not singlish:
                     continue
                     
-                result = translate_singlish(singlish, verbose=args.verbose)
+                result = translate_singlish(singlish, verbose=args.verbose,
+                                            engine=args.engine)
                 print_result(result, show_parse=args.parse)
                 
             except KeyboardInterrupt:
@@ -247,7 +509,7 @@ Examples:
     
     # Single translation mode
     if args.text:
-        result = translate_singlish(args.text, verbose=args.verbose)
+        result = translate_singlish(args.text, verbose=args.verbose, engine=args.engine)
         print_result(result, show_parse=args.parse)
     else:
         parser.print_help()
@@ -99,7 +99,7 @@ def run_full_pipeline(singlish_text: str, verbose: bool = False) -> Dict[str, An
         if verbose:
             print(f"  [Module 2] Parsing: {sinhala}")
         parse_dict = translate(sinhala)
-        result['parse'] = parse_dict
+        result['parse'] = parse_dict.to_dict()
         result['raw_translation'] = parse_dict.get('raw_translation', '')
         
         # Module 3: Post-process to fluent English
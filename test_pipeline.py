@@ -9,6 +9,7 @@ For full BLEU score calculation, use run_evaluation.py after fixing nltk.
 import sys
 import os
 import json
+import subprocess
 
 # Add module directories to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'transliteration'))
@@ -52,6 +53,192 @@ def run_pipeline(singlish_text):
         }
 
 
+# Maximum time (seconds) `import pipeline` may take in a fresh interpreter
+IMPORT_TIME_BUDGET = 0.5
+
+
+def test_import_time():
+    """Test that importing the pipeline is cheap and loads no engine data."""
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import pipeline\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(elapsed, 'pynini' in sys.modules)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True
+    ).stdout.split()
+    elapsed, pynini_loaded = float(output[0]), output[1] == "True"
+    
+    passed = elapsed < IMPORT_TIME_BUDGET and not pynini_loaded
+    status = "✓ PASS" if passed else "✗ FAIL"
+    print(f"{status}: import pipeline took {elapsed * 1000:.1f} ms "
+          f"(budget {IMPORT_TIME_BUDGET * 1000:.0f} ms), pynini loaded: {pynini_loaded}")
+    
+    return passed
+
+
+def test_streaming():
+    """Test that streaming mode writes one JSONL record per input line, in order."""
+    import tempfile
+    from pipeline import run_stream, translate_singlish
+    
+    sentences = ["mama gedara yanawa", "Oya bath kanawa!", "", "eyala potha kiyawanawa"]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, 'input.jsonl')
+        output_path = os.path.join(tmp, 'output.jsonl')
+        with open(input_path, 'w', encoding='utf-8') as f:
+            for sentence in sentences:
+                f.write(json.dumps({'text': sentence}) + '\n')
+        
+        run_stream(input_path, output_path, field='text', chunk_size=3)
+        
+        with open(output_path, 'r', encoding='utf-8') as f:
+            results = [json.loads(line) for line in f]
+    
+    expected = [translate_singlish(sentence) for sentence in sentences]
+    passed = results == expected
+    status = "✓ PASS" if passed else "✗ FAIL"
+    print(f"{status}: streamed {len(results)} of {len(sentences)} sentences in input order")
+    
+    return passed
+
+
+def test_batch_failures():
+    """Test that a failing sentence does not make batch_translate redo the batch."""
+    import pipeline
+    
+    sentences = ["mama gedara yanawa", "qqq", "oya bath kanawa", "mama qxq yanawa",
+                 "", "qqq", "eyala potha kiyawanawa"]
+    expected = [pipeline.translate_singlish(sentence, engine="trie") for sentence in sentences]
+    
+    # batch_translate must not fall back to translating sentence by sentence
+    calls = []
+    translate_singlish = pipeline.translate_singlish
+    
+    def counting_translate_singlish(*args, **kwargs):
+        calls.append(args)
+        return translate_singlish(*args, **kwargs)
+    
+    pipeline.translate_singlish = counting_translate_singlish
+    try:
+        results = pipeline.batch_translate(sentences, engine="trie")
+    finally:
+        pipeline.translate_singlish = translate_singlish
+    
+    checks = [
+        ("failing sentences get their own error",
+         [result.success for result in results] == [True, False, True, False, True, False, True]
+         and all("Failed to transliterate" in results[i].error for i in (1, 3, 5))),
+        ("batch results match translating each sentence",
+         [result.to_dict() for result in results] == [result.to_dict() for result in expected]),
+        ("the rest of the batch is not redone one sentence at a time", not calls),
+    ]
+    
+    passed = True
+    for name, ok in checks:
+        print(f"{'✓ PASS' if ok else '✗ FAIL'}: {name}")
+        passed = passed and ok
+    return passed
+
+
+def _spans_agree(result):
+    """
+    True if the spans' entries are exactly the entries result.parse used.
+    
+    Every span entry must supply the subject, object or verb features (or
+    the negation), and every filled role must come from some span entry.
+    """
+    parse = result.parse
+    roles = [parse.subject, parse.object, parse.verb]
+    entries = [span.entry for span in result.spans if span.entry is not None]
+    for entry in entries:
+        if entry.role == 'NEGATION':
+            if not parse.negation:
+                return False
+        elif not any(entry.features is role for role in roles):
+            return False
+    return all(any(entry.features is role for entry in entries)
+               for role in roles if role)
+
+
+def test_result_records():
+    """Test that the slotted result records read and serialize like the old dicts."""
+    import pickle
+    from pipeline import translate_singlish
+    from preprocess import preprocess
+    from module1 import transliterate
+    from module2 import lexicon, translate
+    
+    result = translate_singlish("Mama gedara yanawa")
+    expected = {
+        'input': "Mama gedara yanawa",
+        'sinhala': result.sinhala,
+        'english': result.parse.raw_translation,
+        'parse': {
+            'raw_translation': result.parse.raw_translation,
+            'subject': result.parse.subject,
+            'object': result.parse.object,
+            'verb': result.parse.verb,
+            'negation': False,
+        },
+        'success': True,
+        'error': None,
+    }
+    _, metadata = preprocess("Mama gedara yanawa!")
+    punctuated = translate_singlish("Mama gedra yanawa!")
+    
+    checks = [
+        ("to_dict() gives the old pipeline dict", result.to_dict() == expected),
+        ("records compare equal to dicts", result == expected and expected == result),
+        ("dict-style access", result['parse'].get('verb') == result.parse.verb
+         and 'error' in result and result.get('missing') is None),
+        ("JSON round trip", json.loads(json.dumps(result.to_dict())) == result),
+        ("pickle round trip", pickle.loads(pickle.dumps(result)) == result),
+        ("no per-instance dict", not hasattr(result, '__dict__')
+         and not hasattr(result.parse, '__dict__') and not hasattr(metadata, '__dict__')),
+        ("metadata keys", list(metadata) == ['punctuation_map', 'number_map', 'original_text',
+                                             'ascii_converted', 'warnings']),
+        ("spans follow each token", [(punctuated['input'][span.start:span.end], span.corrected)
+                                     for span in punctuated.spans]
+         == [("Mama", "mama"), ("gedra", "gedara"), ("yanawa", "yanawa")]),
+        ("span entries agree with the parse",
+         all(_spans_agree(translate_singlish(text))
+             for text in ["Mama gedra yanawa!", "mama homework karanawa",
+                          "eyala 5 potha, kiyawanawa", "mama ,  gedara",
+                          "mama bath kanne naha", "oya gedara yanawa"])),
+        ("spans do not change the translation",
+         all(translate_singlish(text).parse == translate(transliterate(text))
+             for text in ["Mama gedra yanawa!", "mama homework karanawa",
+                          "eyala 5 potha, kiyawanawa", "mama ,  gedara"])),
+        ("spans stay out of the dict", 'spans' not in result.to_dict()),
+    ]
+    try:
+        result.parse.verb = {}
+        checks.append(("parse result is immutable", False))
+    except AttributeError:
+        checks.append(("parse result is immutable", True))
+    checks.append(("parse shares the compiled lexicon features",
+                   result.parse.subject is lexicon[result.spans[0].sinhala].features
+                   and result.spans[0].entry['role'] == 'SUBJ'))
+    try:
+        result.parse.subject['en'] = 'we'
+        checks.append(("lexicon features are read-only", False))
+    except TypeError:
+        checks.append(("lexicon features are read-only", True))
+    
+    passed = True
+    for name, ok in checks:
+        print(f"{'✓ PASS' if ok else '✗ FAIL'}: {name}")
+        passed = passed and ok
+    
+    return passed
+
+
 def main():
     """Test pipeline on corpus."""
     corpus_path = os.path.join(os.path.dirname(__file__), 'data', 'corpus.json')
@@ -115,4 +302,27 @@ def main():
 
 if __name__ == "__main__":
     main()
+    
+    print("\n" + "="*70)
+    print("STREAMING MODE")
+    print("="*70 + "\n")
+    streaming_passed = test_streaming()
+    
+    print("\n" + "="*70)
+    print("IMPORT TIME BUDGET")
+    print("="*70 + "\n")
+    import_time_passed = test_import_time()
+    
+    print("\n" + "="*70)
+    print("RESULT RECORDS")
+    print("="*70 + "\n")
+    records_passed = test_result_records()
+    
+    print("\n" + "="*70)
+    print("BATCH FAILURES")
+    print("="*70 + "\n")
+    batch_failures_passed = test_batch_failures()
+    
+    sys.exit(0 if streaming_passed and import_time_passed and records_passed
+             and batch_failures_passed else 1)
 
@@ -1,15 +1,100 @@
 import json
-from typing import Dict, Any, List
+import string
+import sys
+from collections.abc import Mapping
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
 # --- Constants ---
 import os
 script_dir = os.path.dirname(os.path.abspath(__file__))
 LEXICON_FILE = os.path.join(script_dir, '..', 'data', 'lexicon.json') 
 
+# Writes a slot of the immutable records below, whose __setattr__ raises
+_set_slot = object.__setattr__
+
+
+class Features(Mapping):
+    """
+    Immutable, slotted view of a word's features (en, pos, tense, ...).
+    
+    Built once per lexicon entry and shared by every parse that uses the
+    word, so it reads like the feature dict translate() used to copy for
+    each hit but cannot be changed through one result.
+    """
+    
+    __slots__ = ('_data',)
+    
+    def __init__(self, data: Dict[str, Any]):
+        _set_slot(self, '_data', data)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable (cannot set '{name}')")
+    
+    def __reduce__(self):
+        return type(self), (self._data,)
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+    
+    def __iter__(self):
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the features as a plain dict, e.g. for JSON."""
+        return dict(self._data)
+
+
+class LexiconEntry(Features):
+    """
+    Compiled lexicon record: reads like the JSON record (role included),
+    with role, pos and en as attributes and features holding the record
+    without role, as it goes into a ParseResult.
+    """
+    
+    __slots__ = ('role', 'pos', 'en', 'features')
+    
+    def __init__(self, data: Dict[str, Any]):
+        data = {sys.intern(key): sys.intern(value) if isinstance(value, str) else value
+                for key, value in data.items()}
+        super().__init__(data)
+        _set_slot(self, 'role', data.get('role'))
+        _set_slot(self, 'pos', data.get('pos'))
+        _set_slot(self, 'en', data.get('en'))
+        _set_slot(self, 'features',
+                  Features({key: value for key, value in data.items() if key != 'role'}))
+
+
+# Features of a role the sentence did not fill
+NO_FEATURES = Features({})
+
+
+def compile_lexicon(raw_lexicon: Dict[str, Dict[str, Any]]) -> Dict[str, LexiconEntry]:
+    """
+    Compile lexicon.json records into LexiconEntry objects.
+    
+    Done once at load time, so translate() does one dict lookup per token
+    and no copying. Sinhala keys and repeated strings (pos, role, tense)
+    are interned.
+    
+    Args:
+        raw_lexicon: Sinhala word -> record, as loaded from lexicon.json
+        
+    Returns:
+        Sinhala word -> LexiconEntry
+    """
+    return {sys.intern(word): LexiconEntry(record) for word, record in raw_lexicon.items()}
+
+
 # --- Module-level variable to hold the lexicon (Data Lookup) ---
 try:
     with open(LEXICON_FILE, 'r', encoding='utf-8') as f:
-        lexicon = json.load(f)
+        lexicon = compile_lexicon(json.load(f))
 except FileNotFoundError:
     print(f"Module 2 ERROR: {LEXICON_FILE} not found. Translation will fail.")
     lexicon = {}
@@ -18,51 +103,188 @@ except json.JSONDecodeError:
     lexicon = {}
 
 
-def translate(sinhala_text: str) -> Dict[str, Any]:
+class ParseResult(Mapping):
+    """
+    Immutable result of translate(), stored in slots instead of a dict.
+    
+    Reads like the dict translate() used to return (result['verb'],
+    result.get('raw_translation')), so Module 3 and other callers work
+    unchanged; to_dict() returns that dict, e.g. for JSON. words holds
+    raw_translation already split into words (not one of the dict keys).
+    """
+    
+    _fields = ('raw_translation', 'subject', 'object', 'verb', 'negation')
+    __slots__ = _fields + ('words',)
+    
+    def __init__(self, raw_translation: str, subject: Mapping, object: Mapping,
+                 verb: Mapping, negation: bool, words: Optional[Tuple[str, ...]] = None):
+        # One slot store per field (translate() builds one of these per sentence)
+        _set_slot(self, 'raw_translation', raw_translation)
+        _set_slot(self, 'subject', subject)
+        _set_slot(self, 'object', object)
+        _set_slot(self, 'verb', verb)
+        _set_slot(self, 'negation', negation)
+        _set_slot(self, 'words', tuple(raw_translation.split()) if words is None else words)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"ParseResult is immutable (cannot set '{name}')")
+    
+    def __reduce__(self):
+        # Pickle through __init__ (results are sent back from worker processes)
+        return ParseResult, tuple(getattr(self, field) for field in self.__slots__)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def __iter__(self):
+        return iter(self._fields)
+    
+    def __len__(self) -> int:
+        return len(self._fields)
+    
+    def __repr__(self) -> str:
+        return f"ParseResult({self.to_dict()!r})"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as the plain dict translate() used to return."""
+        result = {}
+        for field in self._fields:
+            value = getattr(self, field)
+            result[field] = value.to_dict() if isinstance(value, Features) else value
+        return result
+
+
+def translate(sinhala_text: str) -> ParseResult:
     """
-    Translates a clean Sinhala string into a structured English dictionary, 
-    performing the SOV -> SVO structural transformation in the process.
+    Translates a clean Sinhala string into a structured English record
+    (ParseResult, readable as a dict), performing the SOV -> SVO structural
+    transformation in the process.
     
     This function currently handles: SUBJ, OBJ, VERB, and applies the SOV -> SVO 
     transfer rule to the 'raw_translation' field.
     """
     
     if not sinhala_text or not lexicon:
-        return {"raw_translation": "", "subject": {}, "object": {}, "verb": {}, "negation": False}
+        return ParseResult("", NO_FEATURES, NO_FEATURES, NO_FEATURES, False)
 
     tokens: List[str] = sinhala_text.split()
+    return _parse((token, lexicon.get(token)) for token in tokens)
+
+
+def translate_spans(sinhala_text: str, spans: List[Any]) -> ParseResult:
+    """
+    Translates Module 1's output and attaches lexicon entries to its spans.
+    
+    The result is exactly translate(sinhala_text): the parse still works on
+    the whitespace-split Sinhala text, so punctuation and numbers restored
+    by Module 1 and multi-word rules (homework -> ගෙදර වැඩ) behave as they
+    always have. Each parsed token is traced back to the span it came from,
+    and a span's entry attribute is set to the lexicon entry the parse used
+    from it (subject, object, verb or negation), or None if the parse used
+    none, so callers can align output words with input tokens. If a span
+    produced several words the parse used, entry is the last of them.
     
-    # Storage for structured components
-    subject_info: Dict[str, Any] = {}
-    object_info: Dict[str, Any] = {}
-    verb_info: Dict[str, Any] = {}
+    Args:
+        sinhala_text: Module 1's Sinhala output
+        spans: Objects with sinhala and entry attributes (module1's TokenSpan)
+        
+    Returns:
+        ParseResult, as from translate()
+    """
+    tokens = sinhala_text.split()
+    entries = [lexicon.get(token) for token in tokens]
+    used: Dict[str, int] = {}
+    result = _parse(zip(tokens, entries), used)
+    
+    owners = _token_owners(tokens, spans)
+    for span in spans:
+        span.entry = None
+    for index in sorted(used.values()):
+        if owners[index] is not None:
+            owners[index].entry = entries[index]
+    return result
+
+
+# Characters Module 1 restores into its output (punctuation and numbers)
+_DELETE_RESTORED = str.maketrans('', '', string.punctuation + string.digits)
+
+
+def _token_owners(tokens: List[str], spans: List[Any]) -> List[Any]:
+    """
+    Map each whitespace token of Module 1's output to the span it came from.
+    
+    The spans' Sinhala forms, split into words, appear in the output in
+    order, with restored punctuation and digits attached or as tokens of
+    their own. Tokens that match no span word (e.g. a lone "5") map to None.
+    
+    Args:
+        tokens: sinhala_text.split()
+        spans: Module 1's spans for the text
+        
+    Returns:
+        List with the owning span (or None) for each token
+    """
+    words = [(word.translate(_DELETE_RESTORED), span)
+             for span in spans if span.sinhala for word in span.sinhala.split()]
+    owners: List[Any] = []
+    position = 0
+    for token in tokens:
+        if position < len(words) and token.translate(_DELETE_RESTORED) == words[position][0]:
+            owners.append(words[position][1])
+            position += 1
+        else:
+            owners.append(None)
+    return owners
+
+
+def _parse(tokens: Iterable[Tuple[str, Optional[LexiconEntry]]],
+           used: Optional[Dict[str, int]] = None) -> ParseResult:
+    """
+    Parse tokens with their lexicon entries and apply the SOV -> SVO rule.
+    
+    Args:
+        tokens: (token, LexiconEntry or None) pairs, in sentence order
+        used: Optional dict that receives, for each of 'subject', 'object',
+              'verb' and 'negation' the result was built from, the index
+              of the token that supplied it
+    """
+    # Storage for structured components (shared feature views, not copies)
+    subject_info: Features = NO_FEATURES
+    object_info: Features = NO_FEATURES
+    verb_info: Features = NO_FEATURES
     is_negated: bool = False # Negation flag
     
     # Placeholder for collecting modifiers or other complex roles later
-    modifiers: List[Dict[str, Any]] = [] 
+    modifiers: List[Features] = [] 
     
     # 2. Lexical Analysis & 3. Syntactic Parse
-    for token in tokens:
-        if token in lexicon:
-            word_data = lexicon[token]
-            role = word_data.get('role')
-            pos = word_data.get('pos')
+    if used is None:
+        used = {}
+    for index, (token, entry) in enumerate(tokens):
+        if entry is not None:
+            role = entry.role
             
             # 3. Parse and Store: Assign to grammatical role
             if role == 'SUBJ':
                 # Capture all subject features
-                subject_info = {k: v for k, v in word_data.items() if k != 'role'} 
+                subject_info = entry.features
+                used['subject'] = index
             elif role == 'OBJ':
                 # Capture all object features
-                object_info = {k: v for k, v in word_data.items() if k != 'role'}
-            elif pos == 'VERB':
+                object_info = entry.features
+                used['object'] = index
+            elif entry.pos == 'VERB':
                 # Capture all verb features
-                verb_info = {k: v for k, v in word_data.items() if k != 'role'}
+                verb_info = entry.features
+                used['verb'] = index
             elif role == 'NEGATION':
                 is_negated = True
+                used['negation'] = index
             elif role == 'MODIFIER':
                 # Place for future development: handling adjectives/adverbs
-                modifiers.append({k: v for k, v in word_data.items() if k != 'role'})
+                modifiers.append(entry.features)
             
         else:
             # When integrating, Module 1 should ensure all tokens are Sinhala. 
@@ -85,13 +307,7 @@ def translate(sinhala_text: str) -> Dict[str, Any]:
         # Note: If we had a list of modifiers, we'd insert them here before the object.
         ordered_parts.append(object_info['en'])
     
-    # 5. Generate Output Dictionary (The final deliverable structure for Module 3)
-    translation_dict = {
-        "raw_translation": " ".join(ordered_parts), 
-        "subject": subject_info,
-        "object": object_info,
-        "verb": verb_info,
-        "negation": is_negated
-    }
-    
-    return translation_dict
\ No newline at end of file
+    # 5. Generate Output Record (The final deliverable structure for Module 3)
+    words = tuple(word for part in ordered_parts for word in part.split())
+    return ParseResult(" ".join(ordered_parts), subject_info, object_info,
+                       verb_info, is_negated, words)
\ No newline at end of file
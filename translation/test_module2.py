@@ -43,7 +43,7 @@ def run_tests():
         print(f"  Expected Fluent Output (For Module 3): {reference}")
         print("  Module 2 SVO Output (Raw English):", output_dict.get('raw_translation'))
         print("  Module 2 Output (Structured Dictionary):")
-        print(json.dumps(output_dict, indent=4, ensure_ascii=False))
+        print(json.dumps(output_dict.to_dict(), indent=4, ensure_ascii=False))
         
         # Simple status check
         if output_dict.get('subject') and output_dict.get('verb'):
@@ -5,60 +5,247 @@ Student 1
 This script compiles the Singlish-to-Sinhala transliteration rules from
 singlish_rules.json into an optimized FST binary file (transliterate.fst).
 
+Next to the FST it writes a manifest (transliterate.fst.manifest.json) that
+records the SHA-256 of the rules file and the builder version the FST was
+compiled from. If neither has changed since the last build, the build is
+skipped. module1 uses the same manifest to detect a stale FST at load time.
+
+With --const it also writes transliterate.const.fst: the same machine,
+input-label sorted and stored in OpenFST's immutable "const" format. It is
+read as a few contiguous arrays instead of per-state vectors, and since it
+is never modified its pages stay shared between forked worker processes.
+module1 uses it instead of the vector FST when it is present and current.
+
 Usage:
-    python build_fst.py
+    python build_fst.py           # Rebuild only if the rules changed
+    python build_fst.py --force   # Always rebuild
+    python build_fst.py --const   # Also emit the const-format FST
 
 Output:
-    transliterate.fst - Compiled FST model
+    transliterate.fst               - Compiled FST model
+    transliterate.const.fst         - Arc-sorted const FST (with --const)
+    transliterate.fst.manifest.json - Build manifest
 """
 
-import pynini
+import contextlib
 import json
 import os
+import tempfile
+from typing import Callable, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: builds are not locked against each other
+    fcntl = None
+
+from token_cache import file_sha256
+
+# Bump this whenever the compilation steps below change, so existing FSTs
+# are rebuilt even if singlish_rules.json is unchanged
+BUILDER_VERSION = "2"
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+RULES_PATH = os.path.join(script_dir, '..', 'data', 'singlish_rules.json')
+FST_PATH = os.path.join(script_dir, "transliterate.fst")
+CONST_FST_PATH = os.path.join(script_dir, "transliterate.const.fst")
+MANIFEST_PATH = FST_PATH + ".manifest.json"
+LOCK_PATH = FST_PATH + ".lock"
+
+
+def expected_manifest(rules_path: str = RULES_PATH) -> Dict[str, str]:
+    """
+    Describe the inputs an up-to-date FST must have been built from.
+
+    Returns:
+        Dictionary with the rules file digest and builder version
+    """
+    return {
+        'rules_sha256': file_sha256(rules_path),
+        'builder_version': BUILDER_VERSION,
+    }
+
+
+def read_manifest(manifest_path: str = MANIFEST_PATH) -> Optional[Dict]:
+    """Read the build manifest, or return None if it is missing or unreadable."""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def stale_reason(rules_path: str = RULES_PATH, fst_path: str = FST_PATH,
+                 manifest_path: str = MANIFEST_PATH) -> Optional[str]:
+    """
+    Check whether the compiled FST is out of date.
+
+    Returns:
+        A human-readable reason if the FST must be rebuilt, or None if it is current
+    """
+    if not os.path.exists(fst_path):
+        return "transliterate.fst does not exist"
+
+    manifest = read_manifest(manifest_path)
+    if manifest is None:
+        return "no build manifest found"
+
+    for key, value in expected_manifest(rules_path).items():
+        if manifest.get(key) != value:
+            return f"{key} changed since the last build"
+
+    if manifest.get('fst_sha256') != file_sha256(fst_path):
+        return "transliterate.fst was modified after it was built"
+
+    return None
+
+
+def const_fst_current(const_fst_path: str = CONST_FST_PATH,
+                      manifest_path: str = MANIFEST_PATH) -> bool:
+    """
+    Check whether the const FST exists and belongs to the current build.
+
+    Call this after stale_reason() has confirmed the vector FST is current.
+    """
+    if not os.path.exists(const_fst_path):
+        return False
+    manifest = read_manifest(manifest_path) or {}
+    return manifest.get('const_fst_sha256') == file_sha256(const_fst_path)
+
+
+def _write_atomic(path: str, write: Callable[[str], None]):
+    """
+    Write a file via a temporary file in the same directory, then rename it.
+
+    Readers never see a partial file, and the temporary name is unique, so
+    concurrent builds do not write into each other's files.
+
+    Args:
+        path: Final file path
+        write: Called with the temporary path to write to
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path),
+                                    prefix=os.path.basename(path) + ".", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _write_manifest(manifest: Dict, path: str = MANIFEST_PATH):
+    """Write the build manifest atomically."""
+    def write(tmp_path):
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+    _write_atomic(path, write)
+
+
+@contextlib.contextmanager
+def _build_lock(lock_path: str = LOCK_PATH):
+    """Hold an exclusive lock file so only one process builds at a time."""
+    with open(lock_path, 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def build_fst(force: bool = False, const: bool = False, verbose: bool = True) -> bool:
+    """
+    Build and compile the FST from singlish_rules.json.
+
+    The build holds a lock file, and staleness is checked under the lock,
+    so processes that find the FST stale at the same time build it once.
+
+    Args:
+        force: If True, rebuild even if the manifest says the FST is current
+        const: If True, also write the arc-sorted const FST
+        verbose: If True, print build progress
+
+    Returns:
+        True if the FST was rebuilt, False if the build was skipped
+    """
+    log = print if verbose else (lambda *args, **kwargs: None)
+
+    with _build_lock():
+        reason = stale_reason()
+        if reason is None and not force and (not const or const_fst_current()):
+            log("✓ transliterate.fst is up to date (rules unchanged), skipping build")
+            return False
+
+        import pynini
+
+        log(f"Building FST from singlish_rules.json ({reason or 'forced rebuild'})...")
+
+        # 1. Read singlish_rules.json
+        with open(RULES_PATH, 'r', encoding='utf-8') as f:
+            rules_dict = json.load(f)
+
+        log(f"Loaded {len(rules_dict)} transliteration rules")
+
+        # 2. Convert JSON dictionary to list of (sinlish, sinhala) tuples
+        # Important: Rules are already ordered longest to shortest in the JSON
+        rules_list = [(k, v) for k, v in rules_dict.items()]
+
+        # 3. Create FST using string_map and make it handle greedily
+        log("Creating FST with pynini.string_map...")
+        # Create the base transducer
+        fst = pynini.string_map(rules_list)
+
+        # Create a closure to match any sequence of rules (greedy longest match)
+        fst = pynini.closure(fst)
+
+        # 4. Optimize the FST, then sort arcs by input label so composition
+        # can binary-search them
+        log("Optimizing FST...")
+        fst.optimize()
+        fst.arcsort(sort_type="ilabel")
+
+        # 5. Write the compiled FST to disk
+        log(f"Writing FST to {FST_PATH}...")
+        _write_atomic(FST_PATH, fst.write)
+
+        if const:
+            import pywrapfst
+
+            log(f"Writing const FST to {CONST_FST_PATH}...")
+            _write_atomic(CONST_FST_PATH, pywrapfst.convert(fst, fst_type="const").write)
+        elif os.path.exists(CONST_FST_PATH):
+            # A const FST from an older build would no longer match
+            os.remove(CONST_FST_PATH)
+
+        # 6. Record what the FST was built from
+        manifest = expected_manifest()
+        manifest['fst_sha256'] = file_sha256(FST_PATH)
+        if const:
+            manifest['const_fst_sha256'] = file_sha256(CONST_FST_PATH)
+        manifest['rule_count'] = len(rules_dict)
+        _write_manifest(manifest)
+
+    log("✓ FST compilation complete!")
+    log(f"  Output: {FST_PATH}")
+    log(f"  Rules: {len(rules_dict)}")
+    return True
 
-def build_fst():
-    """Build and compile the FST from singlish_rules.json."""
-    
-    # Get the path to singlish_rules.json (in data directory)
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    rules_path = os.path.join(script_dir, '..', 'data', 'singlish_rules.json')
-    
-    print("Building FST from singlish_rules.json...")
-    
-    # 1. Read singlish_rules.json
-    with open(rules_path, 'r', encoding='utf-8') as f:
-        rules_dict = json.load(f)
-    
-    print(f"Loaded {len(rules_dict)} transliteration rules")
-    
-    # 2. Convert JSON dictionary to list of (sinlish, sinhala) tuples
-    # Important: Rules are already ordered longest to shortest in the JSON
-    rules_list = [(k, v) for k, v in rules_dict.items()]
-    
-    # 3. Create FST using string_map and make it handle greedily
-    print("Creating FST with pynini.string_map...")
-    # Create the base transducer
-    fst = pynini.string_map(rules_list)
-    
-    # Create a closure to match any sequence of rules (greedy longest match)
-    fst = pynini.closure(fst)
-    
-    # 4. Optimize the FST
-    print("Optimizing FST...")
-    fst.optimize()
-    
-    # 5. Write the compiled FST to disk
-    output_path = os.path.join(script_dir, "transliterate.fst")
-    print(f"Writing FST to {output_path}...")
-    fst.write(output_path)
-    
-    print("✓ FST compilation complete!")
-    print(f"  Output: {output_path}")
-    print(f"  Rules: {len(rules_dict)}")
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compile singlish_rules.json into transliterate.fst')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='Rebuild even if the rules have not changed')
+    parser.add_argument('-c', '--const', action='store_true',
+                        help='Also write an arc-sorted const FST (transliterate.const.fst)')
+    args = parser.parse_args()
+
     try:
-        build_fst()
+        build_fst(force=args.force, const=args.const)
     except FileNotFoundError as e:
         print(f"Error: Could not find singlish_rules.json")
         print(f"Make sure the file exists in the data/ directory.")
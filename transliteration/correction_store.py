@@ -0,0 +1,192 @@
+"""
+Module 1: Persistent Spell Correction Store
+Student 1
+
+The same spelling mistakes (gedra, kiyawanwa, iskol) come up again and again,
+but every new process starts with an empty FuzzyMatcher and recomputes their
+edit distances. CorrectionStore keeps FuzzyMatcher.find_correction() results
+in an SQLite file shared by all processes on a host.
+
+Rows are keyed by (token, min_similarity, vocabulary hash). The vocabulary
+hash is the SHA-256 of singlish_rules.json (or of a custom vocabulary), so
+editing the rules makes every old row unreachable. Rows of other hashes are
+left alone: processes with different vocabularies may share one file.
+
+The database runs in WAL mode, so any number of worker processes can read
+while one writes. Each process opens its own connection on first use (an
+SQLite connection must not be used across fork), so a store created before
+a worker pool forks is safe to use in the workers. New results are buffered
+and written in batches; pool workers, which skip atexit handlers, must call
+flush() when they finish a task.
+
+Usage:
+    from correction_store import CorrectionStore
+    store = CorrectionStore("corrections.sqlite3", vocabulary_hash)
+    found, match = store.get("gedra", 0.65)
+    if not found:
+        store.put("gedra", 0.65, ("gedara", 0.83))
+    store.flush()
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_BATCH_SIZE = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS corrections (
+    token TEXT NOT NULL,
+    min_similarity REAL NOT NULL,
+    vocab_hash TEXT NOT NULL,
+    corrected TEXT,
+    confidence REAL,
+    PRIMARY KEY (token, min_similarity, vocab_hash)
+)
+"""
+
+
+class CorrectionStore:
+    """
+    SQLite-backed cache of spell corrections, safe to share between processes.
+
+    A stored correction of None records that the token had no match.
+    """
+
+    def __init__(self, path: str, vocabulary_hash: str,
+                 batch_size: int = DEFAULT_BATCH_SIZE, timeout: float = 30.0):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: SQLite database file
+            vocabulary_hash: Digest of the vocabulary the corrections come from
+            batch_size: Number of new results buffered before they are written
+            timeout: Seconds to wait for another process's write lock
+        """
+        self.path = path
+        self.vocabulary_hash = vocabulary_hash
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self._pending: Dict[Tuple[str, float], Optional[Tuple[str, float]]] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+        atexit.register(self.close)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """
+        Return this process's connection, opening it on first use (caller holds the lock).
+
+        A connection inherited through fork belongs to the parent: it is left
+        untouched, along with the parent's buffered rows, and a new one is
+        opened. Returns None once the store is closed.
+        """
+        if self._closed:
+            return None
+        if self._pid != os.getpid():
+            if self._pid is not None:
+                # Forked child: the parent writes its own buffer
+                self._pending.clear()
+            self._conn = sqlite3.connect(self.path, timeout=self.timeout,
+                                         check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            with self._conn:
+                self._conn.execute(_SCHEMA)
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, token: str, min_similarity: float) -> Tuple[bool, Optional[Tuple[str, float]]]:
+        """
+        Look up a stored correction.
+
+        Returns:
+            Tuple of (found, correction); correction is (word, confidence)
+            or None if the token was stored as having no match
+        """
+        with self._lock:
+            conn = self._connection()
+            if (token, min_similarity) in self._pending:
+                self.hits += 1
+                return True, self._pending[(token, min_similarity)]
+            if conn is None:
+                self.misses += 1
+                return False, None
+            row = conn.execute(
+                "SELECT corrected, confidence FROM corrections "
+                "WHERE token = ? AND min_similarity = ? AND vocab_hash = ?",
+                (token, min_similarity, self.vocabulary_hash),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            return True, (row[0], row[1]) if row[0] is not None else None
+
+    def put(self, token: str, min_similarity: float,
+            correction: Optional[Tuple[str, float]]):
+        """Buffer a correction (or None for no match), writing once the batch is full."""
+        with self._lock:
+            if self._connection() is None:
+                return
+            self._pending[(token, min_similarity)] = correction
+            if len(self._pending) >= self.batch_size:
+                self._write_pending()
+
+    def flush(self):
+        """Write all buffered corrections."""
+        with self._lock:
+            self._write_pending()
+
+    def _write_pending(self):
+        """Write the buffer in one transaction (caller holds the lock)."""
+        conn = self._connection()
+        if not self._pending or conn is None:
+            return
+        rows = [
+            (token, min_similarity, self.vocabulary_hash) +
+            (correction if correction is not None else (None, None))
+            for (token, min_similarity), correction in self._pending.items()
+        ]
+        with conn:
+            # Another process may have stored the same token meanwhile
+            conn.executemany(
+                "INSERT OR IGNORE INTO corrections VALUES (?, ?, ?, ?, ?)", rows
+            )
+        self.writes += len(rows)
+        self._pending.clear()
+
+    def close(self):
+        """Flush and close the database."""
+        with self._lock:
+            if self._closed:
+                return
+            if self._pid == os.getpid():
+                self._write_pending()
+                self._conn.close()
+            self._conn = None
+            self._closed = True
+        atexit.unregister(self.close)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return store statistics.
+
+        Returns:
+            Dictionary with hits, misses, writes, pending and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'pending': len(self._pending),
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
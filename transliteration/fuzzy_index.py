@@ -0,0 +1,528 @@
+"""
+Candidate Indexes for Fuzzy Matching
+Student 1
+
+FuzzyMatcher normally scores every vocabulary word within ±2 characters of
+the query's length. The indexes in this module find the vocabulary words
+within a given edit distance of a query without scoring the whole bucket.
+
+Every index exposes the same method:
+
+    search(word, max_distance) -> List[Tuple[candidate, distance]]
+
+returning each vocabulary word whose Levenshtein distance to word is at most
+max_distance, together with that distance. FuzzyMatcher then applies its
+usual length window, similarity threshold and tie-breaking to the result.
+
+    BKTree       - metric trees per word length, pruned by the triangle inequality
+    SymSpellIndex - precomputed deletion variants, bounded search radius
+    QGramIndex   - q-gram posting lists with the count filter
+    LevenshteinAutomatonIndex - pynini composition with a k-edit transducer
+"""
+
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree: a metric tree over edit distance.
+
+    Each node stores a word and its children keyed by their distance to that
+    word. By the triangle inequality, a query within radius r of some word
+    can only lie under children whose key is within r of the query's
+    distance to the node, so most of the tree is never visited.
+
+    Words are kept in one tree per length, so a search only enters the
+    trees for lengths within the radius (and the caller's length window).
+    Each node also records its largest child key: a node further than
+    radius plus that key from the query can neither match nor lead to a
+    match, so its distance is computed with that cap and abandoned early.
+    """
+
+    def __init__(self, words: Iterable[str], distance: Callable[[str, str, int], int]):
+        """
+        Build the tree.
+
+        Args:
+            words: Vocabulary words (duplicates are ignored)
+            distance: Bounded metric distance(s1, s2, max_distance), returning
+                      max_distance + 1 for anything further (e.g.
+                      bounded_levenshtein_distance)
+        """
+        self.distance = distance
+        # Length -> root node; a node is [word, {key: child}, largest key]
+        self.roots: Dict[int, list] = {}
+        self.sizes: Counter = Counter()
+        self.size = 0
+        self.queries = 0
+        self.length_candidates = 0
+        self.visited = 0
+
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str):
+        """Insert a word into the tree."""
+        node = self.roots.get(len(word))
+        if node is None:
+            self.roots[len(word)] = [word, {}, 0]
+            self.sizes[len(word)] += 1
+            self.size += 1
+            return
+
+        while True:
+            # Same-length words are at most len(word) edits apart
+            d = self.distance(word, node[0], len(word))
+            if d == 0:
+                return
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = [word, {}, 0]
+                if d > node[2]:
+                    node[2] = d
+                self.sizes[len(word)] += 1
+                self.size += 1
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int, min_length: int = 0,
+               max_length: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Find all words within max_distance of word.
+
+        Args:
+            word: Query word
+            max_distance: Search radius (inclusive)
+            min_length: Skip words shorter than this
+            max_length: Skip words longer than this (None: no limit)
+
+        Returns:
+            List of (candidate, distance) tuples, in no particular order
+        """
+        if max_distance < 0:
+            return []
+
+        low_length = max(min_length, len(word) - max_distance)
+        high_length = len(word) + max_distance
+        if max_length is not None:
+            high_length = min(high_length, max_length)
+
+        distance = self.distance
+        results = []
+        lengths = [length for length in self.roots if low_length <= length <= high_length]
+        stack = [self.roots[length] for length in lengths]
+        visited = len(stack)
+        while stack:
+            node_word, children, max_key = stack.pop()
+            cap = max_distance + max_key
+            d = distance(word, node_word, cap)
+            if d <= max_distance:
+                results.append((node_word, d))
+            if d > cap:
+                continue
+            low, high = d - max_distance, d + max_distance
+            for key, child in children.items():
+                if low <= key <= high:
+                    stack.append(child)
+                    visited += 1
+
+        self.queries += 1
+        self.length_candidates += sum(self.sizes[length] for length in lengths)
+        self.visited += visited
+        return results
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return tree size and pruning statistics.
+
+        Returns:
+            Dictionary with the number of words, and per search so far:
+            queries, length_candidates (words in the trees searched),
+            visited (nodes whose distance was computed) and pruned_rate
+            (fraction of length candidates never visited)
+        """
+        return {
+            'words': self.size,
+            'queries': self.queries,
+            'length_candidates': self.length_candidates,
+            'visited': self.visited,
+            'pruned_rate': (1 - self.visited / self.length_candidates
+                            if self.length_candidates else 0.0),
+        }
+
+
+def deletion_variants(word: str, max_deletes: int) -> Set[str]:
+    """
+    All strings obtainable from word by deleting up to max_deletes characters.
+
+    Args:
+        word: Source word
+        max_deletes: Maximum number of deleted characters
+
+    Returns:
+        Set of variants, including word itself
+    """
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_deletes):
+        next_frontier = set()
+        for variant in frontier:
+            for i in range(len(variant)):
+                shorter = variant[:i] + variant[i + 1:]
+                if shorter not in variants:
+                    next_frontier.add(shorter)
+        variants |= next_frontier
+        frontier = next_frontier
+    return variants
+
+
+class SymSpellIndex:
+    """
+    Symmetric-delete index (SymSpell).
+
+    Every vocabulary word is stored under each string obtained by deleting up
+    to max_distance of its characters. If two words are within edit distance
+    k, deleting at most k characters from each yields a common string, so a
+    lookup only needs the query's own deletion variants plus a distance check
+    on the handful of words found under them.
+
+    The number of deletions can also be chosen per word length, so short
+    words, which only tolerate a few edits, do not pay for the longest one.
+    """
+
+    def __init__(self, words: Iterable[str], distance: Callable[[str, str, int], int],
+                 max_distance: int = 2,
+                 length_distance: Optional[Callable[[int], int]] = None):
+        """
+        Build the index.
+
+        Args:
+            words: Vocabulary words (duplicates are ignored)
+            distance: Bounded metric distance(a, b, max_distance) used to verify
+                      candidates; any value above max_distance means "too far"
+            max_distance: Deletions stored for every word
+            length_distance: Optional function giving the deletions stored
+                      for a word of each length instead of max_distance
+        """
+        self.distance = distance
+        self.deletes: Dict[str, List[str]] = {}
+        self.size = 0
+        # Length -> deletions stored for words of that length
+        self.depths: Dict[int, int] = {}
+
+        for word in dict.fromkeys(words):
+            self.size += 1
+            depth = self.depths.get(len(word))
+            if depth is None:
+                depth = max_distance if length_distance is None else length_distance(len(word))
+                self.depths[len(word)] = depth
+            for variant in deletion_variants(word, depth):
+                self.deletes.setdefault(variant, []).append(word)
+
+        # Largest search radius the index can answer for every word
+        self.max_distance = max_distance if length_distance is None else max(
+            self.depths.values(), default=0)
+
+    def covers(self, length: int, max_distance: int) -> bool:
+        """
+        Whether search() finds every word of a length within max_distance.
+
+        Args:
+            length: Candidate word length
+            max_distance: Search radius
+
+        Returns:
+            True if words of that length were stored with enough deletions
+            (or there are none)
+        """
+        return self.depths.get(length, max_distance) >= max_distance
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[str, int]]:
+        """
+        Find words within max_distance of word.
+
+        Words of a length that covers() rejects for max_distance may be
+        missed; everything returned is within max_distance.
+
+        Args:
+            word: Query word
+            max_distance: Search radius (inclusive)
+
+        Returns:
+            List of (candidate, distance) tuples, in no particular order
+        """
+        if max_distance < 0:
+            return []
+
+        candidates = set()
+        for variant in deletion_variants(word, max_distance):
+            candidates.update(self.deletes.get(variant, ()))
+
+        results = []
+        for candidate in candidates:
+            if abs(len(candidate) - len(word)) > max_distance:
+                continue
+            d = self.distance(word, candidate, max_distance)
+            if d <= max_distance:
+                results.append((candidate, d))
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of indexed words, delete keys and stored postings."""
+        return {
+            'words': self.size,
+            'delete_keys': len(self.deletes),
+            'postings': sum(len(words) for words in self.deletes.values()),
+        }
+
+
+# Padding added before/after a word so its first and last characters appear
+# in as many q-grams as the others
+QGRAM_START = "\x02"
+QGRAM_END = "\x03"
+
+
+def qgrams(word: str, q: int) -> Counter:
+    """
+    Count the q-grams of a word padded with q - 1 sentinels on each side.
+
+    A word of length n has n + q - 1 padded q-grams.
+
+    Args:
+        word: Source word
+        q: Gram length
+
+    Returns:
+        Counter mapping each q-gram to its number of occurrences
+    """
+    padded = QGRAM_START * (q - 1) + word + QGRAM_END * (q - 1)
+    return Counter(padded[i:i + q] for i in range(len(padded) - q + 1))
+
+
+class QGramIndex:
+    """
+    Inverted index from character q-grams to vocabulary words.
+
+    One edit changes at most q of a word's padded q-grams, so two words
+    within edit distance k share at least max(len) + q - 1 - k*q q-grams
+    (the count filter). A lookup counts shared q-grams through the posting
+    lists and only computes the edit distance for words that pass.
+    """
+
+    def __init__(self, words: Iterable[str], distance: Callable[[str, str, int], int],
+                 q: int = 2):
+        """
+        Build the index.
+
+        Args:
+            words: Vocabulary words (duplicates are ignored)
+            distance: Bounded metric distance(a, b, max_distance) used to verify
+                      candidates; any value above max_distance means "too far"
+            q: Gram length (2 for bigrams, 3 for trigrams)
+        """
+        if q < 1:
+            raise ValueError(f"q must be at least 1, not {q}")
+
+        self.distance = distance
+        self.q = q
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        self.words: List[str] = []
+        self.by_length: Dict[int, List[int]] = {}
+        self.queries = 0
+        self.length_candidates = 0
+        self.candidates = 0
+        self.matches = 0
+
+        for word in dict.fromkeys(words):
+            word_id = len(self.words)
+            self.words.append(word)
+            self.by_length.setdefault(len(word), []).append(word_id)
+            for gram, count in qgrams(word, q).items():
+                self.postings.setdefault(gram, []).append((word_id, count))
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[str, int]]:
+        """
+        Find all words within max_distance of word.
+
+        Args:
+            word: Query word
+            max_distance: Search radius (inclusive)
+
+        Returns:
+            List of (candidate, distance) tuples, in no particular order
+        """
+        if max_distance < 0:
+            return []
+
+        q = self.q
+        length = len(word)
+        lengths = [n for n in range(max(0, length - max_distance), length + max_distance + 1)
+                   if n in self.by_length]
+
+        # Words that share no q-gram with the query can still pass the count
+        # filter when the edit bound is loose enough
+        candidates: Set[int] = set()
+        for n in lengths:
+            if max(length, n) + q - 1 - max_distance * q <= 0:
+                candidates.update(self.by_length[n])
+
+        shared: Dict[int, int] = {}
+        for gram, count in qgrams(word, q).items():
+            for word_id, word_count in self.postings.get(gram, ()):
+                shared[word_id] = shared.get(word_id, 0) + min(count, word_count)
+
+        for word_id, common in shared.items():
+            n = len(self.words[word_id])
+            if abs(n - length) <= max_distance and \
+                    common >= max(length, n) + q - 1 - max_distance * q:
+                candidates.add(word_id)
+
+        results = []
+        for word_id in candidates:
+            candidate = self.words[word_id]
+            d = self.distance(word, candidate, max_distance)
+            if d <= max_distance:
+                results.append((candidate, d))
+
+        self.queries += 1
+        self.length_candidates += sum(len(self.by_length[n]) for n in lengths)
+        self.candidates += len(candidates)
+        self.matches += len(results)
+        return results
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return index size and pruning statistics.
+
+        Returns:
+            Dictionary with the number of indexed words, q-grams and postings,
+            and per search so far: queries, length_candidates (words a length
+            filter alone would verify), candidates (words left after the count
+            filter), matches, and pruned_rate (fraction of length candidates
+            the count filter removed)
+        """
+        return {
+            'words': len(self.words),
+            'grams': len(self.postings),
+            'postings': sum(len(entries) for entries in self.postings.values()),
+            'queries': self.queries,
+            'length_candidates': self.length_candidates,
+            'candidates': self.candidates,
+            'matches': self.matches,
+            'pruned_rate': (1 - self.candidates / self.length_candidates
+                            if self.length_candidates else 0.0),
+        }
+
+
+# Stands in for query characters that occur in no vocabulary word: it can
+# only be deleted or substituted, exactly like the original character
+UNKNOWN_CHAR = "\x01"
+
+
+class LevenshteinAutomatonIndex:
+    """
+    Spell correction by FST composition (requires pynini).
+
+    The vocabulary is compiled into one acceptor. For a radius k, a weighted
+    edit transducer with k + 1 states maps a string to every string within k
+    edits: each state copies characters at cost 0 and moves to the next
+    state on an insertion, deletion or substitution at cost 1. Composing
+
+        query ∘ edit transducer ∘ vocabulary
+
+    leaves exactly the vocabulary words within k edits, and determinizing
+    its output side (tropical semiring) gives each word its minimum cost,
+    i.e. its edit distance.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        """
+        Compile the vocabulary acceptor.
+
+        Args:
+            words: Vocabulary words (duplicates are ignored)
+
+        Raises:
+            ImportError: If pynini is not installed
+        """
+        import pynini
+
+        self._pynini = pynini
+        self.words = list(dict.fromkeys(words))
+        self.alphabet = sorted({c for word in self.words for c in word} - {UNKNOWN_CHAR})
+        self._known = set(self.alphabet)
+        self._edit_transducers: Dict[int, "pynini.Fst"] = {}
+
+        self.vocabulary_fst = pynini.string_map(
+            self.words, input_token_type="utf8", output_token_type="utf8"
+        ).optimize()
+        self.vocabulary_fst.arcsort(sort_type="ilabel")
+
+    def edit_transducer(self, max_distance: int):
+        """
+        Return the transducer allowing up to max_distance unit-cost edits.
+
+        Built on first use for each distance. Labels are Unicode code points
+        (utf8 token type); label 0 is epsilon.
+        """
+        fst = self._edit_transducers.get(max_distance)
+        if fst is not None:
+            return fst
+
+        pynini = self._pynini
+        fst = pynini.Fst()
+        free = pynini.Weight.one(fst.weight_type())
+        edit = pynini.Weight(fst.weight_type(), 1)
+        outputs = [ord(c) for c in self.alphabet]
+        inputs = outputs + [ord(UNKNOWN_CHAR)]
+
+        states = [fst.add_state() for _ in range(max_distance + 1)]
+        fst.set_start(states[0])
+        for edits, state in enumerate(states):
+            fst.set_final(state)
+            for label in outputs:
+                fst.add_arc(state, pynini.Arc(label, label, free, state))
+            if edits == max_distance:
+                continue
+            next_state = states[edits + 1]
+            for label in inputs:
+                # Deletion and substitution
+                fst.add_arc(state, pynini.Arc(label, 0, edit, next_state))
+                for output in outputs:
+                    if output != label:
+                        fst.add_arc(state, pynini.Arc(label, output, edit, next_state))
+            for output in outputs:
+                # Insertion
+                fst.add_arc(state, pynini.Arc(0, output, edit, next_state))
+
+        fst.arcsort(sort_type="olabel")
+        self._edit_transducers[max_distance] = fst
+        return fst
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[str, int]]:
+        """
+        Find all words within max_distance of word.
+
+        Args:
+            word: Query word
+            max_distance: Search radius (inclusive)
+
+        Returns:
+            List of (candidate, distance) tuples, in no particular order
+        """
+        if max_distance < 0 or not self.words:
+            return []
+
+        pynini = self._pynini
+        query = ''.join(c if c in self._known else UNKNOWN_CHAR for c in word)
+        lattice = pynini.compose(
+            pynini.compose(pynini.accep(pynini.escape(query), token_type="utf8"),
+                           self.edit_transducer(max_distance)),
+            self.vocabulary_fst,
+        )
+        lattice.project("output").rmepsilon()
+        lattice = pynini.determinize(lattice)
+
+        paths = lattice.paths(input_token_type="utf8", output_token_type="utf8")
+        return [(candidate, int(float(weight))) for _, candidate, weight in paths.items()]
@@ -6,9 +6,33 @@ This module helps correct common typing errors by finding the closest matching
 words from the transliteration rules when exact matches fail.
 """
 
+import hashlib
+import heapq
 import json
 import os
-from typing import List, Tuple, Optional, Dict
+from typing import Callable, List, Tuple, Optional, Dict
+
+from fuzzy_index import BKTree, SymSpellIndex, QGramIndex, LevenshteinAutomatonIndex
+from fuzzy_vector import VectorScorer, NUMPY_AVAILABLE
+from token_cache import DEFAULT_CACHE_SIZE, file_sha256
+from correction_store import CorrectionStore
+
+# Candidate search strategies accepted by FuzzyMatcher(index=...)
+INDEX_TYPES = ("length", "bktree", "symspell", "qgram", "automaton")
+
+# Default limit on the deletions the "symspell" index stores per word: a
+# 20-letter word stored at distance 8 alone has 260k deletion variants
+SYMSPELL_MAX_DISTANCE = 4
+
+RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          '..', 'data', 'singlish_rules.json')
+
+# Patterns shorter than this fit in one machine word and use the
+# bit-parallel kernel; longer ones fall back to the DP
+BIT_PARALLEL_MAX_LENGTH = 64
+
+# (pattern length, character -> bit mask of its positions in the pattern)
+PatternMasks = Tuple[int, Dict[str, int]]
 
 
 def levenshtein_distance(s1: str, s2: str) -> int:
@@ -46,6 +70,156 @@ def levenshtein_distance(s1: str, s2: str) -> int:
     return previous_row[-1]
 
 
+def bounded_levenshtein_distance(s1: str, s2: str, max_distance: int) -> int:
+    """
+    Calculate the Levenshtein distance, giving up once it exceeds max_distance.
+    
+    Only the diagonal band of the DP matrix within max_distance of the main
+    diagonal is filled (Ukkonen's cut-off), and the computation stops as soon
+    as every cell of a row exceeds the bound. Common prefixes and suffixes are
+    stripped first since they never change the distance.
+    
+    Args:
+        s1: First string
+        s2: Second string
+        max_distance: Largest distance of interest
+        
+    Returns:
+        The exact distance if it is at most max_distance, otherwise max_distance + 1
+    """
+    over = max_distance + 1
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    if len(s1) - len(s2) > max_distance:
+        return over
+    
+    # Trim the common prefix and suffix
+    start = 0
+    end1, end2 = len(s1), len(s2)
+    while start < end2 and s1[start] == s2[start]:
+        start += 1
+    while end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    s1, s2 = s1[start:end1], s2[start:end2]
+    n1, n2 = len(s1), len(s2)
+    
+    if n2 == 0:
+        return n1 if n1 <= max_distance else over
+    
+    # Cells outside the band hold `over`, which can never be undercut by a
+    # path that stays within the bound
+    previous_row = [j if j <= max_distance else over for j in range(n2 + 1)]
+    current_row = [over] * (n2 + 1)
+    
+    for i in range(1, n1 + 1):
+        c1 = s1[i - 1]
+        low = i - max_distance if i > max_distance else 1
+        high = i + max_distance if i + max_distance < n2 else n2
+        
+        left = i if low == 1 and i < over else over
+        current_row[low - 1] = left
+        row_min = left
+        for j in range(low, high + 1):
+            # Cost of insertions, deletions, or substitutions
+            cost = previous_row[j - 1] + (c1 != s2[j - 1])
+            insertion = previous_row[j] + 1
+            if insertion < cost:
+                cost = insertion
+            if left + 1 < cost:
+                cost = left + 1
+            current_row[j] = left = cost
+            if cost < row_min:
+                row_min = cost
+        
+        if row_min > max_distance:
+            return over
+        previous_row, current_row = current_row, previous_row
+    
+    distance = previous_row[n2]
+    return distance if distance <= max_distance else over
+
+
+def pattern_masks(pattern: str) -> PatternMasks:
+    """
+    Precompute the per-character bit masks used by bit_parallel_distance().
+    
+    Args:
+        pattern: String the masks describe
+        
+    Returns:
+        Tuple of (pattern length, dict mapping each character to a bit mask
+        with bit i set where pattern[i] is that character)
+    """
+    masks: Dict[str, int] = {}
+    for i, c in enumerate(pattern):
+        masks[c] = masks.get(c, 0) | (1 << i)
+    return len(pattern), masks
+
+
+def bit_parallel_distance(text: str, pattern: str, masks: Optional[PatternMasks] = None,
+                          max_distance: Optional[int] = None) -> int:
+    """
+    Calculate the Levenshtein distance with Myers' bit-vector algorithm.
+    
+    One column of the DP matrix is held as bit vectors of +1/-1 vertical
+    differences, so each character of text costs a fixed handful of integer
+    operations instead of len(pattern) cell updates. Patterns of
+    BIT_PARALLEL_MAX_LENGTH characters or more use the DP instead.
+    
+    Args:
+        text: String scanned character by character
+        pattern: String encoded in the bit vectors
+        masks: pattern_masks(pattern), if already computed
+        max_distance: If given, stop early once the distance must exceed it
+        
+    Returns:
+        The distance; with max_distance, any distance above it is reported
+        as max_distance + 1
+    """
+    m = len(pattern)
+    if m >= BIT_PARALLEL_MAX_LENGTH:
+        if max_distance is None:
+            return levenshtein_distance(text, pattern)
+        return bounded_levenshtein_distance(text, pattern, max_distance)
+    
+    over = None if max_distance is None else max_distance + 1
+    if over is not None and abs(len(text) - m) > max_distance:
+        return over
+    if m == 0:
+        return len(text)
+    
+    peq = (masks or pattern_masks(pattern))[1]
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    vp, vn = full, 0
+    score = m
+    remaining = len(text)
+    
+    for c in text:
+        eq = peq.get(c, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | (~(xh | vp) & full)
+        hn = vp & xh
+        if hp & high:
+            score += 1
+        elif hn & high:
+            score -= 1
+        
+        # Each remaining character can lower the distance by at most one
+        remaining -= 1
+        if over is not None and score - remaining >= over:
+            return over
+        
+        hp = ((hp << 1) | 1) & full
+        hn = (hn << 1) & full
+        vp = hn | (~(xv | hp) & full)
+        vn = hp & xv
+    
+    return score
+
+
 def similarity_score(s1: str, s2: str) -> float:
     """
     Calculate a normalized similarity score between two strings.
@@ -66,11 +240,36 @@ def similarity_score(s1: str, s2: str) -> float:
     return 1 - (distance / max_len)
 
 
+def max_edit_distance(max_len: int, min_similarity: float) -> int:
+    """
+    Largest edit distance that still reaches min_similarity.
+    
+    Uses the same arithmetic as similarity_score(), so a candidate whose
+    longer length is max_len passes the threshold exactly when its distance
+    is at most the returned value.
+    
+    Args:
+        max_len: Length of the longer of the two strings
+        min_similarity: Minimum similarity threshold (0-1)
+        
+    Returns:
+        Maximum allowed distance (-1 if no distance qualifies)
+    """
+    if max_len <= 0:
+        return -1
+    
+    distance = int((1 - min_similarity) * max_len) + 1
+    while distance >= 0 and 1 - (distance / max_len) < min_similarity:
+        distance -= 1
+    return distance
+
+
 def find_closest_match(
     word: str, 
     candidates: List[str], 
     min_similarity: float = 0.6,
-    max_results: int = 1
+    max_results: int = 1,
+    masks: Optional[Dict[str, PatternMasks]] = None
 ) -> List[Tuple[str, float]]:
     """
     Find the closest matching word(s) from a list of candidates.
@@ -79,25 +278,64 @@ def find_closest_match(
         word: The word to match
         candidates: List of candidate words
         min_similarity: Minimum similarity threshold (0-1)
-        max_results: Maximum number of results to return
+        max_results: Maximum number of results to return (0 or less returns none)
+        masks: Optional pattern_masks() of each lowercased candidate, keyed by
+               candidate; candidates found here are scored with the
+               bit-parallel kernel
         
     Returns:
         List of tuples (matched_word, similarity_score), sorted by score descending
     """
-    if not word or not candidates:
+    if not word or not candidates or max_results <= 0:
         return []
     
-    # Calculate similarity for all candidates
-    scored_matches = []
-    for candidate in candidates:
-        score = similarity_score(word, candidate)
-        if score >= min_similarity:
-            scored_matches.append((candidate, score))
+    # Keep the best max_results matches in a min-heap whose root is the
+    # current worst (lowest score, latest candidate). Once it is full, a
+    # candidate must beat the root's score outright, since ties go to the
+    # earlier candidate; that cutoff tightens the distance bound below.
+    word_lower = word.lower()
+    heap: List[Tuple[float, int, str]] = []
+    cutoff = None
+    bounds: Dict[int, int] = {}
+    for order, candidate in enumerate(candidates):
+        max_len = max(len(word), len(candidate))
+        if not candidate:
+            score = 0.0
+            if score < min_similarity or (cutoff is not None and score <= cutoff):
+                continue
+        else:
+            # Largest distance that still reaches min_similarity and beats the cutoff
+            bound = bounds.get(max_len)
+            if bound is None:
+                bound = max_edit_distance(max_len, min_similarity)
+                while cutoff is not None and bound >= 0 and 1 - (bound / max_len) <= cutoff:
+                    bound -= 1
+                bounds[max_len] = bound
+            if bound < 0:
+                continue
+            candidate_masks = masks.get(candidate) if masks else None
+            if candidate_masks is not None:
+                distance = bit_parallel_distance(word_lower, candidate.lower(), candidate_masks, bound)
+            else:
+                distance = bounded_levenshtein_distance(word_lower, candidate.lower(), bound)
+            if distance > bound:
+                continue
+            score = 1 - (distance / max_len)
+        
+        if len(heap) < max_results:
+            heapq.heappush(heap, (score, -order, candidate))
+            if len(heap) < max_results:
+                continue
+        else:
+            heapq.heapreplace(heap, (score, -order, candidate))
+        if heap[0][0] != cutoff:
+            cutoff = heap[0][0]
+            bounds = {}
     
-    # Sort by score (descending) and return top matches
-    scored_matches.sort(key=lambda x: x[1], reverse=True)
+    # Sort by score (descending), ties in candidate order
+    heap.sort(key=lambda entry: (-entry[0], -entry[1]))
     
-    return scored_matches[:max_results]
+    return [(candidate, score) for score, _, candidate in heap]
 
 
 def load_vocabulary() -> List[str]:
@@ -107,11 +345,8 @@ def load_vocabulary() -> List[str]:
     Returns:
         List of valid Singlish words
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    rules_path = os.path.join(script_dir, '..', 'data', 'singlish_rules.json')
-    
     try:
-        with open(rules_path, 'r', encoding='utf-8') as f:
+        with open(RULES_PATH, 'r', encoding='utf-8') as f:
             rules_dict = json.load(f)
         return list(rules_dict.keys())
     except Exception as e:
@@ -124,17 +359,55 @@ class FuzzyMatcher:
     Fuzzy matcher for Singlish words with spell correction.
     """
     
-    def __init__(self, min_word_length: int = 3, min_similarity: float = 0.6):
+    def __init__(self, min_word_length: int = 3, min_similarity: float = 0.6,
+                 index: str = "length", vocabulary: Optional[List[str]] = None,
+                 max_index_distance: Optional[int] = None, vectorized: bool = False,
+                 cache_size: int = DEFAULT_CACHE_SIZE, store_path: Optional[str] = None,
+                 qgram_size: int = 2):
         """
         Initialize the fuzzy matcher.
         
         Args:
             min_word_length: Minimum word length to attempt fuzzy matching
             min_similarity: Minimum similarity threshold for matches
+            index: Candidate search strategy:
+                   "length" - score every word within ±2 characters (default)
+                   "bktree" - search per-length BK-trees within the allowed
+                   edit distance, tightened as matches are found
+                   "symspell" - look up precomputed deletion variants
+                   "qgram" - count shared character q-grams before scoring
+                   "automaton" - compose the word with a k-edit transducer
+                   and the vocabulary FST (requires pynini)
+            vocabulary: Words to match against (default: singlish_rules.json keys)
+            max_index_distance: Largest edit distance the "symspell" index
+                   is built for (None: SYMSPELL_MAX_DISTANCE). Each word
+                   length gets the radius min_similarity allows queries
+                   within ±2 characters of it, up to this limit, so short
+                   words do not pay for the longest; searches that need
+                   more fall back to the length scan (counted in
+                   index_stats())
+            vectorized: Score the length scan with NumPy (see fuzzy_vector).
+                   Off by default: NumPy's per-call overhead makes it slower
+                   than the pure-Python scan on small vocabularies such as
+                   the bundled rules; turn it on for vocabularies of
+                   thousands of words. Without NumPy installed the
+                   pure-Python scan is used
+            cache_size: Maximum number of tokens remembered by correct_text()
+                   as correctly spelled or as having no match (0 disables)
+            store_path: Optional SQLite file of corrections shared with
+                   other processes (see correction_store)
+            qgram_size: Gram length of the "qgram" index (2 or 3)
         """
-        self.vocabulary = load_vocabulary()
+        if index not in INDEX_TYPES:
+            raise ValueError(f"Unknown index '{index}'. Choose from: {', '.join(INDEX_TYPES)}")
+        
+        if vocabulary is None:
+            self.vocabulary = load_vocabulary()
+        else:
+            self.vocabulary = list(vocabulary)
         self.min_word_length = min_word_length
         self.min_similarity = min_similarity
+        self.index = index
         
         # Create a word length index for faster matching
         self.word_by_length: Dict[int, List[str]] = {}
@@ -143,6 +416,98 @@ class FuzzyMatcher:
             if length not in self.word_by_length:
                 self.word_by_length[length] = []
             self.word_by_length[length].append(word)
+        
+        self._max_length = max(self.word_by_length, default=0)
+        
+        # Words find_correction() would return unchanged with confidence 1.0:
+        # lowercase vocabulary words with no earlier case variant of the
+        # same length (which would win the tie)
+        first_variant: Dict[Tuple[str, int], str] = {}
+        for word in self.vocabulary:
+            first_variant.setdefault((word.lower(), len(word)), word)
+        self.vocabulary_set = frozenset(
+            word for word in first_variant.values()
+            if word == word.lower() and min_similarity <= 1
+        )
+        
+        # Tokens correct_text() has already scored: correctly spelled ones
+        # and ones with no match above the threshold
+        self.cache_size = cache_size
+        self._known_correct = set()
+        self._no_match = set()
+        self._stats = dict.fromkeys(
+            ('tokens', 'short', 'exact_hits', 'correct_hits', 'no_match_hits', 'scored'), 0)
+        
+        # Candidate indexes work on lowercased words, like the scan's
+        # scoring; each lowercase form maps back to the vocabulary words it
+        # stands for (the vocabulary position of every occurrence, which
+        # also breaks score ties the same way the length-bucket scan does)
+        self._case_variants: Dict[str, List[int]] = {}
+        for position, word in enumerate(self.vocabulary):
+            self._case_variants.setdefault(word.lower(), []).append(position)
+        
+        # Bit masks for scoring the length scan with the bit-parallel kernel,
+        # keyed by vocabulary word and by lowercase form
+        self._masks: Dict[str, PatternMasks] = {}
+        for word in self.vocabulary:
+            if word not in self._masks and len(word.lower()) < BIT_PARALLEL_MAX_LENGTH:
+                self._masks[word] = self._masks.setdefault(word.lower(),
+                                                           pattern_masks(word.lower()))
+        
+        self._vector = None
+        if vectorized:
+            if NUMPY_AVAILABLE:
+                self._vector = VectorScorer(self.vocabulary, self.word_by_length)
+            else:
+                print("Warning: numpy not installed, using the pure-Python fuzzy scan")
+        
+        self._store = None
+        if store_path is not None:
+            self._store = CorrectionStore(store_path, self._vocabulary_hash(vocabulary is None))
+        
+        # Searches handed to the index, and those it could not answer
+        self._index_searches = 0
+        self._index_fallbacks = 0
+        
+        self._index = None
+        if index == "bktree":
+            self._index = BKTree(self._case_variants, self._bounded_distance)
+        elif index == "symspell":
+            if max_index_distance is None:
+                max_index_distance = SYMSPELL_MAX_DISTANCE
+            
+            def length_distance(length: int) -> int:
+                # Widest radius _find_indexed() needs for a word of this
+                # length when the query is within ±2 characters of it
+                needed = max_edit_distance(length + 2, min_similarity)
+                return max(0, min(needed, max_index_distance))
+            
+            self._index = SymSpellIndex(self._case_variants, bounded_levenshtein_distance,
+                                        length_distance=length_distance)
+        elif index == "qgram":
+            self._index = QGramIndex(self._case_variants, bounded_levenshtein_distance,
+                                     q=qgram_size)
+        elif index == "automaton":
+            self._index = LevenshteinAutomatonIndex(self._case_variants)
+    
+    def _bounded_distance(self, word: str, candidate: str, max_distance: int) -> int:
+        """Bounded distance between lowercase words, bit-parallel where candidate has masks."""
+        candidate_masks = self._masks.get(candidate)
+        if candidate_masks is None:
+            return bounded_levenshtein_distance(word, candidate, max_distance)
+        return bit_parallel_distance(word, candidate, candidate_masks, max_distance)
+    
+    def _vocabulary_hash(self, from_rules: bool) -> str:
+        """Digest identifying the vocabulary, for keying stored corrections."""
+        if from_rules:
+            try:
+                return file_sha256(RULES_PATH)
+            except OSError:
+                pass
+        digest = hashlib.sha256()
+        for word in self.vocabulary:
+            digest.update(word.encode('utf-8') + b'\n')
+        return digest.hexdigest()
     
     def find_correction(self, word: str, verbose: bool = False) -> Optional[Tuple[str, float]]:
         """
@@ -158,6 +523,50 @@ class FuzzyMatcher:
         if len(word) < self.min_word_length:
             return None
         
+        found, match = False, None
+        if self._store is not None:
+            found, match = self._store.get(word, self.min_similarity)
+        
+        if not found:
+            matches = self._top_matches(word, 1)
+            match = matches[0] if matches else None
+            if self._store is not None:
+                self._store.put(word, self.min_similarity, match)
+        
+        if match and verbose:
+            print(f"  Fuzzy match: '{word}' → '{match[0]}' (confidence: {match[1]:.2f})")
+        return match
+    
+    def suggest(self, word: str, k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Return the k best corrections for a word, e.g. for a "did you mean" list.
+        
+        The first suggestion is the word find_correction() would pick. All
+        k are found in one pass over the candidates.
+        
+        Args:
+            word: Word to correct
+            k: Maximum number of suggestions
+            
+        Returns:
+            List of (word, confidence_score) tuples, best first (empty if the
+            word is shorter than min_word_length or nothing passes the threshold)
+        """
+        if len(word) < self.min_word_length:
+            return []
+        return self._top_matches(word, k)
+    
+    def _top_matches(self, word: str, k: int) -> List[Tuple[str, float]]:
+        """Find the k best matches with the configured index."""
+        if self._index is not None:
+            return self._find_indexed(word, k)
+        return self._scan_length_buckets(word, k)
+    
+    def _scan_length_buckets(self, word: str, k: int = 1) -> List[Tuple[str, float]]:
+        """Score every vocabulary word within ±2 characters of the word's length."""
+        if self._vector is not None:
+            return self._vector.closest(word, self.min_similarity, max_results=k)
+        
         # Look at words with similar lengths (±2)
         target_length = len(word)
         candidates = []
@@ -170,20 +579,133 @@ class FuzzyMatcher:
         if not candidates:
             candidates = self.vocabulary
         
-        matches = find_closest_match(word, candidates, self.min_similarity, max_results=1)
+        return find_closest_match(word, candidates, self.min_similarity, max_results=k,
+                                  masks=self._masks)
+    
+    def _find_indexed(self, word: str, k: int = 1) -> List[Tuple[str, float]]:
+        """
+        Find the k best corrections using a candidate index.
+        
+        Gives the same answer as the length-bucket scan: candidates are
+        limited to ±2 characters of the word's length (or the whole
+        vocabulary if that window is empty), and ties on score go to the
+        shorter word, then to the word that comes first in the vocabulary.
+        """
+        target_length = len(word)
+        in_window = any(length in self.word_by_length
+                        for length in range(max(1, target_length - 2), target_length + 3))
+        
+        if self.index == "bktree":
+            found = self._search_bktree(word.lower(), k, in_window)
+        else:
+            # The longest candidate decides how many edits can still pass
+            if in_window:
+                longest = target_length + 2
+            else:
+                longest = max(target_length, self._max_length)
+            radius = max_edit_distance(longest, self.min_similarity)
+            
+            # Indexes built for a bounded distance cannot answer wider searches
+            covers = getattr(self._index, 'covers', None)
+            if covers is not None:
+                self._index_searches += 1
+                if not self._index_covers(covers, target_length, in_window):
+                    self._index_fallbacks += 1
+                    return self._scan_length_buckets(word, k)
+            
+            found = [(position, distance)
+                     for key, distance in self._index.search(word.lower(), radius)
+                     for position in self._case_variants[key]]
+        
+        ranked = []
+        for position, distance in found:
+            candidate = self.vocabulary[position]
+            if in_window and abs(len(candidate) - target_length) > 2:
+                continue
+            score = 1 - (distance / max(target_length, len(candidate)))
+            if score < self.min_similarity:
+                continue
+            if in_window:
+                key = (-score, len(candidate), position)
+            else:
+                key = (-score, position)
+            ranked.append((key, candidate, score))
         
-        if matches:
-            corrected_word, score = matches[0]
-            if verbose:
-                print(f"  Fuzzy match: '{word}' → '{corrected_word}' (confidence: {score:.2f})")
-            return corrected_word, score
+        return [(candidate, score) for _, candidate, score in heapq.nsmallest(k, ranked)]
+    
+    def _index_covers(self, covers: Callable[[int, int], bool], target_length: int,
+                      in_window: bool) -> bool:
+        """
+        Whether a bounded index finds every candidate a word can match.
         
-        return None
+        Args:
+            covers: The index's covers(length, max_distance)
+            target_length: Length of the query word
+            in_window: Whether vocabulary words within ±2 characters exist
+        """
+        if in_window:
+            lengths = range(max(1, target_length - 2), target_length + 3)
+        else:
+            lengths = self.word_by_length
+        for length in lengths:
+            if length in self.word_by_length:
+                needed = max_edit_distance(max(target_length, length), self.min_similarity)
+                if abs(length - target_length) <= needed and not covers(length, needed):
+                    return False
+        return True
+    
+    def _search_bktree(self, word: str, k: int, in_window: bool) -> List[Tuple[int, int]]:
+        """
+        Search the BK-tree one word length at a time, closest lengths first.
+        
+        Each length gets the radius its own similarity threshold allows, and
+        once k matches are found the radius only admits words that can
+        still tie with the k-th best score, like the scan's cutoff.
+        
+        Args:
+            word: Lowercased query word
+            k: Number of matches wanted
+            in_window: Whether vocabulary words within ±2 characters exist
+        
+        Returns:
+            (vocabulary position, distance) pairs, one per case variant of
+            each lowercase match: every match that can be among the k best,
+            and possibly some that cannot
+        """
+        target_length = len(word)
+        if in_window:
+            lengths = [length for length in range(max(1, target_length - 2), target_length + 3)
+                       if length in self.word_by_length]
+        else:
+            lengths = list(self.word_by_length)
+        lengths.sort(key=lambda length: abs(length - target_length))
+        
+        found = []
+        best: List[float] = []  # min-heap of the k best scores so far
+        for length in lengths:
+            max_len = max(target_length, length)
+            radius = max_edit_distance(max_len, self.min_similarity)
+            if len(best) == k:
+                while radius >= 0 and 1 - (radius / max_len) < best[0]:
+                    radius -= 1
+            if radius < 0 or abs(length - target_length) > radius:
+                continue
+            for key, distance in self._index.search(word, radius, length, length):
+                found.extend((position, distance) for position in self._case_variants[key])
+                score = 1 - (distance / max_len)
+                if len(best) < k:
+                    heapq.heappush(best, score)
+                elif score > best[0]:
+                    heapq.heapreplace(best, score)
+        return found
     
     def correct_text(self, text: str, verbose: bool = False) -> Tuple[str, List[Dict]]:
         """
         Attempt to correct spelling mistakes in text.
         
+        Vocabulary words, and tokens already found to be correctly spelled or
+        to have no match, are passed through without scoring.
+        
         Args:
             text: Input text to correct
             verbose: If True, print correction details
@@ -192,12 +714,46 @@ class FuzzyMatcher:
             Tuple of (corrected_text, corrections_list)
             corrections_list contains dicts with 'original', 'corrected', 'confidence'
         """
-        words = text.split()
+        corrected_words, corrections = self.correct_tokens(text.split(), verbose=verbose)
+        return ' '.join(corrected_words), corrections
+    
+    def correct_tokens(self, words: List[str], verbose: bool = False) -> Tuple[List[str], List[Dict]]:
+        """
+        Attempt to correct spelling mistakes in already tokenized text.
+        
+        Args:
+            words: Tokens to correct
+            verbose: If True, print correction details
+            
+        Returns:
+            Tuple of (corrected_words, corrections_list), corrected_words
+            with one entry per token
+        """
         corrected_words = []
         corrections = []
+        stats = self._stats
         
         for word in words:
+            stats['tokens'] += 1
+            if len(word) < self.min_word_length:
+                stats['short'] += 1
+                corrected_words.append(word)
+                continue
+            if word in self.vocabulary_set:
+                stats['exact_hits'] += 1
+                corrected_words.append(word)
+                continue
+            if word in self._known_correct:
+                stats['correct_hits'] += 1
+                corrected_words.append(word)
+                continue
+            if word in self._no_match:
+                stats['no_match_hits'] += 1
+                corrected_words.append(word)
+                continue
+            
             # Try to find a correction
+            stats['scored'] += 1
             result = self.find_correction(word, verbose=verbose)
             
             if result:
@@ -211,11 +767,78 @@ class FuzzyMatcher:
                         'confidence': confidence
                     })
                 else:
+                    self._remember(self._known_correct, word)
                     corrected_words.append(word)
             else:
+                self._remember(self._no_match, word)
                 corrected_words.append(word)
         
-        return ' '.join(corrected_words), corrections
+        return corrected_words, corrections
+    
+    def _remember(self, cache: set, word: str):
+        """Add a token to a bounded cache, starting it afresh once it is full."""
+        if self.cache_size <= 0:
+            return
+        if len(cache) >= self.cache_size:
+            cache.clear()
+        cache.add(word)
+    
+    def cache_stats(self) -> Dict[str, float]:
+        """
+        Return correct_text() token statistics.
+        
+        Returns:
+            Dictionary with token counts (tokens, short, exact_hits,
+            correct_hits, no_match_hits, scored) and short_circuit_rate, the
+            fraction of tokens that needed no scoring
+        """
+        stats = dict(self._stats)
+        stats['short_circuit_rate'] = (
+            1 - stats['scored'] / stats['tokens'] if stats['tokens'] else 0.0
+        )
+        return stats
+    
+    def index_stats(self) -> Dict[str, float]:
+        """
+        Return the candidate index's statistics (empty for the length scan).
+        
+        For an index built for a bounded distance ("symspell") this also
+        includes searches, fallbacks (searches that needed a wider radius and
+        used the length scan instead) and fallback_rate.
+        """
+        stats = getattr(self._index, 'stats', None)
+        result = stats() if stats is not None else {}
+        if hasattr(self._index, 'covers'):
+            result['searches'] = self._index_searches
+            result['fallbacks'] = self._index_fallbacks
+            result['fallback_rate'] = (self._index_fallbacks / self._index_searches
+                                       if self._index_searches else 0.0)
+        return result
+    
+    def flush(self):
+        """Write buffered corrections to the correction store, if one is open."""
+        if self._store is not None:
+            self._store.flush()
+    
+    def clear_cache(self):
+        """Forget cached tokens and reset the statistics."""
+        self._known_correct.clear()
+        self._no_match.clear()
+        for key in self._stats:
+            self._stats[key] = 0
+
+
+# Common spelling mistakes: (text, expected correction)
+SPELLING_TEST_CASES = [
+    ("mama gedra yanawa", "gedra → gedara"),  # missing 'a'
+    ("mama gedar yanawa", "gedar → gedara"),  # missing 'a' at end
+    ("eyala potha kiyawanwa", "kiyawanwa → kiyawanawa"),  # missing 'a'
+    ("oya baht kanawa", "baht → bath"),  # 'h' and 't' swapped
+    ("mama iskol yanawa", "iskol → iskole"),  # missing 'e'
+    ("eyala watura bonwa", "bonwa → bonawa"),  # missing 'a'
+    ("oya telavision balanawa", "telavision → television"),  # typo
+    ("mama computr hadanawa", "computr → computer"),  # missing 'e'
+]
 
 
 def test_fuzzy_matcher():
@@ -226,20 +849,9 @@ def test_fuzzy_matcher():
     
     matcher = FuzzyMatcher(min_similarity=0.6)
     
-    test_cases = [
-        ("mama gedra yanawa", "gedra → gedara"),  # missing 'a'
-        ("mama gedar yanawa", "gedar → gedara"),  # missing 'a' at end
-        ("eyala potha kiyawanwa", "kiyawanwa → kiyawanawa"),  # missing 'a'
-        ("oya baht kanawa", "baht → bath"),  # 'h' and 't' swapped
-        ("mama iskol yanawa", "iskol → iskole"),  # missing 'e'
-        ("eyala watura bonwa", "bonwa → bonawa"),  # missing 'a'
-        ("oya telavision balanawa", "telavision → television"),  # typo
-        ("mama computr hadanawa", "computr → computer"),  # missing 'e'
-    ]
-    
     print("\nTesting common spelling mistakes:\n")
     
-    for text, description in test_cases:
+    for text, description in SPELLING_TEST_CASES:
         print(f"Input:  {text}")
         print(f"Expect: {description}")
         corrected, corrections = matcher.correct_text(text, verbose=False)
@@ -0,0 +1,168 @@
+"""
+Vectorized Candidate Scoring for Fuzzy Matching
+Student 1
+
+find_closest_match() computes one edit distance at a time in a Python loop.
+VectorScorer encodes FuzzyMatcher's length buckets once as padded integer
+arrays and runs the Levenshtein DP for one query against every candidate of
+the ±2 length window at the same time with NumPy: each query character
+advances one DP row for all candidates at once.
+
+Within a row the insertion chain D[j] = min(D[j], D[j-1] + 1) is a prefix
+minimum, so it is computed with np.minimum.accumulate instead of a loop over
+the candidate's characters.
+
+NumPy is optional and FuzzyMatcher only uses this module when asked to
+(vectorized=True): each call has a fixed NumPy overhead, so on small
+vocabularies such as the bundled rules the pure-Python scan is faster, while
+for thousands of words the vectorized scan wins (see
+benchmarks/bench_fuzzy_index.py). NUMPY_AVAILABLE tells FuzzyMatcher whether
+it can be used. NumPy itself is only imported when the first VectorScorer is
+built, so importing the pipeline stays cheap.
+"""
+
+import importlib.util
+from typing import Dict, List, Optional, Tuple
+
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+# Set by _import_numpy() when the first VectorScorer is built
+np = None
+
+
+def _import_numpy():
+    """Import NumPy into this module on first use."""
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+
+# Codes that never equal a real character: padding after a short candidate,
+# and query characters that appear in no vocabulary word
+PAD_CODE = -1
+UNKNOWN_CODE = -2
+
+
+class _Window:
+    """Candidates of one length window, encoded for the vectorized DP."""
+
+    def __init__(self, words: List[str], codes: Dict[str, int]):
+        lowered = [word.lower() for word in words]
+        width = max((len(word) for word in lowered), default=0)
+
+        self.words = words
+        self.codes = np.full((len(words), width), PAD_CODE, dtype=np.int32)
+        for row, word in enumerate(lowered):
+            self.codes[row, :len(word)] = [codes[c] for c in word]
+        # DP column holding each candidate's distance, and the length used
+        # for its similarity score (the original, not lowercased, word)
+        self.end_column = np.array([len(word) for word in lowered], dtype=np.intp)
+        self.lengths = np.array([len(word) for word in words], dtype=np.float64)
+        self.rows = np.arange(len(words))
+
+
+class VectorScorer:
+    """
+    Scores a query against FuzzyMatcher's length window with NumPy.
+
+    Gives the same results as find_closest_match() over the same candidates.
+    """
+
+    def __init__(self, vocabulary: List[str], word_by_length: Dict[int, List[str]]):
+        """
+        Encode the vocabulary.
+
+        Args:
+            vocabulary: All words, in vocabulary order (used when a query's
+                        length window is empty)
+            word_by_length: FuzzyMatcher's length buckets
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("VectorScorer requires numpy")
+        _import_numpy()
+
+        self.vocabulary = vocabulary
+        self.word_by_length = word_by_length
+        self.codes: Dict[str, int] = {}
+        for word in vocabulary:
+            for c in word.lower():
+                self.codes.setdefault(c, len(self.codes))
+        self._windows: Dict[Optional[int], _Window] = {}
+
+    def _window(self, target_length: int) -> _Window:
+        """Return the encoded ±2 window for a query length, building it on first use."""
+        window = self._windows.get(target_length)
+        if window is None:
+            words = []
+            for length in range(max(1, target_length - 2), target_length + 3):
+                words.extend(self.word_by_length.get(length, []))
+            if not words:
+                # Same fallback as the length scan: the whole vocabulary
+                window = self._windows.get(None)
+                if window is None:
+                    window = self._windows[None] = _Window(self.vocabulary, self.codes)
+            else:
+                window = _Window(words, self.codes)
+            self._windows[target_length] = window
+        return window
+
+    def distances(self, word: str, window: _Window):
+        """
+        Levenshtein distance from word.lower() to every candidate of a window.
+
+        Returns:
+            Integer array with one distance per candidate
+        """
+        query = word.lower()
+        count, width = window.codes.shape
+        offsets = np.arange(width + 1, dtype=np.int32)
+
+        # Row 0: distance from the empty query prefix
+        row = np.broadcast_to(offsets, (count, width + 1)).copy()
+        best = np.empty_like(row)
+        mismatch = np.empty((count, width), dtype=np.int32)
+        for i, c in enumerate(query, start=1):
+            np.not_equal(window.codes, self.codes.get(c, UNKNOWN_CODE), out=mismatch)
+            # Substitution/match and deletion, from the previous row
+            best[:, 0] = i
+            np.add(row[:, :-1], mismatch, out=best[:, 1:])
+            np.minimum(best[:, 1:], row[:, 1:] + 1, out=best[:, 1:])
+            # Insertion: row[j] = min over k <= j of best[k] + (j - k)
+            np.subtract(best, offsets, out=best)
+            np.minimum.accumulate(best, axis=1, out=row)
+            np.add(row, offsets, out=row)
+
+        return row[window.rows, window.end_column]
+
+    def closest(self, word: str, min_similarity: float = 0.6,
+                max_results: int = 1) -> List[Tuple[str, float]]:
+        """
+        Find the closest vocabulary words within word's length window.
+
+        Args:
+            word: The word to match
+            min_similarity: Minimum similarity threshold (0-1)
+            max_results: Maximum number of results to return
+
+        Returns:
+            List of tuples (matched_word, similarity_score), sorted by score
+            descending, ties in candidate order (as find_closest_match)
+        """
+        if not word:
+            return []
+
+        window = self._window(len(word))
+        if not window.words:
+            return []
+
+        distances = self.distances(word, window)
+        max_len = np.maximum(window.lengths, len(word))
+        scores = 1 - distances / max_len
+        passing = np.flatnonzero(scores >= min_similarity)
+
+        # Stable sort on score keeps candidate order for ties
+        order = passing[np.argsort(-scores[passing], kind='stable')][:max_results]
+        return [(window.words[i], float(scores[i])) for i in order]
@@ -11,36 +11,411 @@ The module includes preprocessing to handle:
 - Number handling
 - Input validation
 
+Two engines are available:
+- "fst":  the compiled pynini FST (default when pynini is installed)
+- "trie": a pure-Python longest-match trie built from singlish_rules.json
+          (default when pynini is not installed)
+
+Two spell checkers are available:
+- "fuzzy": FuzzyMatcher's edit distance scan (default)
+- "fst":   pynini composition of each word with a k-edit transducer and the
+           vocabulary FST (same corrections, requires pynini)
+
+Results are memoized per whitespace-delimited token in a bounded LRU cache
+(see token_cache.py), so frequent words skip the engine entirely.
+
+Nothing expensive happens at import time: pynini, the FST, the trie and the
+fuzzy matcher are loaded on first use, or up front with warmup().
+
 Usage:
     from module1 import transliterate
     sinhala = transliterate("mama gedara yanawa")
     # Also handles: "Mama gedara yanawa!" → "මම ගෙදර යනවා!"
+    sinhala = transliterate("mama gedara yanawa", engine="trie")
+    sinhala = transliterate("mama gedra yanawa", spell_checker="fst")
+    sinhala_list = transliterate_batch(["mama gedara yanawa", "oya bath kanawa"])
 """
 
-import pynini
+import importlib.util
 import os
-from preprocess import preprocess, postprocess
+import threading
+from typing import Dict, List, Optional, Tuple
+from preprocess import preprocess, preprocess_spans, postprocess, PreprocessMetadata
+from records import TokenSpan
 from fuzzy_matcher import FuzzyMatcher
+from trie_engine import TransliterationTrie
+from token_cache import TokenCache, DEFAULT_CACHE_SIZE
+
+# pynini is only imported when the FST is first used; checking for it here
+# keeps `import module1` (and `import pipeline`) cheap
+PYNINI_AVAILABLE = importlib.util.find_spec("pynini") is not None
+
+ENGINES = ("fst", "trie")
+DEFAULT_ENGINE = "fst" if PYNINI_AVAILABLE else "trie"
 
-# Initialize fuzzy matcher once at module level
-_fuzzy_matcher = None
+SPELL_CHECKERS = ("fuzzy", "fst")
+DEFAULT_SPELL_CHECKER = "fuzzy"
 
-# Load the compiled FST once at module import time
-# This makes transliteration very fast since we don't reload the FST each time
 script_dir = os.path.dirname(os.path.abspath(__file__))
 fst_path = os.path.join(script_dir, "transliterate.fst")
+const_fst_path = os.path.join(script_dir, "transliterate.const.fst")
+rules_path = os.path.join(script_dir, '..', 'data', 'singlish_rules.json')
+
+# What to do when transliterate.fst was not built from the current
+# singlish_rules.json: "error" (the default) fails fast, "rebuild" recompiles
+# it in place on load (the package directory must be writable)
+STALE_FST_POLICY = os.environ.get("SINGLISH_STALE_FST", "error")
+
+# Optional SQLite file where spell corrections are shared between processes
+CORRECTION_STORE_PATH = os.environ.get("SINGLISH_CORRECTION_STORE") or None
+
+
+class _LazyResource:
+    """
+    Thread-safe holder for a resource that is loaded once, on first use.
+    """
+    
+    def __init__(self, loader):
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._value = None
+    
+    @property
+    def loaded(self) -> bool:
+        return self._value is not None
+    
+    def get(self):
+        """Return the resource, running the loader if this is the first access."""
+        value = self._value
+        if value is None:
+            with self._lock:
+                if self._value is None:
+                    self._value = self._loader()
+                value = self._value
+        return value
+
+
+def _load_fst():
+    """
+    Import pynini and read the compiled FST.
+    
+    The const FST from `build_fst.py --const` is preferred when it belongs to
+    the current build; otherwise the vector FST is used.
+    
+    Returns:
+        Function transliterating preprocessed text
+    """
+    if not PYNINI_AVAILABLE:
+        raise RuntimeError(
+            "The 'fst' engine requires pynini. Install it or use engine='trie'."
+        )
+    
+    import pynini
+    import build_fst
+    
+    # Compare the FST's build manifest against the current rules
+    reason = build_fst.stale_reason(rules_path, fst_path)
+    if reason is not None:
+        if STALE_FST_POLICY == "rebuild":
+            # Rechecks under the build lock, so concurrent workers build once
+            build_fst.build_fst(const=os.path.exists(const_fst_path), verbose=False)
+        elif not os.path.exists(fst_path):
+            raise FileNotFoundError(
+                f"transliterate.fst not found at {fst_path}\n"
+                f"Please run 'python build_fst.py' first to compile the FST."
+            )
+        else:
+            raise RuntimeError(
+                f"transliterate.fst is out of date ({reason}).\n"
+                f"Please run 'python build_fst.py' to recompile the FST, "
+                f"or set SINGLISH_STALE_FST=rebuild."
+            )
+    
+    if build_fst.const_fst_current(const_fst_path):
+        import pywrapfst
+        
+        # Read as an immutable ConstFst; it is never written to, so its pages
+        # stay shared between workers forked after warmup()
+        fst = pywrapfst.Fst.read(const_fst_path)
+        
+        def apply(text: str) -> str:
+            lattice = pywrapfst.compose(pynini.accep(text), fst)
+            return pynini.shortestpath(pynini.Fst.from_pywrapfst(lattice)).string()
+        
+        return apply
+    
+    fst = pynini.Fst.read(fst_path)
+    
+    def apply(text: str) -> str:
+        # Compose the input string with the FST and get the shortest path
+        return pynini.shortestpath(pynini.accep(text) @ fst).string()
+    
+    return apply
+
+
+def _load_trie():
+    """Build the trie from singlish_rules.json."""
+    return TransliterationTrie.from_rules_file(rules_path)
+
+
+# Engine data and the fuzzy matcher are loaded on first transliteration
+# (or by warmup()), not at import time
+_fst_handle = _LazyResource(_load_fst)
+_trie_handle = _LazyResource(_load_trie)
+_fuzzy_handle = _LazyResource(
+    lambda: FuzzyMatcher(min_word_length=3, min_similarity=0.65,
+                         store_path=CORRECTION_STORE_PATH)
+)
+_fst_speller_handle = _LazyResource(
+    lambda: FuzzyMatcher(min_word_length=3, min_similarity=0.65, index="automaton",
+                         store_path=CORRECTION_STORE_PATH)
+)
+_SPELL_CHECKER_HANDLES = {"fuzzy": _fuzzy_handle, "fst": _fst_speller_handle}
+
+# Per-engine token → Sinhala caches; engines are never reloaded, so their
+# entries stay valid for the life of the process
+_token_caches = {engine: TokenCache(DEFAULT_CACHE_SIZE) for engine in ENGINES}
+
+
+def _apply_fst(text: str) -> str:
+    """Run preprocessed text through the compiled FST."""
+    return _fst_handle.get()(text)
+
+
+def _apply_trie(text: str) -> str:
+    """Run preprocessed text through the longest-match trie."""
+    return _trie_handle.get().transliterate(text)
+
+
+_ENGINE_FUNCTIONS = {
+    "fst": _apply_fst,
+    "trie": _apply_trie,
+}
+
+_ENGINE_HANDLES = {
+    "fst": _fst_handle,
+    "trie": _trie_handle,
+}
+
+
+def warmup(engine: str = DEFAULT_ENGINE, spell_check: bool = True,
+           spell_checker: str = DEFAULT_SPELL_CHECKER):
+    """
+    Load the engine data (and fuzzy matcher) ahead of the first transliteration.
+    
+    Useful in servers and worker processes so the first request does not pay
+    the loading cost.
+    
+    Args:
+        engine: Engine to load, "fst" or "trie"
+        spell_check: If True, also build the spell checker
+        spell_checker: Spell checker to build, "fuzzy" or "fst"
+    """
+    _check_engine(engine)
+    _check_spell_checker(spell_checker)
+    _load_handles(engine, spell_check, spell_checker)
+
+
+def _load_handles(engine: str, spell_check: bool, spell_checker: str):
+    """
+    Load the engine (and spell checker) a transliteration will use.
+    
+    Called before the engine is applied so that loading errors (pynini
+    missing, transliterate.fst missing or out of date) reach the caller as
+    they are, not wrapped as a failure to transliterate the input.
+    """
+    _ENGINE_HANDLES[engine].get()
+    if spell_check:
+        _SPELL_CHECKER_HANDLES[spell_checker].get()
+
+
+def _transliterate_tokens(text: str, engine: str) -> str:
+    """
+    Transliterate preprocessed text one space-delimited token at a time.
+    
+    Space maps to itself and no rule spans a space, so this gives the same
+    output as running the engine over the whole string. Tokens are looked up
+    in the engine's LRU cache and only misses are sent to the engine.
+    
+    This is done even with the cache disabled: the FST lattice for a whole
+    pasted paragraph grows with its length and shortest-path gets slower per
+    character, while per-token lattices stay as small as the longest word.
+    """
+    # Split on single spaces so runs of spaces (left behind by number
+    # extraction) survive as empty tokens and positions are unchanged
+    return ' '.join(_transliterate_token(token, engine) if token else token
+                    for token in text.split(' '))
+
+
+def _transliterate_token(token: str, engine: str) -> str:
+    """Transliterate a single token through the engine's LRU cache."""
+    cache = _token_caches[engine]
+    
+    if cache.max_size <= 0:
+        return _ENGINE_FUNCTIONS[engine](token)
+    
+    result = cache.get(token)
+    if result is None:
+        result = _ENGINE_FUNCTIONS[engine](token)
+        cache.put(token, result)
+    return result
+
+
+def _check_engine(engine: str):
+    """Raise ValueError for an unknown engine name."""
+    if engine not in _ENGINE_FUNCTIONS:
+        raise ValueError(f"Unknown engine '{engine}'. Choose from: {', '.join(ENGINES)}")
+
+
+def _check_spell_checker(spell_checker: str):
+    """Raise ValueError for an unknown spell checker name."""
+    if spell_checker not in _SPELL_CHECKER_HANDLES:
+        raise ValueError(f"Unknown spell checker '{spell_checker}'. "
+                         f"Choose from: {', '.join(SPELL_CHECKERS)}")
+
+
+def _prepare_text(sinlish_text: str, verbose: bool, spell_check: bool,
+                  spell_checker: str = DEFAULT_SPELL_CHECKER) -> Tuple[str, PreprocessMetadata]:
+    """
+    Preprocess the input and apply spell checking if enabled.
+    
+    Returns:
+        Tuple of (preprocessed_text, metadata) ready for the engine
+    """
+    preprocessed_text, metadata = preprocess(sinlish_text)
+    
+    if spell_check:
+        corrected_words = _spell_check(preprocessed_text.split(), metadata, verbose,
+                                       spell_checker)
+        if corrected_words is not None:
+            preprocessed_text = ' '.join(corrected_words)
+    
+    _show_warnings(metadata, verbose)
+    return preprocessed_text, metadata
+
+
+def _prepare_spans(sinlish_text: str, verbose: bool, spell_check: bool,
+                   spell_checker: str = DEFAULT_SPELL_CHECKER) -> Tuple[List[TokenSpan], PreprocessMetadata]:
+    """
+    Tokenize the input into spans and spell check their text if enabled.
+    
+    Returns:
+        Tuple of (spans, metadata); each span's corrected form is ready for
+        the engine
+    """
+    spans, metadata = preprocess_spans(sinlish_text)
+    
+    if spell_check:
+        words = [span for span in spans if span.text]
+        corrected_words = _spell_check([span.text for span in words], metadata, verbose,
+                                       spell_checker)
+        if corrected_words is not None:
+            for span, corrected in zip(words, corrected_words):
+                span.corrected = corrected
+    
+    _show_warnings(metadata, verbose)
+    return spans, metadata
+
+
+def _spell_check(words: List[str], metadata: PreprocessMetadata, verbose: bool,
+                 spell_checker: str) -> Optional[List[str]]:
+    """
+    Correct spelling mistakes in a list of tokens.
+    
+    Returns:
+        The corrected tokens (recorded in metadata.spell_corrections), or
+        None if nothing was corrected
+    """
+    # The matcher is built on first use
+    corrected_words, corrections = _SPELL_CHECKER_HANDLES[spell_checker].get().correct_tokens(
+        words,
+        verbose=verbose
+    )
+    if not corrections:
+        return None
+    
+    metadata.spell_corrections = corrections
+    if verbose:
+        print(f"Spell corrections applied:")
+        for corr in corrections:
+            print(f"  '{corr['original']}' → '{corr['corrected']}' "
+                  f"(confidence: {corr['confidence']:.2f})")
+    return corrected_words
 
-# Check if FST exists
-if not os.path.exists(fst_path):
-    raise FileNotFoundError(
-        f"transliterate.fst not found at {fst_path}\n"
-        f"Please run 'python build_fst.py' first to compile the FST."
+
+def _show_warnings(metadata: PreprocessMetadata, verbose: bool):
+    """Print preprocessing warnings in verbose mode."""
+    if verbose and metadata.warnings:
+        for warning in metadata.warnings:
+            print(f"Warning: {warning}")
+
+
+def _join_spans(spans: List[TokenSpan], metadata: PreprocessMetadata) -> str:
+    """
+    Join the spans' Sinhala forms and restore punctuation and numbers.
+    
+    Gives the same text as transliterate(): once the spell checker has
+    corrected a token, the corrected text was rejoined without the empty
+    tokens left by punctuation and numbers, so they are left out here too.
+    """
+    if metadata.spell_corrections:
+        joined = ' '.join(span.sinhala for span in spans if span.text)
+    else:
+        joined = ' '.join(span.sinhala for span in spans)
+    return postprocess(joined, metadata)
+
+
+def _transliteration_error(sinlish_text: str, error: Exception) -> Exception:
+    """Wrap an engine error with a helpful message."""
+    return Exception(
+        f"Failed to transliterate '{sinlish_text}'\n"
+        f"This may be because the input contains characters not in singlish_rules.json\n"
+        f"Original error: {error}"
     )
 
-# Load the FST (done once when module is imported)
-_fst = pynini.Fst.read(fst_path)
 
-def transliterate(sinlish_text: str, verbose: bool = False, spell_check: bool = True) -> str:
+def flush_corrections():
+    """
+    Write buffered spell corrections to the correction store, if one is set.
+    
+    Worker processes of a pool do not run atexit handlers, so they call this
+    at the end of each task (see pipeline.parallel_translate).
+    """
+    for handle in _SPELL_CHECKER_HANDLES.values():
+        if handle.loaded:
+            handle.get().flush()
+
+
+def configure_cache(max_size: int):
+    """
+    Set the maximum number of tokens cached per engine.
+    
+    Args:
+        max_size: LRU capacity per engine (0 disables caching)
+    """
+    for cache in _token_caches.values():
+        cache.resize(max_size)
+
+
+def cache_stats() -> dict:
+    """
+    Return token cache statistics for each engine.
+    
+    Returns:
+        Dictionary mapping engine name to hits/misses/evictions/size/hit_rate
+    """
+    return {engine: cache.stats() for engine, cache in _token_caches.items()}
+
+
+def clear_cache():
+    """Empty the token caches and reset their statistics."""
+    for cache in _token_caches.values():
+        cache.clear()
+
+
+def transliterate(sinlish_text: str, verbose: bool = False, spell_check: bool = True,
+                  engine: str = DEFAULT_ENGINE,
+                  spell_checker: str = DEFAULT_SPELL_CHECKER) -> str:
     """
     Transliterate Singlish (Roman script) to Sinhala script with preprocessing.
     
@@ -62,55 +437,38 @@ def transliterate(sinlish_text: str, verbose: bool = False, spell_check: bool =
         verbose: If True, print preprocessing warnings and corrections (default: False)
         spell_check: If True, attempt to correct spelling mistakes using fuzzy matching
                      (default: True)
+        engine: Transliteration backend, "fst" or "trie" (default: "fst" if
+                pynini is installed, otherwise "trie")
+        spell_checker: Spelling correction backend, "fuzzy" or "fst"
+                       (default: "fuzzy")
         
     Returns:
         Transliterated text in Sinhala script with punctuation/numbers restored
         Example: "මම ගෙදර යනවා!"
         
     Raises:
+        ValueError: If engine is not one of ENGINES, or spell_checker is not
+                    one of SPELL_CHECKERS
+        FileNotFoundError: If the "fst" engine's transliterate.fst is missing
+        RuntimeError: If pynini is missing for the "fst" engine, or
+                      transliterate.fst is out of date
         Exception: If the FST cannot transliterate the input
     """
-    global _fuzzy_matcher
+    _check_engine(engine)
+    _check_spell_checker(spell_checker)
     
     if not sinlish_text:
         return ""
     
+    _load_handles(engine, spell_check, spell_checker)
+    
     try:
-        # Step 1: Preprocess the input
-        preprocessed_text, metadata = preprocess(sinlish_text)
-        
-        # Step 1.5: Apply spell checking if enabled
-        if spell_check:
-            # Initialize fuzzy matcher lazily (only when needed)
-            if _fuzzy_matcher is None:
-                _fuzzy_matcher = FuzzyMatcher(min_word_length=3, min_similarity=0.65)
-            
-            # Attempt to correct spelling mistakes
-            corrected_text, corrections = _fuzzy_matcher.correct_text(
-                preprocessed_text, 
-                verbose=verbose
-            )
-            
-            # Update metadata with corrections
-            if corrections:
-                metadata['spell_corrections'] = corrections
-                if verbose:
-                    print(f"Spell corrections applied:")
-                    for corr in corrections:
-                        print(f"  '{corr['original']}' → '{corr['corrected']}' "
-                              f"(confidence: {corr['confidence']:.2f})")
-                preprocessed_text = corrected_text
+        # Step 1: Preprocess the input (and correct spelling if enabled)
+        preprocessed_text, metadata = _prepare_text(sinlish_text, verbose, spell_check,
+                                                    spell_checker)
         
-        # Show warnings if verbose mode
-        if verbose and metadata['warnings']:
-            for warning in metadata['warnings']:
-                print(f"Warning: {warning}")
-        
-        # Step 2: Apply the FST to the preprocessed text
-        # Compose the input string with the FST and get the shortest path
-        input_fst = pynini.accep(preprocessed_text)
-        output_fst = input_fst @ _fst
-        result = pynini.shortestpath(output_fst).string()
+        # Step 2: Apply the selected engine to the preprocessed text
+        result = _transliterate_tokens(preprocessed_text, engine)
         
         # Step 3: Postprocess to restore punctuation and numbers
         final_result = postprocess(result, metadata)
@@ -118,12 +476,142 @@ def transliterate(sinlish_text: str, verbose: bool = False, spell_check: bool =
         return final_result
         
     except Exception as e:
-        # If transliteration fails, provide helpful error message
-        raise Exception(
-            f"Failed to transliterate '{sinlish_text}'\n"
-            f"This may be because the input contains characters not in singlish_rules.json\n"
-            f"Original error: {e}"
-        )
+        raise _transliteration_error(sinlish_text, e)
+
+
+def transliterate_spans(sinlish_text: str, verbose: bool = False, spell_check: bool = True,
+                        engine: str = DEFAULT_ENGINE,
+                        spell_checker: str = DEFAULT_SPELL_CHECKER) -> Tuple[str, List[TokenSpan]]:
+    """
+    Transliterate Singlish and keep the result of every token.
+    
+    Tokenizes the input once into TokenSpan records (offsets into the input,
+    normalized text, spell-corrected text) and fills in each span's Sinhala
+    form, so Module 2 can work on the tokens and a UI can align output words
+    with the input.
+    
+    Args:
+        sinlish_text: Input text in Singlish (Roman script)
+        verbose: If True, print preprocessing warnings and corrections
+        spell_check: If True, attempt to correct spelling mistakes
+        engine: Transliteration backend, "fst" or "trie"
+        spell_checker: Spelling correction backend, "fuzzy" or "fst"
+        
+    Returns:
+        Tuple of (sinhala_text, spans); sinhala_text is what transliterate()
+        returns
+        
+    Raises:
+        ValueError: If engine is not one of ENGINES, or spell_checker is not
+                    one of SPELL_CHECKERS
+        FileNotFoundError: If the "fst" engine's transliterate.fst is missing
+        RuntimeError: If pynini is missing for the "fst" engine, or
+                      transliterate.fst is out of date
+        Exception: If the FST cannot transliterate the input
+    """
+    return transliterate_batch_spans([sinlish_text], verbose, spell_check, engine,
+                                     spell_checker)[0]
+
+
+def transliterate_batch(texts: List[str], verbose: bool = False, spell_check: bool = True,
+                        engine: str = DEFAULT_ENGINE,
+                        spell_checker: str = DEFAULT_SPELL_CHECKER) -> List[str]:
+    """
+    Transliterate many Singlish sentences at once.
+    
+    Gives the same output as calling transliterate() on each sentence, but
+    duplicate sentences are processed once, and every distinct token across
+    the whole batch is sent to the engine once. Each sentence keeps its own
+    punctuation/number metadata for postprocessing.
+    
+    Args:
+        texts: List of Singlish sentences
+        verbose: If True, print preprocessing warnings and corrections
+        spell_check: If True, attempt to correct spelling mistakes
+        engine: Transliteration backend, "fst" or "trie"
+        spell_checker: Spelling correction backend, "fuzzy" or "fst"
+        
+    Returns:
+        List of Sinhala strings, in the same order as texts
+        
+    Raises:
+        ValueError: If engine is not one of ENGINES, or spell_checker is not
+                    one of SPELL_CHECKERS
+        FileNotFoundError, RuntimeError: If the engine cannot be loaded, as
+                    for transliterate()
+        Exception: If any sentence cannot be transliterated
+    """
+    return [sinhala_text for sinhala_text, _ in
+            transliterate_batch_spans(texts, verbose, spell_check, engine, spell_checker)]
+
+
+def transliterate_batch_spans(texts: List[str], verbose: bool = False, spell_check: bool = True,
+                              engine: str = DEFAULT_ENGINE,
+                              spell_checker: str = DEFAULT_SPELL_CHECKER,
+                              errors: Optional[Dict[str, Exception]] = None
+                              ) -> List[Tuple[str, List[TokenSpan]]]:
+    """
+    transliterate_spans() for many sentences, as transliterate_batch() does it.
+    
+    Duplicate sentences share one list of spans.
+    
+    Args:
+        errors: Optional dict; if given, a sentence that cannot be
+                transliterated is recorded in it (sentence → the exception
+                transliterate() would raise) and gets ("", []), and the
+                rest of the batch carries on. Otherwise the first failure
+                is raised. Engine loading errors are always raised.
+    
+    Returns:
+        List of (sinhala_text, spans) tuples, in the same order as texts
+    """
+    _check_engine(engine)
+    _check_spell_checker(spell_checker)
+    if any(texts):
+        _load_handles(engine, spell_check, spell_checker)
+    
+    def fail(text: str, error: Exception):
+        wrapped = _transliteration_error(text, error)
+        if errors is None:
+            raise wrapped
+        errors[text] = wrapped
+    
+    # Step 1: Tokenize each distinct sentence once
+    prepared = {}
+    for text in dict.fromkeys(texts):
+        if not text:
+            continue
+        try:
+            prepared[text] = _prepare_spans(text, verbose, spell_check, spell_checker)
+        except Exception as e:
+            fail(text, e)
+    
+    # Step 2: Transliterate each distinct token of the batch once
+    token_results = {'': ''}
+    token_errors = {}
+    for text, (spans, _) in list(prepared.items()):
+        for span in spans:
+            token = span.corrected
+            if token not in token_results and token not in token_errors:
+                try:
+                    token_results[token] = _transliterate_token(token, engine)
+                except Exception as e:
+                    token_errors[token] = e
+            if token in token_errors:
+                fail(text, token_errors[token])
+                del prepared[text]
+                break
+            span.sinhala = token_results[token]
+    
+    # Step 3: Reassemble and postprocess each sentence with its own metadata
+    results = {}
+    for text, (spans, metadata) in prepared.items():
+        try:
+            results[text] = (_join_spans(spans, metadata), spans)
+        except Exception as e:
+            fail(text, e)
+    
+    return [results.get(text, ("", [])) for text in texts]
 
 
 # For testing/debugging
@@ -10,12 +10,61 @@ input text before FST transliteration. It handles:
 - Punctuation preservation
 - Number handling
 - Input validation
+
+preprocess() does normalization, punctuation and number extraction in one
+scan over the text (see _scan()); the step functions below are kept for
+callers that use them on their own and give the same results.
 """
 
 import re
 import string
 from unidecode import unidecode
 
+from records import Record, TokenSpan
+
+# Characters validate_input() accepts (after lowercasing)
+SUPPORTED_CHARS = frozenset(string.ascii_lowercase + string.digits +
+                            string.whitespace + string.punctuation)
+
+# Whitespace-delimited chunks, one per token of the preprocessed text
+_CHUNK_PATTERN = re.compile(r'\S+')
+
+# Deletes every ASCII character validate_input() accepts, uppercase
+# included: what an ASCII string keeps under str.translate() is unsupported
+_DELETE_SUPPORTED_ASCII = str.maketrans('', '', string.ascii_letters + string.digits +
+                                        string.whitespace + string.punctuation)
+
+# One token per run of whitespace, punctuation, digits or words; a word run
+# takes in single spaces between words, which normalization leaves alone
+_PUNCTUATION_CLASS = re.escape(string.punctuation)
+_PUNCTUATION_AND_DIGITS = string.punctuation + string.digits
+_TOKEN_PATTERN = re.compile(
+    r'(\s+)|([{p}]+)|([0-9]+)|([^\s0-9{p}]+(?: [^\s0-9{p}]+)*)'.format(p=_PUNCTUATION_CLASS)
+)
+
+class PreprocessMetadata(Record):
+    """
+    What preprocess() removed from the text, for postprocess() to restore.
+    
+    Reads like the dict preprocess() used to return; spell_corrections is
+    only present once Module 1's spell checker has set it.
+    """
+    
+    _fields = ('punctuation_map', 'number_map', 'original_text', 'ascii_converted',
+               'warnings', 'spell_corrections')
+    __slots__ = _fields
+    _optional = ('spell_corrections',)
+    
+    def __init__(self, punctuation_map, number_map, original_text, ascii_converted,
+                 warnings, spell_corrections=None):
+        self.punctuation_map = punctuation_map
+        self.number_map = number_map
+        self.original_text = original_text
+        self.ascii_converted = ascii_converted
+        self.warnings = warnings
+        self.spell_corrections = spell_corrections
+
+
 def unicode_to_ascii(text):
     """
     Convert Unicode characters to their closest ASCII representation.
@@ -100,6 +149,73 @@ def separate_punctuation(text):
     return clean_text, punctuation_map
 
 
+def _in_order(position_map, single_chars=False):
+    """
+    Check that a position map can be restored with _merge_positions().
+    
+    Maps from preprocess() always can: positions are non-negative and never
+    decrease, and punctuation entries are single characters.
+    """
+    previous = 0
+    for pos, item in position_map:
+        if pos < previous or (single_chars and len(item) != 1):
+            return False
+        previous = pos
+    return True
+
+
+def _merge_positions(text, position_map):
+    """
+    Insert strings into text at stored positions in one linear pass.
+    
+    Gives the same result as inserting them one by one in reverse order,
+    appending those whose position is past the end (as restore_numbers()
+    and restore_punctuation() used to):
+    - entries within the text are merged in, in map order
+    - the rest form a tail after the text: reading backwards, entries past
+      the end of the tail built so far are appended to it, and once one
+      fits, it and all earlier ones are merged into that tail
+    
+    Args:
+        text: String to insert into
+        position_map: List of (position, string) tuples, as checked by
+                      _in_order()
+        
+    Returns:
+        String with the entries inserted
+    """
+    length = len(text)
+    parts = []
+    cursor = 0
+    beyond = []
+    for pos, item in position_map:
+        if pos <= length:
+            parts.append(text[cursor:pos])
+            parts.append(item)
+            cursor = pos
+        else:
+            beyond.append((pos - length, item))
+    parts.append(text[cursor:])
+    
+    if beyond:
+        appended = []
+        tail_length = 0
+        count = len(beyond)
+        while count and beyond[count - 1][0] > tail_length:
+            count -= 1
+            appended.append(beyond[count][1])
+            tail_length += len(beyond[count][1])
+        tail = ''.join(appended)
+        cursor = 0
+        for pos, item in beyond[:count]:
+            parts.append(tail[cursor:pos])
+            parts.append(item)
+            cursor = pos
+        parts.append(tail[cursor:])
+    
+    return ''.join(parts)
+
+
 def restore_punctuation(text, punctuation_map):
     """
     Restore punctuation to text based on stored positions.
@@ -114,6 +230,9 @@ def restore_punctuation(text, punctuation_map):
     if not punctuation_map:
         return text
     
+    if _in_order(punctuation_map, single_chars=True):
+        return _merge_positions(text, punctuation_map)
+    
     result = list(text)
     
     # Insert punctuation at stored positions (in reverse to maintain positions)
@@ -173,6 +292,9 @@ def restore_numbers(text, number_map):
     if not number_map:
         return text
     
+    if _in_order(number_map):
+        return _merge_positions(text, number_map)
+    
     result = list(text)
     
     # Insert numbers at stored positions (in reverse to maintain positions)
@@ -202,22 +324,90 @@ def validate_input(text):
     if not text:
         return False, "Empty input"
     
-    # Define supported characters (lowercase letters, spaces, numbers, common punctuation)
-    supported_chars = set(string.ascii_lowercase + string.digits + string.whitespace + string.punctuation)
-    
     # Check each character
     unsupported = []
     for char in text.lower():
-        if char not in supported_chars:
+        if char not in SUPPORTED_CHARS:
             if char not in unsupported:
                 unsupported.append(char)
     
     if unsupported:
-        return False, f"Unsupported characters found: {', '.join(repr(c) for c in unsupported)}"
+        return False, _unsupported_message(unsupported)
     
     return True, ""
 
 
+def _unsupported_message(unsupported):
+    """Format validate_input()'s error for characters in first-seen order."""
+    return f"Unsupported characters found: {', '.join(repr(c) for c in unsupported)}"
+
+
+def _scan(text):
+    """
+    Normalize text and extract punctuation and numbers in one pass.
+    
+    Gives the same result as normalize_text(), separate_punctuation() and
+    handle_numbers() applied in turn, for ASCII text:
+    - a whitespace run becomes one space, except at the start and end
+    - punctuation positions count the characters kept so far, digits
+      included (as separate_punctuation() sees them)
+    - number positions count the characters kept so far without digits;
+      digits separated only by punctuation form one number, since
+      handle_numbers() runs after the punctuation is gone
+    
+    Args:
+        text: ASCII input string
+        
+    Returns:
+        tuple: (clean_text, punctuation_map, number_map)
+    """
+    clean_parts = []
+    punctuation_map = []
+    number_map = []
+    clean_length = 0     # characters kept, without punctuation and digits
+    kept_length = 0      # characters kept, without punctuation
+    number_parts = []    # digit runs of the number being read
+    number_position = 0
+    started = False
+    pending_space = False
+    
+    for whitespace, punctuation, digits, word in _TOKEN_PATTERN.findall(text.lower()):
+        if whitespace:
+            # Dropped at the start; at the end nothing follows to emit it
+            pending_space = started
+            continue
+        
+        started = True
+        if pending_space:
+            if number_parts:
+                number_map.append((number_position, ''.join(number_parts)))
+                number_parts = []
+            clean_parts.append(' ')
+            clean_length += 1
+            kept_length += 1
+            pending_space = False
+        
+        if punctuation:
+            punctuation_map += [(kept_length, char) for char in punctuation]
+        elif digits:
+            if not number_parts:
+                number_position = clean_length
+            number_parts.append(digits)
+            kept_length += len(digits)
+        else:
+            if number_parts:
+                number_map.append((number_position, ''.join(number_parts)))
+                number_parts = []
+            clean_parts.append(word)
+            clean_length += len(word)
+            kept_length += len(word)
+    
+    if number_parts:
+        number_map.append((number_position, ''.join(number_parts)))
+    
+    return ''.join(clean_parts), punctuation_map, number_map
+
+
 def preprocess(text):
     """
     Main preprocessing pipeline.
@@ -229,54 +419,143 @@ def preprocess(text):
     3. Separate punctuation
     4. Handle numbers
     
+    ASCII text skips unidecode, and is validated with str.translate()
+    instead of a per-character loop. Steps 2-4 run as a single scan
+    (_scan()). If the text is still not ASCII (unidecode failed), the step
+    functions are used instead.
+    
     Args:
         text: Raw input string (may contain Unicode characters)
         
     Returns:
         tuple: (preprocessed_text, metadata)
-               metadata is a dict containing:
+               metadata is a PreprocessMetadata record (readable as a
+               dict, see to_dict()) containing:
                - punctuation_map: for restoring punctuation
                - number_map: for restoring numbers
                - original_text: the original input
                - ascii_converted: boolean indicating if Unicode was converted
                - warnings: list of warning messages
     """
+    text, metadata, _ = _preprocess(text)
+    return text, metadata
+
+
+def _preprocess(text):
+    """
+    preprocess(), also returning the ASCII text the scan ran over.
+    
+    Returns:
+        tuple: (preprocessed_text, metadata, ascii_text)
+    """
     warnings = []
     
     # Store original
     original_text = text
     
-    # Step 0: Convert Unicode to ASCII
-    ascii_text = unicode_to_ascii(text)
-    ascii_converted = (ascii_text != text)
-    if ascii_converted:
-        warnings.append(f"Unicode characters detected and converted to ASCII")
-    text = ascii_text
+    # Step 0: Convert Unicode to ASCII (unidecode leaves ASCII text unchanged)
+    if isinstance(text, str) and text.isascii():
+        ascii_converted = False
+        ascii_text = text
+    else:
+        ascii_text = unicode_to_ascii(text)
+        ascii_converted = (ascii_text != text)
+        if ascii_converted:
+            warnings.append(f"Unicode characters detected and converted to ASCII")
+        text = ascii_text
     
     # Validate
-    is_valid, error_msg = validate_input(text)
-    if not is_valid:
-        warnings.append(f"Validation warning: {error_msg}")
+    if not text:
+        warnings.append("Validation warning: Empty input")
+    elif text.isascii():
+        unsupported = text.translate(_DELETE_SUPPORTED_ASCII)
+        if unsupported:
+            warnings.append(f"Validation warning: {_unsupported_message(dict.fromkeys(unsupported))}")
+    else:
+        is_valid, error_msg = validate_input(text)
+        if not is_valid:
+            warnings.append(f"Validation warning: {error_msg}")
+    
+    if text.isascii():
+        # Normalize, separate punctuation and handle numbers in one pass
+        text, punctuation_map, number_map = _scan(text)
+    else:
+        text = normalize_text(text)
+        text, punctuation_map = separate_punctuation(text)
+        text, number_map = handle_numbers(text)
     
-    # Normalize
-    text = normalize_text(text)
+    # Create metadata
+    metadata = PreprocessMetadata(punctuation_map, number_map, original_text,
+                                  ascii_converted, warnings)
     
-    # Separate punctuation
-    text, punctuation_map = separate_punctuation(text)
+    return text, metadata, ascii_text
+
+
+def _source_offsets(original_text, ascii_text):
+    """
+    Map each character of unidecode's output back to the input character it came from.
     
-    # Handle numbers
-    text, number_map = handle_numbers(text)
+    Returns:
+        List with the input index of every ascii_text character, or None if
+        converting character by character does not give ascii_text
+    """
+    pieces = []
+    offsets = []
+    try:
+        for index, char in enumerate(original_text):
+            piece = unidecode(char)
+            pieces.append(piece)
+            offsets.extend([index] * len(piece))
+    except Exception:
+        return None
+    if ''.join(pieces) != ascii_text:
+        return None
+    return offsets
+
+
+def preprocess_spans(text):
+    """
+    Preprocess text and split it into token spans in the same pass.
     
-    # Create metadata
-    metadata = {
-        'punctuation_map': punctuation_map,
-        'number_map': number_map,
-        'original_text': original_text,
-        'ascii_converted': ascii_converted,
-        'warnings': warnings
-    }
+    Each whitespace-delimited chunk of the input becomes one TokenSpan, in
+    order, so ' '.join(span.text for span in spans) is the preprocessed text
+    (a chunk of only punctuation and digits gives an empty span, as it
+    leaves an empty token there). start/end cover the chunk without its
+    leading and trailing punctuation and digits, as offsets into the
+    original input; they are None if unidecode did not give ASCII.
     
-    return text, metadata
+    Args:
+        text: Raw input string (may contain Unicode characters)
+        
+    Returns:
+        tuple: (spans, metadata), metadata as from preprocess()
+    """
+    preprocessed_text, metadata, ascii_text = _preprocess(text)
+    if not ascii_text:
+        return [], metadata
+    
+    words = preprocessed_text.split(' ')
+    if not ascii_text.isascii():
+        return [TokenSpan(None, None, word) for word in words], metadata
+    
+    offsets = None
+    if ascii_text is not text:
+        offsets = _source_offsets(text, ascii_text)
+    
+    spans = []
+    for match, word in zip(_CHUNK_PATTERN.finditer(ascii_text), words):
+        start, end = match.span()
+        if word:
+            chunk = match.group()
+            start += len(chunk) - len(chunk.lstrip(_PUNCTUATION_AND_DIGITS))
+            end -= len(chunk) - len(chunk.rstrip(_PUNCTUATION_AND_DIGITS))
+        if offsets is not None:
+            start, end = offsets[start], offsets[end - 1] + 1
+        elif ascii_text is not text:
+            start = end = None
+        spans.append(TokenSpan(start, end, word))
+    
+    return spans, metadata
 
 
 def postprocess(text, metadata):
@@ -285,7 +564,7 @@ def postprocess(text, metadata):
     
     Args:
         text: Transliterated string
-        metadata: Dictionary from preprocess() containing maps
+        metadata: PreprocessMetadata (or dict) from preprocess() containing maps
         
     Returns:
         Final text with punctuation and numbers restored
@@ -0,0 +1,104 @@
+"""
+Module 1: Result Records
+Student 1
+
+Bulk jobs used to build a fresh dict for every sentence's preprocessing
+metadata and pipeline result. Record subclasses keep their fields in
+__slots__ instead, which takes a fraction of the memory of a dict, and can
+still be read like the dicts they replace (record['warnings'],
+record.get('error'), 'parse' in record, record == {...}), so existing callers
+keep working. to_dict() gives the old plain dict, e.g. for JSON output.
+
+TokenSpan is the record for one input token: where it sits in the original
+text and what each module made of it, so results can be aligned with the
+input without re-tokenizing.
+
+Usage:
+    class Result(Record):
+        _fields = ('text', 'note')
+        __slots__ = _fields
+        _optional = ('note',)
+
+        def __init__(self, text, note=None):
+            self.text = text
+            self.note = note
+
+    Result("mama").to_dict()   # {'text': 'mama'}
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Optional
+
+
+class Record(Mapping):
+    """
+    Slotted record with read-only dict-style access to its fields.
+
+    The keys are the names in the subclass's _fields, in order; __slots__
+    may hold further attributes that are not part of the dict view. Fields
+    listed in _optional are left out while they are None, like keys the old
+    dicts only had some of the time.
+    """
+
+    __slots__ = ()
+    _fields = ()
+    _optional = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            value = getattr(self, key)
+            if value is not None or key not in self._optional:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        for field in self._fields:
+            if field not in self._optional or getattr(self, field) is not None:
+                yield field
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{field}={getattr(self, field)!r}" for field in self)
+        return f"{type(self).__name__}({fields})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the record as a plain dict.
+
+        Nested values with a to_dict() method (such as Module 2's parse
+        result) are converted as well.
+        """
+        result = {}
+        for field in self:
+            value = getattr(self, field)
+            result[field] = value.to_dict() if hasattr(value, 'to_dict') else value
+        return result
+
+
+class TokenSpan(Record):
+    """
+    One whitespace-delimited token of the input, followed through the pipeline.
+
+    Fields:
+        start, end: Offsets of the token's letters in the original input
+                    (input[start:end]), or None if unidecode could not map
+                    the input to ASCII
+        text:       Normalized token, as in the preprocessed text (empty for
+                    a token of only punctuation and digits)
+        corrected:  Token after spell checking (text if unchanged)
+        sinhala:    Module 1 transliteration of corrected
+        entry:      Module 2 lexicon entry the parse used from sinhala, if any
+    """
+
+    _fields = ('start', 'end', 'text', 'corrected', 'sinhala', 'entry')
+    __slots__ = _fields
+
+    def __init__(self, start: Optional[int], end: Optional[int], text: str):
+        self.start = start
+        self.end = end
+        self.text = text
+        self.corrected = text
+        self.sinhala = None
+        self.entry = None
@@ -21,7 +21,9 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from module1 import transliterate
+    from module1 import (transliterate, transliterate_batch, PYNINI_AVAILABLE,
+                         configure_cache, cache_stats, clear_cache)
+    from token_cache import TokenCache, DEFAULT_CACHE_SIZE
 except FileNotFoundError as e:
     print("Error: transliterate.fst not found!")
     print("Please run 'python build_fst.py' first to compile the FST.")
@@ -31,6 +33,33 @@ except Exception as e:
     print(f"Error importing module1: {e}")
     sys.exit(1)
 
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'corpus.json')
+
+
+def load_corpus():
+    """Load the test corpus (data/corpus.json) as a list of items."""
+    with open(CORPUS_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def check(results, condition, test_name, details=""):
+    """
+    Print a PASS/FAIL line for one named check and record it.
+    
+    Args:
+        results: List the outcome (True/False) is appended to
+        condition: Whether the check passed
+        test_name: Description printed after PASS/FAIL
+        details: Extra line printed on failure
+    """
+    if condition:
+        print(f"✓ PASS: {test_name}")
+    else:
+        print(f"✗ FAIL: {test_name}")
+        if details:
+            print(f"  {details}")
+    results.append(bool(condition))
+
 def test_unicode():
     """Test Unicode to ASCII conversion capabilities."""
     
@@ -208,19 +237,793 @@ def test_preprocessing():
     return fail_count == 0
 
 
+def test_engine_parity():
+    """Test that the trie engine gives the same output as the FST engine."""
+    
+    print(f"Testing Trie/FST Engine Parity")
+    print(f"=" * 60)
+    print()
+    
+    corpus = load_corpus()
+    
+    # Without pynini the corpus references (produced by the FST) stand in
+    # for live FST output
+    if not PYNINI_AVAILABLE:
+        print("pynini not installed: comparing trie output to corpus references\n")
+    
+    pass_count = 0
+    fail_count = 0
+    
+    for item in corpus:
+        test_id = item.get('id', '?')
+        sinlish = item['sinlish']
+        
+        try:
+            if PYNINI_AVAILABLE:
+                expected = transliterate(sinlish, engine="fst")
+            else:
+                expected = item['sinhala']
+            actual = transliterate(sinlish, engine="trie")
+            
+            if actual == expected:
+                pass_count += 1
+            else:
+                print(f"✗ FAIL [ID {test_id}]: {sinlish}")
+                print(f"  FST:  {repr(expected)}")
+                print(f"  Trie: {repr(actual)}")
+                fail_count += 1
+        except Exception as e:
+            print(f"✗ ERROR [ID {test_id}]: {sinlish}")
+            print(f"  Error: {e}")
+            fail_count += 1
+    
+    # Random sequences of rules, where the longest match at some position
+    # can leave a remainder no rule starts (e.g. "isco")
+    random_failures = 0
+    if PYNINI_AVAILABLE:
+        import random
+        from trie_engine import load_rules
+        rng = random.Random(0)
+        keys = sorted(key for key in load_rules() if ' ' not in key)
+        words = ["isco"] + [''.join(rng.choice(keys) for _ in range(rng.randint(1, 4)))
+                            for _ in range(5000)]
+        for word in words:
+            expected = transliterate(word, spell_check=False, engine="fst")
+            try:
+                actual = transliterate(word, spell_check=False, engine="trie")
+            except Exception as e:
+                actual = f"error: {e}"
+            if actual != expected:
+                if random_failures < 5:
+                    print(f"✗ FAIL: {word!r}: FST {expected!r}, trie {actual!r}")
+                random_failures += 1
+        if random_failures == 0:
+            print(f"✓ PASS: {len(words)} random rule sequences")
+        print()
+    
+    # Print summary
+    print("=" * 60)
+    print(f"Engine Parity Results")
+    print(f"=" * 60)
+    print(f"Total tests: {len(corpus)}")
+    print(f"Passed:      {pass_count} ({pass_count/len(corpus)*100:.1f}%)")
+    print(f"Failed:      {fail_count} ({fail_count/len(corpus)*100:.1f}%)")
+    if PYNINI_AVAILABLE:
+        print(f"Random rule sequences failed: {random_failures}")
+    print()
+    
+    return fail_count == 0 and random_failures == 0
+
+
+def test_token_cache():
+    """Test that cached transliteration matches uncached output and evicts correctly."""
+    
+    print(f"Testing Token Cache")
+    print(f"=" * 60)
+    print()
+    
+    sentences = [item['sinlish'] for item in load_corpus()]
+    
+    results = []
+    
+    # Uncached reference output
+    configure_cache(0)
+    expected = [transliterate(s) for s in sentences]
+    
+    # Cold and warm passes through the cache
+    configure_cache(DEFAULT_CACHE_SIZE)
+    clear_cache()
+    cold = [transliterate(s) for s in sentences]
+    warm = [transliterate(s) for s in sentences]
+    stats = [engine_stats for engine_stats in cache_stats().values()
+             if engine_stats['hits'] or engine_stats['misses']]
+    
+    check(results, cold == expected, "Cold cache matches uncached output")
+    check(results, warm == expected, "Warm cache matches uncached output")
+    check(results, len(stats) == 1 and stats[0]['misses'] == stats[0]['size'],
+                   "Each distinct token is sent to the engine once", f"Stats: {stats}")
+    
+    # Without the cache long inputs still go through the engine word by word
+    import module1
+    from preprocess import preprocess, postprocess
+    paragraph = ' '.join(sentences) * 5
+    preprocessed_text, metadata = preprocess(paragraph)
+    configure_cache(0)
+    check(results, transliterate(paragraph, spell_check=False)
+                   == postprocess(module1._ENGINE_FUNCTIONS[module1.DEFAULT_ENGINE](preprocessed_text), metadata),
+                   "Uncached long input matches the whole-string engine output")
+    configure_cache(DEFAULT_CACHE_SIZE)
+    
+    # LRU eviction
+    cache = TokenCache(max_size=2)
+    cache.put("mama", "මම")
+    cache.put("oya", "ඔය")
+    cache.get("mama")
+    cache.put("yanawa", "යනවා")
+    check(results, cache.get("oya") is None and cache.get("mama") == "මම",
+                   "Least recently used token is evicted")
+    check(results, cache.stats()['evictions'] == 1, "Evictions are counted", f"Stats: {cache.stats()}")
+    
+    print()
+    print("=" * 60)
+    print(f"Token Cache Test Results")
+    print(f"=" * 60)
+    print(f"Passed:      {results.count(True)}")
+    print(f"Failed:      {results.count(False)}")
+    print()
+    
+    return all(results)
+
+
+def test_transliterate_batch():
+    """Test that batch transliteration matches per-sentence transliteration."""
+    
+    print(f"Testing Batch Transliteration")
+    print(f"=" * 60)
+    print()
+    
+    sentences = [item['sinlish'] for item in load_corpus()]
+    
+    # Duplicates, empty input and sentences with punctuation/numbers
+    sentences = sentences + sentences[:10] + [
+        "", "Mama gedra yanawa!", "eyala 5 potha kiyawanawa", "OYA bath kanawa?"
+    ]
+    
+    expected = [transliterate(s) for s in sentences]
+    actual = transliterate_batch(sentences)
+    
+    mismatches = [(s, e, a) for s, e, a in zip(sentences, expected, actual) if e != a]
+    for sentence, exp, act in mismatches:
+        print(f"✗ FAIL: {repr(sentence)}")
+        print(f"  Expected: {repr(exp)}")
+        print(f"  Got:      {repr(act)}")
+    
+    passed = len(actual) == len(sentences) and not mismatches
+    if passed:
+        print(f"✓ PASS: {len(sentences)} sentences match per-sentence output")
+    print()
+    
+    return passed
+
+
+def test_fst_manifest():
+    """Test that the FST build manifest detects rule changes."""
+    import tempfile
+    import build_fst
+    
+    print(f"Testing FST Build Manifest")
+    print(f"=" * 60)
+    print()
+    
+    results = []
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        rules = os.path.join(tmp, 'singlish_rules.json')
+        fst = os.path.join(tmp, 'transliterate.fst')
+        manifest = fst + '.manifest.json'
+        paths = dict(rules_path=rules, fst_path=fst, manifest_path=manifest)
+        
+        with open(rules, 'w', encoding='utf-8') as f:
+            json.dump({"mama": "මම"}, f)
+        check(results, build_fst.stale_reason(**paths) is not None, "Missing FST is stale")
+        
+        with open(fst, 'wb') as f:
+            f.write(b"fst bytes")
+        check(results, build_fst.stale_reason(**paths) is not None, "FST without manifest is stale")
+        
+        # Manifest as written by build_fst()
+        data = build_fst.expected_manifest(rules)
+        data['fst_sha256'] = build_fst.file_sha256(fst)
+        with open(manifest, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        reason = build_fst.stale_reason(**paths)
+        check(results, reason is None, "Matching manifest is up to date", f"Reason: {reason}")
+        
+        with open(rules, 'w', encoding='utf-8') as f:
+            json.dump({"mama": "මම", "oya": "ඔය"}, f)
+        check(results, build_fst.stale_reason(**paths) is not None, "Edited rules make the FST stale")
+    
+    # A clean checkout must load without rebuilding
+    reason = build_fst.stale_reason()
+    check(results, reason is None, "Shipped FST matches its manifest", f"Reason: {reason}")
+    
+    # Load errors reach the caller as they are, not as a failed transliteration
+    if PYNINI_AVAILABLE:
+        import module1
+        saved = (module1.fst_path, module1.STALE_FST_POLICY, module1._ENGINE_HANDLES["fst"])
+        with tempfile.TemporaryDirectory() as tmp:
+            module1.fst_path = os.path.join(tmp, 'transliterate.fst')
+            module1.STALE_FST_POLICY = "error"
+            try:
+                for description, error_type in (("Missing FST", FileNotFoundError),
+                                                ("Out-of-date FST", RuntimeError)):
+                    module1._ENGINE_HANDLES["fst"] = module1._LazyResource(module1._load_fst)
+                    try:
+                        transliterate("mama", engine="fst")
+                        error = None
+                    except Exception as e:
+                        error = e
+                    check(results, type(error) is error_type and "Failed to transliterate" not in str(error),
+                          f"{description} raises {error_type.__name__} unwrapped", f"Got: {error!r}")
+                    with open(module1.fst_path, 'wb') as f:
+                        f.write(b"fst bytes")
+            finally:
+                module1.fst_path, module1.STALE_FST_POLICY, module1._ENGINE_HANDLES["fst"] = saved
+    
+    print()
+    print("=" * 60)
+    print(f"FST Manifest Test Results")
+    print(f"=" * 60)
+    print(f"Passed:      {results.count(True)}")
+    print(f"Failed:      {results.count(False)}")
+    print()
+    
+    return all(results)
+
+
+def test_fuzzy_index_parity():
+    """Test that every FuzzyMatcher index gives the same corrections as the length scan."""
+    from fuzzy_matcher import FuzzyMatcher, INDEX_TYPES, find_closest_match, similarity_score
+    from fuzzy_vector import VectorScorer, NUMPY_AVAILABLE
+    
+    print(f"Testing Fuzzy Index Parity")
+    print(f"=" * 60)
+    print()
+    
+    corpus = load_corpus()
+    
+    # Corpus words, the spell check typos, and words with no close match
+    words = sorted({word for item in corpus for word in item['sinlish'].lower().split()})
+    words += ["gedra", "gedar", "kiyawanwa", "baht", "iskol", "bonwa", "telavision",
+              "computr", "restaurantss", "xyzzyq", "televisionsets", "ab"]
+    
+    reference = FuzzyMatcher(min_word_length=3, min_similarity=0.65, vectorized=False)
+    expected = [(reference.find_correction(word), reference.suggest(word, 5)) for word in words]
+    
+    all_passed = True
+    for index in INDEX_TYPES:
+        if index == "automaton" and not PYNINI_AVAILABLE:
+            print("pynini not installed: skipping index=automaton")
+            continue
+        matcher = FuzzyMatcher(min_word_length=3, min_similarity=0.65, index=index)
+        actual = [(matcher.find_correction(word), matcher.suggest(word, 5)) for word in words]
+        mismatches = [(w, e, a) for w, e, a in zip(words, expected, actual) if e != a]
+        
+        if mismatches:
+            all_passed = False
+            print(f"✗ FAIL: index={index}")
+            for word, exp, act in mismatches[:5]:
+                print(f"  {word}: expected {exp}, got {act}")
+        else:
+            print(f"✓ PASS: index={index} ({len(words)} words)")
+            stats = matcher.index_stats()
+            if 'pruned_rate' in stats:
+                print(f"         pruned {stats['pruned_rate']:.0%} of length candidates")
+            if stats.get('fallbacks'):
+                all_passed = False
+                print(f"✗ FAIL: index={index} fell back to the length scan "
+                      f"{stats['fallbacks']} of {stats['searches']} times")
+    
+    # Indexes match lowercased words like the scan, and return the
+    # vocabulary's own spelling of each match
+    mixed_vocabulary = ["Gedara", "yanawa", "Mama", "mama", "MAMA", "gedara", "Kiyawanawa",
+                        "potha", "Potha", "potha", "Iskole", "iskoleta"]
+    mixed_words = ["mama", "Mama", "gedra", "GEDRA", "kiyawanwa", "poth", "Potha", "yanwa",
+                   "iskol", "ISKOLETA"]
+    reference = FuzzyMatcher(min_word_length=3, min_similarity=0.6, vocabulary=mixed_vocabulary,
+                             vectorized=False)
+    expected = [(reference.find_correction(word), reference.suggest(word, 5))
+                for word in mixed_words]
+    for index in INDEX_TYPES:
+        if index == "length" or (index == "automaton" and not PYNINI_AVAILABLE):
+            continue
+        matcher = FuzzyMatcher(min_word_length=3, min_similarity=0.6, index=index,
+                               vocabulary=mixed_vocabulary)
+        actual = [(matcher.find_correction(word), matcher.suggest(word, 5))
+                  for word in mixed_words]
+        mismatches = [(w, e, a) for w, e, a in zip(mixed_words, expected, actual) if e != a]
+        if mismatches:
+            all_passed = False
+            print(f"✗ FAIL: index={index} on a mixed-case vocabulary")
+            for word, exp, act in mismatches[:5]:
+                print(f"  {word}: expected {exp}, got {act}")
+        else:
+            print(f"✓ PASS: index={index} on a mixed-case vocabulary ({len(mixed_words)} words)")
+    
+    # Heap-based top-k must match scoring and sorting every candidate
+    mismatches = []
+    for word in words:
+        scored = [(c, similarity_score(word, c)) for c in reference.vocabulary]
+        scored = [(c, score) for c, score in scored if score >= 0.5]
+        scored.sort(key=lambda x: x[1], reverse=True)
+        actual_top = find_closest_match(word, reference.vocabulary, 0.5, max_results=5)
+        if actual_top != scored[:5]:
+            mismatches.append((word, scored[:5], actual_top))
+    if mismatches:
+        all_passed = False
+        print(f"✗ FAIL: find_closest_match top-5")
+        for word, exp, act in mismatches[:5]:
+            print(f"  {word}: expected {exp}, got {act}")
+    else:
+        print(f"✓ PASS: find_closest_match top-5 ({len(words)} words)")
+    
+    # The NumPy scorer must return the same top-k as find_closest_match
+    if NUMPY_AVAILABLE:
+        scorer = VectorScorer(reference.vocabulary, reference.word_by_length)
+        mismatches = []
+        for word in words:
+            candidates = []
+            for length in range(max(1, len(word) - 2), len(word) + 3):
+                candidates.extend(reference.word_by_length.get(length, []))
+            candidates = candidates or reference.vocabulary
+            expected_top = find_closest_match(word, candidates, 0.65, max_results=5)
+            actual_top = scorer.closest(word, 0.65, max_results=5)
+            if expected_top != actual_top:
+                mismatches.append((word, expected_top, actual_top))
+        
+        if mismatches:
+            all_passed = False
+            print(f"✗ FAIL: vectorized top-5")
+            for word, exp, act in mismatches[:5]:
+                print(f"  {word}: expected {exp}, got {act}")
+        else:
+            print(f"✓ PASS: vectorized top-5 ({len(words)} words)")
+    else:
+        print("numpy not installed: skipping vectorized scorer test")
+    
+    print()
+    return all_passed
+
+
+def test_spell_check_cache():
+    """Test that correct_text's fast paths and caches never change its output."""
+    from fuzzy_matcher import FuzzyMatcher
+    
+    print(f"Testing Spell Check Fast Paths")
+    print(f"=" * 60)
+    print()
+    
+    texts = [item['sinlish'] for item in load_corpus()]
+    texts += ["mama gedra yanawa", "oya baht kanawa", "xyzzyq GEDARA gedara", "xyzzyq"]
+    
+    matcher = FuzzyMatcher(min_word_length=3, min_similarity=0.65, cache_size=100)
+    all_passed = True
+    
+    # Reference: score every token, as correct_text did before the fast paths
+    expected = []
+    for text in texts:
+        words = []
+        for word in text.split():
+            result = matcher.find_correction(word)
+            words.append(result[0] if result else word)
+        expected.append(' '.join(words))
+    
+    # Twice, so the second pass is served from the caches
+    for run in ("first pass", "second pass"):
+        actual = [matcher.correct_text(text)[0] for text in texts]
+        mismatches = [(t, e, a) for t, e, a in zip(texts, expected, actual) if e != a]
+        if mismatches:
+            all_passed = False
+            print(f"✗ FAIL: {run}")
+            for text, exp, act in mismatches[:5]:
+                print(f"  {text!r}: expected {exp!r}, got {act!r}")
+        else:
+            print(f"✓ PASS: {run} ({len(texts)} texts)")
+    
+    stats = matcher.cache_stats()
+    if stats['no_match_hits'] > 0 and stats['exact_hits'] > 0:
+        print(f"✓ PASS: caches used ({stats['short_circuit_rate']:.0%} of tokens not scored)")
+    else:
+        all_passed = False
+        print(f"✗ FAIL: caches unused: {stats}")
+    
+    print()
+    return all_passed
+
+
+def test_correction_store():
+    """Test that stored corrections are reused across matchers and invalidated with the vocabulary."""
+    import tempfile
+    from fuzzy_matcher import FuzzyMatcher, load_vocabulary
+    
+    print(f"Testing Persistent Correction Store")
+    print(f"=" * 60)
+    print()
+    
+    words = ["gedra", "gedar", "kiyawanwa", "baht", "iskol", "bonwa", "telavision",
+             "computr", "xyzzyq", "gedara"]
+    all_passed = True
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        store_path = os.path.join(tmp, "corrections.sqlite3")
+        expected = [FuzzyMatcher(min_similarity=0.65).find_correction(w) for w in words]
+        
+        # First "process" computes and writes, the second only reads
+        writer = FuzzyMatcher(min_similarity=0.65, store_path=store_path)
+        first = [writer.find_correction(w) for w in words]
+        writer.flush()
+        reader = FuzzyMatcher(min_similarity=0.65, store_path=store_path)
+        second = [reader.find_correction(w) for w in words]
+        stats = reader._store.stats()
+        
+        if first == expected and second == expected and stats['hits'] == len(words):
+            print(f"✓ PASS: corrections reused by a second matcher ({stats['hits']} hits)")
+        else:
+            all_passed = False
+            print(f"✗ FAIL: stored corrections differ or were not reused")
+            print(f"  Expected: {expected}")
+            print(f"  Got:      {second} ({stats})")
+        
+        # A different vocabulary must not see the old rows
+        vocabulary = [w for w in load_vocabulary() if w != "gedara"]
+        changed = FuzzyMatcher(min_similarity=0.65, vocabulary=vocabulary, store_path=store_path)
+        result = changed.find_correction("gedra")
+        if changed._store.stats()['hits'] == 0 and (result is None or result[0] != "gedara"):
+            print(f"✓ PASS: vocabulary change invalidates stored corrections")
+        else:
+            all_passed = False
+            print(f"✗ FAIL: stale correction served after vocabulary change: {result}")
+        
+        # ... and must not delete them either
+        changed.flush()
+        again = FuzzyMatcher(min_similarity=0.65, store_path=store_path)
+        [again.find_correction(w) for w in words]
+        if again._store.stats()['hits'] == len(words):
+            print(f"✓ PASS: vocabularies sharing a store keep each other's rows")
+        else:
+            all_passed = False
+            print(f"✗ FAIL: rows lost after another vocabulary opened the store: "
+                  f"{again._store.stats()}")
+        
+        # A store used before fork gets its own connection in the child,
+        # and the child's flush() reaches the file
+        if hasattr(os, 'fork'):
+            import multiprocessing
+            
+            def child():
+                writer.find_correction("bonwwa")
+                writer.flush()
+            
+            process = multiprocessing.get_context('fork').Process(target=child)
+            process.start()
+            process.join()
+            found, _ = reader._store.get("bonwwa", 0.65)
+            if process.exitcode == 0 and found:
+                print(f"✓ PASS: forked worker writes through its own connection")
+            else:
+                all_passed = False
+                print(f"✗ FAIL: forked worker's correction was not stored "
+                      f"(exit code {process.exitcode})")
+        
+        for matcher in (writer, reader, changed, again):
+            matcher._store.close()
+    
+    print()
+    return all_passed
+
+
+def test_fst_spell_checker():
+    """Test that the FST spell checker agrees with FuzzyMatcher."""
+    from fuzzy_matcher import FuzzyMatcher, SPELLING_TEST_CASES
+    
+    print(f"Testing FST Spell Checker")
+    print(f"=" * 60)
+    print()
+    
+    if not PYNINI_AVAILABLE:
+        print("pynini not installed: skipping FST spell checker tests")
+        print()
+        return True
+    
+    all_passed = True
+    
+    # The fuzzy_matcher demo cases, at the demo's threshold
+    fuzzy = FuzzyMatcher(min_similarity=0.6)
+    automaton = FuzzyMatcher(min_similarity=0.6, index="automaton")
+    for text, description in SPELLING_TEST_CASES:
+        expected = fuzzy.correct_text(text)
+        actual = automaton.correct_text(text)
+        if actual == expected:
+            print(f"✓ PASS: {description} ({actual[0]!r})")
+        else:
+            all_passed = False
+            print(f"✗ FAIL: {description}")
+            print(f"  Expected: {expected}")
+            print(f"  Got:      {actual}")
+    
+    # The same switch through module1
+    for text, _ in SPELLING_TEST_CASES:
+        expected = transliterate(text, spell_checker="fuzzy")
+        actual = transliterate(text, spell_checker="fst")
+        if actual != expected:
+            all_passed = False
+            print(f"✗ FAIL: transliterate({text!r}, spell_checker='fst')")
+            print(f"  Expected: {expected!r}")
+            print(f"  Got:      {actual!r}")
+    if all_passed:
+        print(f"✓ PASS: transliterate(spell_checker='fst') matches 'fuzzy'")
+    
+    print()
+    return all_passed
+
+
+def test_edit_distance():
+    """Test that the bounded and bit-parallel distances agree with the full Levenshtein DP."""
+    from fuzzy_matcher import (levenshtein_distance, bounded_levenshtein_distance,
+                               bit_parallel_distance, pattern_masks, load_vocabulary)
+    
+    print(f"Testing Edit Distance Kernels")
+    print(f"=" * 60)
+    print()
+    
+    vocabulary = sorted(set(load_vocabulary()))
+    queries = ["gedra", "kiyawanwa", "baht", "telavision", "computr", "", "a",
+               "restaurantss", "xyzzyq", "a" * 70 + "b"]
+    pairs = [(query, word) for query in queries for word in vocabulary + ["a" * 65]]
+    masks = {word: pattern_masks(word) for word in vocabulary}
+    
+    all_passed = True
+    for max_distance in (None, -1, 0, 1, 2, 4):
+        mismatches = []
+        for query, word in pairs:
+            distance = levenshtein_distance(query, word)
+            if max_distance is None:
+                expected = distance
+                actual = {'bit-parallel': bit_parallel_distance(query, word, masks.get(word))}
+            else:
+                expected = distance if distance <= max_distance else max_distance + 1
+                actual = {
+                    'bounded': bounded_levenshtein_distance(query, word, max_distance),
+                    'bit-parallel': bit_parallel_distance(query, word, masks.get(word), max_distance),
+                }
+            for kernel, result in actual.items():
+                if result != expected:
+                    mismatches.append((kernel, query, word, expected, result))
+        
+        if mismatches:
+            all_passed = False
+            print(f"✗ FAIL: max_distance={max_distance}")
+            for kernel, query, word, exp, act in mismatches[:5]:
+                print(f"  {kernel}: {query!r} vs {word!r}: expected {exp}, got {act}")
+        else:
+            print(f"✓ PASS: max_distance={max_distance} ({len(pairs)} pairs)")
+    
+    print()
+    return all_passed
+
+
+def test_preprocess_scanner():
+    """Test that the single-pass preprocess() matches the step-by-step pipeline."""
+    import random
+    from preprocess import (preprocess, unicode_to_ascii, validate_input, normalize_text,
+                            separate_punctuation, handle_numbers)
+    
+    print(f"Testing Single-Pass Preprocessing")
+    print(f"=" * 60)
+    print()
+    
+    def step_preprocess(text):
+        warnings = []
+        ascii_text = unicode_to_ascii(text)
+        if ascii_text != text:
+            warnings.append("Unicode characters detected and converted to ASCII")
+        is_valid, error_msg = validate_input(ascii_text)
+        if not is_valid:
+            warnings.append(f"Validation warning: {error_msg}")
+        clean, punctuation_map = separate_punctuation(normalize_text(ascii_text))
+        clean, number_map = handle_numbers(clean)
+        return clean, {'punctuation_map': punctuation_map, 'number_map': number_map,
+                       'original_text': text, 'ascii_converted': ascii_text != text,
+                       'warnings': warnings}
+    
+    cases = [
+        ("", "Empty input"),
+        ("   ", "Whitespace only"),
+        ("  Mama\tgedara \n yanawa  ", "Whitespace runs"),
+        ("eyala 5 potha, 10 kiyawanawa!", "Numbers and punctuation"),
+        ("1.5 kg, 2,000 rupiyal", "Digits joined by punctuation"),
+        ("...!? mama ?!", "Punctuation at the ends"),
+        ("mama , gedara", "Spaces around punctuation"),
+        ("abc123def 45", "Digits inside words"),
+        ("mama\x00 gedara\x1c yanawa\x7f", "Control characters"),
+        ("café naïve", "Unicode input"),
+        ("MAMA\x01 Gedara\x01\x02", "Uppercase ASCII with control characters"),
+        ("Mama gedara yanawa", "ASCII input (no unidecode)"),
+    ]
+    rng = random.Random(0)
+    alphabet = "abcXYZ  \t\n.,!?'-019\x00\x1cé"
+    cases += [(''.join(rng.choice(alphabet) for _ in range(rng.randrange(20))), "random")
+              for _ in range(2000)]
+    
+    all_passed = True
+    random_failures = 0
+    for text, description in cases:
+        expected = step_preprocess(text)
+        actual = preprocess(text)
+        if description != "random":
+            if actual == expected:
+                print(f"✓ PASS: {description} ({actual[0]!r})")
+            else:
+                all_passed = False
+                print(f"✗ FAIL: {description} ({text!r})")
+                print(f"  Expected: {expected}")
+                print(f"  Got:      {actual}")
+        elif actual != expected:
+            all_passed = False
+            random_failures += 1
+            if random_failures <= 5:
+                print(f"✗ FAIL: {text!r}")
+                print(f"  Expected: {expected}")
+                print(f"  Got:      {actual}")
+    if random_failures == 0:
+        print(f"✓ PASS: 2000 random texts")
+    
+    print()
+    return all_passed
+
+
+def test_postprocess_restore():
+    """Test that the linear restore matches inserting entries one by one."""
+    import random
+    from preprocess import restore_numbers, restore_punctuation
+    
+    print(f"Testing Postprocess Restore")
+    print(f"=" * 60)
+    print()
+    
+    def insert_restore(text, position_map, one_element):
+        result = list(text)
+        for pos, item in reversed(position_map):
+            if pos <= len(result):
+                if one_element:
+                    result.insert(pos, item)
+                else:
+                    for char in reversed(item):
+                        result.insert(pos, char)
+            elif one_element:
+                result.append(item)
+            else:
+                result.extend(item)
+        return ''.join(result)
+    
+    cases = [
+        ("මම ගෙදර යනවා", [(18, '.')], [], "Position past the end"),
+        ("ab", [(3, 'x'), (3, 'y')], [(3, '12'), (3, '7')], "Equal positions past the end"),
+        ("ab", [(1, '.'), (5, '!'), (9, '?')], [(4, '10'), (5, '2')], "Tail insert"),
+        ("abc", [(2, ','), (0, '.')], [(2, '1'), (0, '5')], "Unsorted map"),
+        ("abc", [(-1, ',')], [(-1, '5')], "Negative position"),
+        ("abc", [(1, '...')], [(1, '')], "Multi-character and empty entries"),
+    ]
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = ''.join(rng.choice('ab ') for _ in range(rng.randrange(10)))
+        positions = sorted(rng.randrange(15) for _ in range(rng.randrange(6)))
+        cases.append((text, [(pos, rng.choice('.,!?')) for pos in positions],
+                      [(pos, str(rng.randrange(500))) for pos in positions], "random"))
+    
+    all_passed = True
+    random_failures = 0
+    for text, punctuation_map, number_map, description in cases:
+        expected = (insert_restore(text, punctuation_map, True),
+                    insert_restore(text, number_map, False))
+        actual = (restore_punctuation(text, punctuation_map),
+                  restore_numbers(text, number_map))
+        if description != "random":
+            if actual == expected:
+                print(f"✓ PASS: {description} ({actual[0]!r}, {actual[1]!r})")
+            else:
+                all_passed = False
+                print(f"✗ FAIL: {description}")
+                print(f"  Expected: {expected}")
+                print(f"  Got:      {actual}")
+        elif actual != expected:
+            all_passed = False
+            random_failures += 1
+            if random_failures <= 5:
+                print(f"✗ FAIL: {text!r}, {punctuation_map}, {number_map}")
+                print(f"  Expected: {expected}")
+                print(f"  Got:      {actual}")
+    if random_failures == 0:
+        print(f"✓ PASS: 2000 random maps")
+    
+    print()
+    return all_passed
+
+
+def test_token_spans():
+    """Test that token spans line up with the input and with transliterate()."""
+    import string
+    from module1 import transliterate_spans, ENGINES
+    from preprocess import preprocess, preprocess_spans
+    
+    print(f"Testing Token Spans")
+    print(f"=" * 60)
+    print()
+    
+    all_passed = True
+    strip_table = str.maketrans('', '', string.punctuation + string.digits)
+    
+    # Offsets: each span covers the input characters its text came from
+    span_cases = [
+        ("Mama gedara yanawa!", ["Mama", "gedara", "yanawa"]),
+        ("  eyala 5 potha, (kiyawanawa)  ", ["eyala", "5", "potha", "kiyawanawa"]),
+        ("mama don't 1.5kg", ["mama", "don't", "kg"]),
+        ("café naïve", ["café", "naïve"]),
+        ("!!!", ["!!!"]),
+        ("", []),
+    ]
+    for text, expected in span_cases:
+        spans, _ = preprocess_spans(text)
+        actual = [text[span.start:span.end] for span in spans]
+        joined = ' '.join(span.text for span in spans)
+        if actual == expected and (not spans or joined == preprocess(text)[0]):
+            print(f"✓ PASS: spans of {text!r}: {actual}")
+        else:
+            all_passed = False
+            print(f"✗ FAIL: spans of {text!r}")
+            print(f"  Expected: {expected}")
+            print(f"  Got:      {actual} (joined {joined!r})")
+    
+    # Sinhala text: the same as transliterate(), including spell corrections
+    # next to numbers and punctuation
+    texts = [item['sinlish'] for item in load_corpus()]
+    texts += ["Mama gedra yanawa!", "eyala 5 potha, 10 kiyawanwa", "mama  ,  gedra", "!!! 3"]
+    engines = ENGINES if PYNINI_AVAILABLE else ("trie",)
+    for engine in engines:
+        mismatches = []
+        for text in texts:
+            sinhala_text, spans = transliterate_spans(text, engine=engine)
+            if sinhala_text != transliterate(text, engine=engine):
+                mismatches.append(text)
+            elif any(span.text and span.text != text[span.start:span.end].lower().translate(strip_table)
+                     for span in spans):
+                mismatches.append(text)
+        if mismatches:
+            all_passed = False
+            print(f"✗ FAIL: transliterate_spans(engine={engine!r}): {mismatches[:5]}")
+        else:
+            print(f"✓ PASS: transliterate_spans(engine={engine!r}) matches transliterate() "
+                  f"({len(texts)} sentences)")
+    
+    _, spans = transliterate_spans("mama gedra yanawa")
+    if [span.corrected for span in spans] == ["mama", "gedara", "yanawa"]:
+        print(f"✓ PASS: spans carry spell corrections")
+    else:
+        all_passed = False
+        print(f"✗ FAIL: spans carry spell corrections: {spans}")
+    
+    print()
+    return all_passed
+
+
 def test_module1():
     """Run tests on the transliteration module."""
     
-    # Get path to corpus.json (in data directory)
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    corpus_path = os.path.join(script_dir, '..', 'data', 'corpus.json')
-    
-    # Load corpus
+    # Load corpus (data/corpus.json)
     try:
-        with open(corpus_path, 'r', encoding='utf-8') as f:
-            corpus = json.load(f)
+        corpus = load_corpus()
     except FileNotFoundError:
-        print(f"Error: Could not find corpus.json at {corpus_path}")
+        print(f"Error: Could not find corpus.json at {CORPUS_PATH}")
         print("Please ensure corpus.json exists in the data/ directory.")
         sys.exit(1)
     except json.JSONDecodeError as e:
@@ -314,13 +1117,89 @@ if __name__ == "__main__":
     print("="*60 + "\n")
     corpus_exit_code = test_module1()
     
+    # Part 5: Engine parity tests
+    print("\n" + "="*60)
+    print("PART 5: ENGINE PARITY TESTS")
+    print("="*60 + "\n")
+    parity_passed = test_engine_parity()
+    
+    # Part 6: Token cache tests
+    print("\n" + "="*60)
+    print("PART 6: TOKEN CACHE TESTS")
+    print("="*60 + "\n")
+    cache_passed = test_token_cache()
+    
+    # Part 7: Batch transliteration tests
+    print("\n" + "="*60)
+    print("PART 7: BATCH TRANSLITERATION TESTS")
+    print("="*60 + "\n")
+    batch_passed = test_transliterate_batch()
+    
+    # Part 8: FST build manifest tests
+    print("\n" + "="*60)
+    print("PART 8: FST BUILD MANIFEST TESTS")
+    print("="*60 + "\n")
+    manifest_passed = test_fst_manifest()
+    
+    # Part 9: Fuzzy index parity tests
+    print("\n" + "="*60)
+    print("PART 9: FUZZY INDEX PARITY TESTS")
+    print("="*60 + "\n")
+    fuzzy_index_passed = test_fuzzy_index_parity()
+    
+    # Part 10: Edit distance tests
+    print("\n" + "="*60)
+    print("PART 10: EDIT DISTANCE TESTS")
+    print("="*60 + "\n")
+    distance_passed = test_edit_distance()
+    
+    # Part 11: Spell check fast path tests
+    print("\n" + "="*60)
+    print("PART 11: SPELL CHECK FAST PATH TESTS")
+    print("="*60 + "\n")
+    spell_cache_passed = test_spell_check_cache()
+    
+    # Part 12: Correction store tests
+    print("\n" + "="*60)
+    print("PART 12: CORRECTION STORE TESTS")
+    print("="*60 + "\n")
+    store_passed = test_correction_store()
+    
+    # Part 13: FST spell checker tests
+    print("\n" + "="*60)
+    print("PART 13: FST SPELL CHECKER TESTS")
+    print("="*60 + "\n")
+    fst_speller_passed = test_fst_spell_checker()
+    
+    # Part 14: Single-pass preprocessing tests
+    print("\n" + "="*60)
+    print("PART 14: SINGLE-PASS PREPROCESSING TESTS")
+    print("="*60 + "\n")
+    scanner_passed = test_preprocess_scanner()
+    
+    # Part 15: Postprocess restore tests
+    print("\n" + "="*60)
+    print("PART 15: POSTPROCESS RESTORE TESTS")
+    print("="*60 + "\n")
+    restore_passed = test_postprocess_restore()
+    
+    # Part 16: Token span tests
+    print("\n" + "="*60)
+    print("PART 16: TOKEN SPAN TESTS")
+    print("="*60 + "\n")
+    spans_passed = test_token_spans()
+    
     # Final summary
     print("\n" + "="*60)
     print("OVERALL TEST SUMMARY")
     print("="*60)
     
     all_passed = (unicode_passed and spell_check_passed and 
-                  preprocessing_passed and corpus_exit_code == 0)
+                  preprocessing_passed and corpus_exit_code == 0 and
+                  parity_passed and cache_passed and batch_passed and
+                  manifest_passed and fuzzy_index_passed and distance_passed and
+                  spell_cache_passed and store_passed and fst_speller_passed and
+                  scanner_passed and restore_passed and spans_passed)
     
     if all_passed:
         print("✅ All tests passed!")
@@ -328,6 +1207,18 @@ if __name__ == "__main__":
         print("   • Spell Checking: ✓")
         print("   • Preprocessing: ✓")
         print("   • Corpus: ✓")
+        print("   • Engine Parity: ✓")
+        print("   • Token Cache: ✓")
+        print("   • Batch Transliteration: ✓")
+        print("   • FST Build Manifest: ✓")
+        print("   • Fuzzy Index Parity: ✓")
+        print("   • Edit Distance: ✓")
+        print("   • Spell Check Fast Paths: ✓")
+        print("   • Correction Store: ✓")
+        print("   • FST Spell Checker: ✓")
+        print("   • Single-Pass Preprocessing: ✓")
+        print("   • Postprocess Restore: ✓")
+        print("   • Token Spans: ✓")
         sys.exit(0)
     else:
         print("❌ Some tests failed:")
@@ -339,4 +1230,28 @@ if __name__ == "__main__":
             print("   • Preprocessing: ✗")
         if corpus_exit_code != 0:
             print("   • Corpus: ✗")
+        if not parity_passed:
+            print("   • Engine Parity: ✗")
+        if not cache_passed:
+            print("   • Token Cache: ✗")
+        if not batch_passed:
+            print("   • Batch Transliteration: ✗")
+        if not manifest_passed:
+            print("   • FST Build Manifest: ✗")
+        if not fuzzy_index_passed:
+            print("   • Fuzzy Index Parity: ✗")
+        if not distance_passed:
+            print("   • Edit Distance: ✗")
+        if not spell_cache_passed:
+            print("   • Spell Check Fast Paths: ✗")
+        if not store_passed:
+            print("   • Correction Store: ✗")
+        if not fst_speller_passed:
+            print("   • FST Spell Checker: ✗")
+        if not scanner_passed:
+            print("   • Single-Pass Preprocessing: ✗")
+        if not restore_passed:
+            print("   • Postprocess Restore: ✗")
+        if not spans_passed:
+            print("   • Token Spans: ✗")
         sys.exit(1)
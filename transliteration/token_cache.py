@@ -0,0 +1,122 @@
+"""
+Module 1: Token Transliteration Cache
+Student 1
+
+Singlish traffic is heavily skewed towards a small set of words (mama, oya,
+yanawa, kanawa, ...). This module provides a bounded LRU cache of
+token → Sinhala results so module1 only runs the engine for unseen tokens.
+
+A cache lives as long as the engine it was filled from: module1 loads each
+engine once per process and never reloads it, so cached results always
+match the engine in use. A rebuilt FST takes effect in a new process.
+
+Usage:
+    from token_cache import TokenCache
+    cache = TokenCache(max_size=10000)
+    sinhala = cache.get("mama")
+    if sinhala is None:
+        cache.put("mama", "මම")
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+DEFAULT_CACHE_SIZE = 10000
+
+
+def file_sha256(path: str) -> str:
+    """
+    Compute the SHA-256 hex digest of a file.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(65536), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class TokenCache:
+    """
+    Thread-safe bounded LRU cache of token transliterations with hit statistics.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of tokens kept (0 disables caching)
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, token: str) -> Optional[str]:
+        """Return the cached transliteration of token, or None on a miss."""
+        with self._lock:
+            result = self._entries.get(token)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return result
+
+    def put(self, token: str, result: str):
+        """Store the transliteration of token, evicting the least recently used entry."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[token] = result
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def resize(self, max_size: int):
+        """Change the maximum size, evicting entries if the cache shrinks."""
+        with self._lock:
+            self.max_size = max_size
+            while len(self._entries) > max(max_size, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, evictions, size, max_size and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
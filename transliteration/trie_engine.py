@@ -0,0 +1,149 @@
+"""
+Module 1: Pure-Python Trie Transliteration Engine
+Student 1
+
+This module provides an alternative backend to the pynini FST. The rules from
+singlish_rules.json are compiled into a character trie and applied with a
+longest-match scan that backs up to a shorter rule when the longest one
+leaves a remainder no rule sequence covers. That is how the FST resolves
+the same input: the tests compare the two on the corpus and on random
+rule sequences.
+
+It is useful on hosts where pynini/OpenFST is not installed, and for short
+inputs where building an acceptor and running compose + shortestpath costs
+more than the transliteration itself.
+
+Usage:
+    from trie_engine import TransliterationTrie
+    trie = TransliterationTrie.from_rules_file()
+    sinhala = trie.transliterate("mama gedara yanawa")
+"""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+
+# Key used inside a trie node to hold the Sinhala output of a complete rule.
+# Rules are keyed by single characters, so a longer string can never collide.
+_OUTPUT = "$out"
+
+
+def load_rules(rules_path: Optional[str] = None) -> Dict[str, str]:
+    """
+    Load the transliteration rules from singlish_rules.json.
+
+    Args:
+        rules_path: Path to the rules file (default: data/singlish_rules.json)
+
+    Returns:
+        Dictionary mapping Singlish strings to Sinhala strings
+    """
+    if rules_path is None:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        rules_path = os.path.join(script_dir, '..', 'data', 'singlish_rules.json')
+
+    with open(rules_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class TransliterationTrie:
+    """
+    Longest-match transliterator with backtracking, backed by a character trie.
+    """
+
+    def __init__(self, rules: Dict[str, str]):
+        """
+        Compile the rules into a trie.
+
+        Args:
+            rules: Dictionary mapping Singlish strings to Sinhala strings
+        """
+        self.root: Dict[str, dict] = {}
+        self.rule_count = len(rules)
+
+        for singlish, sinhala in rules.items():
+            node = self.root
+            for char in singlish:
+                node = node.setdefault(char, {})
+            node[_OUTPUT] = sinhala
+
+    @classmethod
+    def from_rules_file(cls, rules_path: Optional[str] = None) -> "TransliterationTrie":
+        """Build a trie from singlish_rules.json (or another rules file)."""
+        return cls(load_rules(rules_path))
+
+    def _matches(self, text: str, start: int) -> List[Tuple[int, str]]:
+        """
+        Return every rule matching text at start, shortest first.
+
+        Returns:
+            List of (end, Sinhala output) tuples
+        """
+        node = self.root
+        matches = []
+        j = start
+        length = len(text)
+
+        while j < length:
+            node = node.get(text[j])
+            if node is None:
+                break
+            j += 1
+            if _OUTPUT in node:
+                matches.append((j, node[_OUTPUT]))
+
+        return matches
+
+    def transliterate(self, text: str) -> str:
+        """
+        Transliterate preprocessed Singlish text to Sinhala.
+
+        At each position the longest complete rule is taken. If that leaves
+        a remainder no sequence of rules can cover, the scan backs up and
+        tries the next shorter rule ("isco": after "is" no rule starts with
+        "c", so "i" + "sco" is used). Positions found to be dead ends are
+        remembered, so each position is expanded at most once.
+
+        Args:
+            text: Preprocessed (lowercase, punctuation/number free) text
+
+        Returns:
+            Sinhala string
+
+        Raises:
+            ValueError: If no sequence of rules covers the input
+        """
+        length = len(text)
+        output = []
+        # (start, untried shorter matches) for each rule in output
+        choices = []
+        dead = set()
+        stuck = 0
+        i = 0
+        alternatives = self._matches(text, i)
+
+        while i < length:
+            while alternatives and alternatives[-1][0] in dead:
+                alternatives.pop()
+
+            if alternatives:
+                end, match = alternatives.pop()
+                choices.append((i, alternatives))
+                output.append(match)
+                i = end
+                alternatives = self._matches(text, i)
+                continue
+
+            # No rule sequence covers text[i:]; undo the rule that led here
+            if not self._matches(text, i):
+                stuck = max(stuck, i)
+            dead.add(i)
+            if not choices:
+                raise ValueError(
+                    f"No transliteration rule matches {text[stuck]!r} at position {stuck}"
+                )
+            output.pop()
+            i, alternatives = choices.pop()
+
+        return ''.join(output)